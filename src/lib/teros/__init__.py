@@ -21,10 +21,15 @@ __version__ = "1.0.0"
 __author__ = "TEROS Development Team"
 __email__ = "teros@example.com"
 
-# Simple imports - only import what works
-try:
-    from .core.trit import Trit
-    __all__ = ['Trit']
-except ImportError as e:
-    print(f"Warning: Could not import Trit: {e}")
-    __all__ = []
+from .core.lazy_exports import lazy_exports
+
+# Exported name -> defining submodule, imported on first access so that
+# `import teros` does not pull in the core machinery
+_EXPORTS = {
+    "Trit": ".core.trit",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
+
+
+__all__ = ['Trit']
@@ -4,10 +4,22 @@ User Applications for TEROS.
 This module provides user applications for the ternary operating system.
 """
 
-from .ternary_calculator import TernaryCalculator, TernaryCalculatorApp
-from .ternary_editor import TernaryEditor
-from .ternary_file_manager import TernaryFileManager, FileInfo, FileType
-from .ternary_system_monitor import TernarySystemMonitor
+from ..core.lazy_exports import lazy_exports
+
+# Exported name -> defining submodule. Each application is imported on
+# first access, so using one app does not load the other three
+_EXPORTS = {
+    "TernaryCalculator": ".ternary_calculator",
+    "TernaryCalculatorApp": ".ternary_calculator",
+    "TernaryEditor": ".ternary_editor",
+    "TernaryFileManager": ".ternary_file_manager",
+    "FileInfo": ".ternary_file_manager",
+    "FileType": ".ternary_file_manager",
+    "TernarySystemMonitor": ".ternary_system_monitor",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
+
 
 __all__ = [
     # Calculator
@@ -4,8 +4,11 @@ Ternary Calculator - Advanced calculator for ternary arithmetic.
 This module provides a complete calculator application for ternary mathematics.
 """
 
-from typing import List, Union, Optional, Dict, Any
+from typing import List, Union, Optional, Dict, Any, Iterator, Tuple
+import re
 import sys
+from collections import OrderedDict
+from functools import lru_cache
 from ..core.trit import Trit
 from ..core.tritarray import TritArray
 from ..libs.libternary import TernaryMath, TernaryLogic
@@ -13,6 +16,110 @@ from ..libs.libmath import TernaryTrigonometry, TernaryExponentials, TernaryCons
 from ..libs.libstring import TernaryString
 
 
+# Expression tokens: number, identifier or single-character symbol
+_TOKEN = re.compile(r"\s*(?:(?P<number>\d+)|(?P<identifier>[A-Za-z_]\w*)|(?P<symbol>\S))")
+
+# Unary minus, kept on the operator stack under its own name
+_NEGATE = 'neg'
+
+# Operator precedence; unary minus binds tighter than * and / but looser
+# than ^, so -2^2 is -(2^2)
+_PRECEDENCE = {
+    '+': 1,
+    '-': 1,
+    '*': 2,
+    '/': 2,
+    _NEGATE: 3,
+    '^': 4,
+}
+
+_RIGHT_ASSOCIATIVE = frozenset({'^', _NEGATE})
+
+
+def _divide(left: TritArray, right: TritArray) -> TritArray:
+    """Integer division, keeping the quotient."""
+    quotient, remainder = TernaryMath.ternary_divide(left, right)
+    return quotient
+
+
+# Binary operator -> operation on TritArray operands
+_OPERATIONS = {
+    '+': TernaryMath.ternary_add,
+    '-': TernaryMath.ternary_subtract,
+    '*': TernaryMath.ternary_multiply,
+    '/': _divide,
+    '^': TernaryMath.ternary_power,
+}
+
+# Operators whose operands can be swapped without changing the result
+_COMMUTATIVE = frozenset({'+', '*'})
+
+
+# Named constants accepted as operands
+_CONSTANTS = {
+    'pi': TernaryConstants.PI,
+    'e': TernaryConstants.E,
+    'phi': TernaryConstants.PHI,
+}
+
+
+@lru_cache(maxsize=4096)
+def _literal_trits(literal: str) -> Tuple[int, ...]:
+    """Trits of a number or named constant (cached per literal)."""
+    constant = _CONSTANTS.get(literal)
+    if constant is not None:
+        return tuple(constant._trits)
+    
+    try:
+        value = int(literal)
+    except ValueError:
+        raise ValueError(f"Invalid operand: {literal}")
+    return tuple(TritArray.from_decimal(value, 8)._trits)
+
+
+def _literal_to_tritarray(literal: str) -> TritArray:
+    """
+    Convert a number or named constant to TritArray.
+    
+    TritArrays are mutable, so only the trits are cached and every call
+    gets its own array.
+    """
+    return TritArray._wrap(list(_literal_trits(literal)))
+
+
+def _tokenize(expression: str) -> Iterator[Tuple[str, str]]:
+    """Split expression into (kind, text) tokens, skipping whitespace."""
+    for match in _TOKEN.finditer(expression):
+        yield match.lastgroup, match.group(match.lastgroup)
+
+
+def _apply_operator(operator: str, values: List[TritArray],
+                    results: Dict[tuple, TritArray]) -> None:
+    """
+    Replace the top operand(s) of values with the operator's result.
+    
+    results memoizes operations by operator and operand values, so a
+    repeated subexpression such as the 1+2 in (1+2)*(1+2) is computed once.
+    """
+    if operator == _NEGATE:
+        key = (operator, values.pop())
+    else:
+        right = values.pop()
+        left = values.pop()
+        if operator in _COMMUTATIVE and hash(right) < hash(left):
+            left, right = right, left
+        key = (operator, left, right)
+    
+    result = results.get(key)
+    if result is None:
+        if operator == _NEGATE:
+            result = TernaryMath.ternary_negate(key[1])
+        else:
+            result = _OPERATIONS[operator](left, right)
+        results[key] = result
+    values.append(result)
+
+
 class TernaryCalculator:
     """
     Ternary Calculator - Advanced calculator for ternary arithmetic.
@@ -30,6 +137,12 @@ class TernaryCalculator:
         self.last_result = None
         self.display_precision = 8
         
+        # Trits of recent results by expression, least recently used first;
+        # cleared whenever a variable changes. Hits build a new TritArray,
+        # so results handed out earlier are never shared
+        self._result_cache = OrderedDict()
+        self.result_cache_size = 512
+        
         # Statistics
         self.stats = {
             'calculations': 0,
@@ -48,8 +161,17 @@ class TernaryCalculator:
             Calculation result or error message
         """
         try:
-            # Parse and evaluate expression
-            result = self._evaluate_expression(expression)
+            # Parse and evaluate expression, unless it was evaluated recently
+            key = expression.strip()
+            trits = self._result_cache.get(key)
+            if trits is not None:
+                self._result_cache.move_to_end(key)
+                result = TritArray._wrap(list(trits))
+            else:
+                result = self._evaluate_expression(expression)
+                self._result_cache[key] = tuple(result._trits)
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
             
             # Store result
             self.last_result = result
@@ -72,114 +194,74 @@ class TernaryCalculator:
             return f"Error: {str(e)}"
     
     def _evaluate_expression(self, expression: str) -> TritArray:
-        """Evaluate mathematical expression."""
-        # Remove whitespace
-        expression = expression.replace(' ', '')
-        
-        # Handle parentheses
-        while '(' in expression:
-            start = expression.rfind('(')
-            end = expression.find(')', start)
-            if end == -1:
-                raise ValueError("Mismatched parentheses")
-            
-            sub_expr = expression[start+1:end]
-            sub_result = self._evaluate_expression(sub_expr)
-            expression = expression[:start] + self._tritarray_to_string(sub_result) + expression[end+1:]
+        """
+        Evaluate mathematical expression.
         
-        # Handle operators in order of precedence
-        expression = self._handle_operators(expression, ['^'], self._power)
-        expression = self._handle_operators(expression, ['*', '/'], self._multiply_divide)
-        expression = self._handle_operators(expression, ['+', '-'], self._add_subtract)
+        Single left-to-right Shunting-Yard pass: operands are pushed on a
+        value stack and each operator is applied as soon as precedence
+        allows, so intermediate results stay TritArrays and the expression
+        text is never rebuilt.
+        """
+        # A bare number, constant or variable needs no parsing
+        literal = expression.strip()
+        if literal in self.variables or literal in _CONSTANTS or literal.isdecimal():
+            return self._string_to_tritarray(literal)
         
-        # Convert final result
-        return self._string_to_tritarray(expression)
-    
-    def _handle_operators(self, expression: str, operators: List[str], 
-                         operation_func) -> str:
-        """Handle operators in expression."""
-        for operator in operators:
-            while operator in expression:
-                index = expression.find(operator)
-                
-                # Find operands
-                left_start = self._find_operand_start(expression, index - 1)
-                right_end = self._find_operand_end(expression, index + 1)
-                
-                left_operand = expression[left_start:index]
-                right_operand = expression[index+1:right_end]
-                
-                # Perform operation
-                result = operation_func(left_operand, right_operand)
-                
-                # Replace in expression
-                expression = (expression[:left_start] + 
-                            self._tritarray_to_string(result) + 
-                            expression[right_end:])
+        values = []
+        operators = []  # Pending operators and '(' markers
+        results = {}  # Operations already computed in this expression
+        expect_operand = True
         
-        return expression
-    
-    def _find_operand_start(self, expression: str, index: int) -> int:
-        """Find start of operand."""
-        while index >= 0 and expression[index] in '0123456789-+':
-            index -= 1
-        return index + 1
-    
-    def _find_operand_end(self, expression: str, index: int) -> int:
-        """Find end of operand."""
-        while index < len(expression) and expression[index] in '0123456789-+':
-            index += 1
-        return index
-    
-    def _add_subtract(self, left: str, right: str) -> TritArray:
-        """Add or subtract operands."""
-        left_val = self._string_to_tritarray(left)
-        right_val = self._string_to_tritarray(right)
+        for kind, text in _tokenize(expression):
+            if expect_operand:
+                if kind != 'symbol':
+                    values.append(self._string_to_tritarray(text))
+                    expect_operand = False
+                elif text == '(':
+                    operators.append(text)
+                elif text == '-':
+                    operators.append(_NEGATE)
+                elif text != '+':  # Unary plus is a no-op
+                    raise ValueError(f"Unexpected '{text}'")
+            
+            elif text in _PRECEDENCE:
+                precedence = _PRECEDENCE[text]
+                while operators and operators[-1] != '(' and (
+                        _PRECEDENCE[operators[-1]] > precedence or
+                        (_PRECEDENCE[operators[-1]] == precedence and
+                         text not in _RIGHT_ASSOCIATIVE)):
+                    _apply_operator(operators.pop(), values, results)
+                operators.append(text)
+                expect_operand = True
+            
+            elif text == ')':
+                while operators and operators[-1] != '(':
+                    _apply_operator(operators.pop(), values, results)
+                if not operators:
+                    raise ValueError("Mismatched parentheses")
+                operators.pop()
+            
+            else:
+                raise ValueError(f"Unexpected '{text}'")
         
-        return TernaryMath.ternary_add(left_val, right_val)
-    
-    def _multiply_divide(self, left: str, right: str) -> TritArray:
-        """Multiply or divide operands."""
-        left_val = self._string_to_tritarray(left)
-        right_val = self._string_to_tritarray(right)
+        if expect_operand:
+            raise ValueError("Incomplete expression")
         
-        # Check for division
-        if '/' in left or '/' in right:
-            quotient, remainder = TernaryMath.ternary_divide(left_val, right_val)
-            return quotient
-        else:
-            return TernaryMath.ternary_multiply(left_val, right_val)
-    
-    def _power(self, left: str, right: str) -> TritArray:
-        """Power operation."""
-        left_val = self._string_to_tritarray(left)
-        right_val = self._string_to_tritarray(right)
+        while operators:
+            operator = operators.pop()
+            if operator == '(':
+                raise ValueError("Mismatched parentheses")
+            _apply_operator(operator, values, results)
         
-        return TernaryMath.ternary_power(left_val, right_val)
+        return values[0]
     
     def _string_to_tritarray(self, string: str) -> TritArray:
         """Convert string to TritArray."""
         if string in self.variables:
             return self.variables[string]
         
-        # Handle constants
-        if string == 'pi':
-            return TernaryConstants.PI
-        elif string == 'e':
-            return TernaryConstants.E
-        elif string == 'phi':
-            return TernaryConstants.PHI
-        
-        # Convert number
-        try:
-            value = int(string)
-            return TritArray.from_int(value, 8)
-        except ValueError:
-            raise ValueError(f"Invalid operand: {string}")
-    
-    def _tritarray_to_string(self, tritarray: TritArray) -> str:
-        """Convert TritArray to string."""
-        return str(tritarray.to_decimal())
+        # Numbers and constants do not depend on calculator state
+        return _literal_to_tritarray(string)
     
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
@@ -201,6 +283,7 @@ class TernaryCalculator:
     def set_variable(self, name: str, value: TritArray) -> None:
         """Set variable value."""
         self.variables[name] = value.copy()
+        self._result_cache.clear()
     
     def get_variable(self, name: str) -> Optional[TritArray]:
         """Get variable value."""
@@ -209,6 +292,7 @@ class TernaryCalculator:
     def clear_variables(self) -> None:
         """Clear all variables."""
         self.variables.clear()
+        self._result_cache.clear()
     
     def get_history(self) -> List[Dict[str, Any]]:
         """Get calculation history."""
@@ -4,7 +4,9 @@ Ternary Editor - Text editor for ternary data.
 This module provides a complete text editor application for ternary files.
 """
 
-from typing import List, Union, Optional, Dict, Any
+from typing import List, Union, Optional, Dict, Any, Tuple
+from bisect import bisect_right
+from collections import deque
 import os
 import sys
 from ..core.trit import Trit
@@ -33,14 +35,21 @@ class TernaryEditor:
         self.selection_start = None
         self.selection_end = None
         
+        # Lines of content and their start positions, computed on demand
+        # and dropped whenever the content changes
+        self._lines_cache = None
+        self._line_starts = None
+        
         # Editor state
         self.modified = False
         self.line_numbers = True
         self.word_wrap = True
         self.tab_size = 4
         
-        # History for undo/redo
-        self.history = []
+        # History for undo/redo: one (position, deleted trits, inserted
+        # trits) record per operation, turning the previous content into
+        # the next
+        self.history = deque()
         self.history_index = -1
         self.max_history = 100
         
@@ -72,13 +81,15 @@ class TernaryEditor:
             trits = TernaryFileIO.read_file(filename)
             
             # Convert to TernaryString
+            previous = self.content
             self.content = TernaryString(trits)
+            self._invalidate_lines()
             self.filename = filename
             self.cursor_position = 0
             self.modified = False
             
             # Add to history
-            self._add_to_history()
+            self._add_to_history(0, previous.trits, self.content.trits)
             
             self.stats['loads'] += 1
             return True
@@ -112,7 +123,7 @@ class TernaryEditor:
             self.modified = False
             
             # Add to history
-            self._add_to_history()
+            self._add_to_history(0, [], [])
             
             self.stats['saves'] += 1
             return True
@@ -132,26 +143,17 @@ class TernaryEditor:
         if position is None:
             position = self.cursor_position
         
-        # Convert text to trits
-        trits = []
-        for char in text:
-            if char == '1':
-                trits.append(Trit(1))
-            elif char == '-':
-                trits.append(Trit(-1))
-            else:
-                trits.append(Trit(0))
-        
-        # Insert trits
-        for i, trit in enumerate(trits):
-            self.content.insert(position + i, trit)
+        # Convert text to trits and splice them in at once
+        trits = TernaryString.from_string(text)
+        self.content.insert_string(position, trits)
+        self._invalidate_lines()
         
         # Update cursor position
         self.cursor_position = position + len(trits)
         self.modified = True
         
         # Add to history
-        self._add_to_history()
+        self._add_to_history(position, [], trits.trits)
         
         self.stats['operations'] += 1
     
@@ -167,8 +169,9 @@ class TernaryEditor:
             raise ValueError("Invalid delete range")
         
         # Delete trits
-        for i in range(end - start):
-            self.content.remove(start)
+        deleted = self.content.trits[start:end]
+        self.content.remove_range(start, end)
+        self._invalidate_lines()
         
         # Update cursor position
         if self.cursor_position > start:
@@ -177,7 +180,7 @@ class TernaryEditor:
         self.modified = True
         
         # Add to history
-        self._add_to_history()
+        self._add_to_history(start, deleted, [])
         
         self.stats['operations'] += 1
     
@@ -200,11 +203,13 @@ class TernaryEditor:
         result = self.content.replace(old_string, new_string)
         
         # Update content
+        previous = self.content
         self.content = result
+        self._invalidate_lines()
         self.modified = True
         
         # Add to history
-        self._add_to_history()
+        self._add_to_history(0, previous.trits, result.trits)
         
         self.stats['operations'] += 1
         
@@ -235,7 +240,7 @@ class TernaryEditor:
         Returns:
             Line content as TernaryString
         """
-        lines = self.get_lines()
+        lines, _ = self._line_index()
         if 0 <= line_number < len(lines):
             return lines[line_number]
         else:
@@ -248,35 +253,49 @@ class TernaryEditor:
         Returns:
             List of lines as TernaryString objects
         """
-        # Split by newline (ternary representation)
-        newline = TernaryString([Trit(0)])  # Assuming 0 represents newline
-        return self.content.split(newline)
+        lines, _ = self._line_index()
+        return list(lines)
+    
+    def _line_index(self) -> Tuple[List[TernaryString], List[int]]:
+        """Get lines and their start positions, cached until content changes."""
+        if self._lines_cache is None:
+            # Split by newline (ternary representation)
+            newline = TernaryString([Trit(0)])  # Assuming 0 represents newline
+            lines = self.content.split(newline)
+            
+            starts = []
+            position = 0
+            for line in lines:
+                starts.append(position)
+                position += len(line) + 1  # +1 for newline
+            
+            self._lines_cache = lines
+            self._line_starts = starts
+        
+        return self._lines_cache, self._line_starts
+    
+    def _invalidate_lines(self) -> None:
+        """Drop cached lines after the content changed."""
+        self._lines_cache = None
+        self._line_starts = None
     
     def get_line_count(self) -> int:
         """Get total number of lines."""
-        return len(self.get_lines())
+        lines, _ = self._line_index()
+        return len(lines)
     
     def get_cursor_line(self) -> int:
         """Get current line number."""
-        lines = self.get_lines()
-        current_pos = 0
-        
-        for i, line in enumerate(lines):
-            if self.cursor_position <= current_pos + len(line):
-                return i
-            current_pos += len(line) + 1  # +1 for newline
-        
-        return len(lines) - 1
+        _, starts = self._line_index()
+        return bisect_right(starts, self.cursor_position) - 1
     
     def get_cursor_column(self) -> int:
         """Get current column number."""
-        lines = self.get_lines()
-        current_pos = 0
+        lines, starts = self._line_index()
+        line = bisect_right(starts, self.cursor_position) - 1
         
-        for line in lines:
-            if self.cursor_position <= current_pos + len(line):
-                return self.cursor_position - current_pos
-            current_pos += len(line) + 1  # +1 for newline
+        if line >= 0 and self.cursor_position <= starts[line] + len(lines[line]):
+            return self.cursor_position - starts[line]
         
         return 0
     
@@ -298,18 +317,14 @@ class TernaryEditor:
             line: Line number
             column: Column number
         """
-        lines = self.get_lines()
+        lines, starts = self._line_index()
         
         if 0 <= line < len(lines):
             line_length = len(lines[line])
             column = min(column, line_length)
             
             # Calculate position
-            position = 0
-            for i in range(line):
-                position += len(lines[i]) + 1  # +1 for newline
-            
-            position += column
+            position = starts[line] + column
             self.move_cursor(position)
     
     def select_text(self, start: int, end: int) -> None:
@@ -358,8 +373,11 @@ class TernaryEditor:
     def undo(self) -> bool:
         """Undo last operation."""
         if self.history_index > 0:
+            position, deleted, inserted = self.history[self.history_index]
+            self.content.remove_range(position, position + len(inserted))
+            self.content.insert_string(position, TernaryString(list(deleted)))
             self.history_index -= 1
-            self.content = self.history[self.history_index].copy()
+            self._invalidate_lines()
             self.modified = True
             self.stats['undos'] += 1
             return True
@@ -369,25 +387,36 @@ class TernaryEditor:
         """Redo last undone operation."""
         if self.history_index < len(self.history) - 1:
             self.history_index += 1
-            self.content = self.history[self.history_index].copy()
+            position, deleted, inserted = self.history[self.history_index]
+            self.content.remove_range(position, position + len(deleted))
+            self.content.insert_string(position, TernaryString(list(inserted)))
+            self._invalidate_lines()
             self.modified = True
             self.stats['redos'] += 1
             return True
         return False
     
-    def _add_to_history(self) -> None:
-        """Add current state to history."""
+    def _add_to_history(self, position: int, deleted: List[Trit],
+                        inserted: List[Trit]) -> None:
+        """
+        Add an operation to history.
+        
+        Args:
+            position: Position of the change
+            deleted: Trits removed at position
+            inserted: Trits now at position in their place
+        """
         # Remove future history if we're not at the end
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
+        while len(self.history) > self.history_index + 1:
+            self.history.pop()
         
-        # Add current state
-        self.history.append(self.content.copy())
+        # Add the change, not a copy of the whole content
+        self.history.append((position, tuple(deleted), tuple(inserted)))
         self.history_index += 1
         
         # Limit history size
         if len(self.history) > self.max_history:
-            self.history.pop(0)
+            self.history.popleft()
             self.history_index -= 1
     
     def get_stats(self) -> Dict[str, Any]:
@@ -410,7 +439,7 @@ class TernaryEditor:
             start_line: Start line to display
             end_line: End line to display
         """
-        lines = self.get_lines()
+        lines, _ = self._line_index()
         
         if end_line is None:
             end_line = len(lines)
@@ -433,22 +462,39 @@ class TernaryEditor:
         Returns:
             Number of replacements made
         """
-        replacements = 0
-        start = 0
-        
-        while True:
-            position = self.find_text(search_text, start)
-            if position == -1:
-                break
-            
-            # Replace at position
-            self.delete_text(position, position + len(search_text))
-            self.insert_text(replace_text, position)
+        if replace_all:
+            # One scan and one new buffer for all occurrences
+            search_string = TernaryString.from_string(search_text)
+            replace_string = TernaryString.from_string(replace_text)
+            content, matches = self.content.replace_all(search_string, replace_string)
             
-            replacements += 1
-            start = position + len(replace_text)
+            if matches:
+                # The changed span runs from the first match to the end of
+                # the last replacement
+                start = matches[0]
+                end = matches[-1] + len(search_string)
+                new_end = end + len(matches) * (len(replace_string) - len(search_string))
+                
+                previous = self.content
+                self.content = content
+                self._invalidate_lines()
+                self.cursor_position = new_end
+                self.modified = True
+                
+                # Add to history, undone as one step
+                self._add_to_history(start, previous.trits[start:end],
+                                     content.trits[start:new_end])
+                
+                self.stats['operations'] += 1
             
-            if not replace_all:
-                break
+            return len(matches)
+        
+        position = self.find_text(search_text)
+        if position == -1:
+            return 0
+        
+        # Replace at position
+        self.delete_text(position, position + len(search_text))
+        self.insert_text(replace_text, position)
         
-        return replacements
+        return 1
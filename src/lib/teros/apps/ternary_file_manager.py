@@ -9,11 +9,34 @@ import os
 import sys
 import time
 from enum import Enum
+from functools import lru_cache
 from ..core.trit import Trit
 from ..core.tritarray import TritArray
 from ..libs.libio import TernaryFileIO, TernaryConsoleIO
 from ..libs.libstring import TernaryString
 
+try:
+    import pwd
+    import grp
+except ImportError:
+    pwd = grp = None
+
+
+@lru_cache(maxsize=None)
+def _owner_name(uid: int) -> str:
+    """Get the user name for uid, reading the user database once per uid."""
+    if pwd is None:
+        return str(uid)
+    return pwd.getpwuid(uid).pw_name
+
+
+@lru_cache(maxsize=None)
+def _group_name(gid: int) -> str:
+    """Get the group name for gid, reading the group database once per gid."""
+    if grp is None:
+        return str(gid)
+    return grp.getgrgid(gid).gr_name
+
 
 class FileType(Enum):
     """File types."""
@@ -74,14 +97,8 @@ class FileInfo:
                 self.permissions = oct(stat.st_mode)[-3:]
                 
                 # Get owner and group (if available)
-                try:
-                    import pwd
-                    import grp
-                    self.owner = pwd.getpwuid(stat.st_uid).pw_name
-                    self.group = grp.getgrgid(stat.st_gid).gr_name
-                except ImportError:
-                    self.owner = str(stat.st_uid)
-                    self.group = str(stat.st_gid)
+                self.owner = _owner_name(stat.st_uid)
+                self.group = _group_name(stat.st_gid)
                 
         except Exception as e:
             print(f"Failed to load file info for {self.path}: {e}")
@@ -27,8 +27,9 @@ class CodeGenerator:
         self.stack_depth = 0
         self.max_stack_depth = 0
         
-        # Register allocation
-        self.registers = ['R0', 'R1', 'R2', 'R3', 'R4', 'R5', 'R6', 'R7']
+        # Register allocation, by T3-ISA register number
+        self.registers = [T3_Instruction.R0, T3_Instruction.R1, T3_Instruction.R2, T3_Instruction.R3,
+                          T3_Instruction.R4, T3_Instruction.R5, T3_Instruction.R6, T3_Instruction.R7]
         self.allocated_registers = set()
         self.register_map = {}
     
@@ -56,7 +57,7 @@ class CodeGenerator:
         
         return self.instructions.copy()
     
-    def _generate_node(self, node: ASTNode) -> str:
+    def _generate_node(self, node: ASTNode) -> int:
         """
         Generate code for a node.
         
@@ -87,9 +88,9 @@ class CodeGenerator:
         elif node.node_type == "PROGRAM":
             return self._generate_program(node)
         else:
-            return "R0"  # Default register
+            return T3_Instruction.R0  # Default register
     
-    def _generate_literal(self, node: LiteralNode) -> str:
+    def _generate_literal(self, node: LiteralNode) -> int:
         """Generate code for literal node."""
         result_reg = self._allocate_register()
         
@@ -121,15 +122,15 @@ class CodeGenerator:
         
         return result_reg
     
-    def _generate_identifier(self, node: IdentifierNode) -> str:
+    def _generate_identifier(self, node: IdentifierNode) -> int:
         """Generate code for identifier node."""
         if node.value in self.variable_map:
             return self.variable_map[node.value]
         else:
             # Undefined variable, return R0
-            return "R0"
+            return T3_Instruction.R0
     
-    def _generate_binary_op(self, node: BinaryOpNode) -> str:
+    def _generate_binary_op(self, node: BinaryOpNode) -> int:
         """Generate code for binary operation node."""
         left_reg = self._generate_node(node.left)
         right_reg = self._generate_node(node.right)
@@ -224,7 +225,7 @@ class CodeGenerator:
         self._free_register(right_reg)
         return result_reg
     
-    def _generate_unary_op(self, node: UnaryOpNode) -> str:
+    def _generate_unary_op(self, node: UnaryOpNode) -> int:
         """Generate code for unary operation node."""
         operand_reg = self._generate_node(node.operand)
         result_reg = self._allocate_register()
@@ -242,18 +243,18 @@ class CodeGenerator:
         self._free_register(operand_reg)
         return result_reg
     
-    def _generate_function_call(self, node: FunctionCallNode) -> str:
+    def _generate_function_call(self, node: FunctionCallNode) -> int:
         """Generate code for function call node."""
         # For now, just return R0
         # In a full implementation, this would handle function calls properly
-        return "R0"
+        return T3_Instruction.R0
     
-    def _generate_lambda(self, node: LambdaNode) -> str:
+    def _generate_lambda(self, node: LambdaNode) -> int:
         """Generate code for lambda node."""
         # For now, just generate the body
         return self._generate_node(node.body)
     
-    def _generate_if_expr(self, node: IfExprNode) -> str:
+    def _generate_if_expr(self, node: IfExprNode) -> int:
         """Generate code for if expression node."""
         condition_reg = self._generate_node(node.condition)
         result_reg = self._allocate_register()
@@ -284,7 +285,7 @@ class CodeGenerator:
         self._free_register(condition_reg)
         return result_reg
     
-    def _generate_let_stmt(self, node: LetStmtNode) -> str:
+    def _generate_let_stmt(self, node: LetStmtNode) -> int:
         """Generate code for let statement node."""
         value_reg = self._generate_node(node.value)
         
@@ -296,7 +297,7 @@ class CodeGenerator:
         else:
             return value_reg
     
-    def _generate_function_decl(self, node: FunctionDeclNode) -> str:
+    def _generate_function_decl(self, node: FunctionDeclNode) -> int:
         """Generate code for function declaration node."""
         # Store function in function map
         self.function_map[node.name] = node
@@ -304,16 +305,16 @@ class CodeGenerator:
         # Generate function body
         return self._generate_node(node.body)
     
-    def _generate_program(self, node: ASTNode) -> str:
+    def _generate_program(self, node: ASTNode) -> int:
         """Generate code for program node."""
-        result_reg = "R0"
+        result_reg = T3_Instruction.R0
         
         for stmt in node.children:
             result_reg = self._generate_node(stmt)
         
         return result_reg
     
-    def _allocate_register(self) -> str:
+    def _allocate_register(self) -> int:
         """Allocate a free register."""
         for reg in self.registers:
             if reg not in self.allocated_registers:
@@ -321,9 +322,9 @@ class CodeGenerator:
                 return reg
         
         # No free registers, use R0
-        return "R0"
+        return T3_Instruction.R0
     
-    def _free_register(self, reg: str) -> None:
+    def _free_register(self, reg: int) -> None:
         """Free a register."""
         self.allocated_registers.discard(reg)
     
@@ -337,29 +338,12 @@ class CodeGenerator:
         # Labels are handled by the instruction addresses
         pass
     
-    def _emit_instruction(self, opcode: int, reg1: str, reg2: str, reg3: str, immediate: int) -> None:
+    def _emit_instruction(self, opcode: int, reg1: int, reg2: int, reg3: int, immediate: int) -> None:
         """Emit a T3-ISA instruction."""
-        # Convert register names to numbers
-        reg1_num = self._register_to_number(reg1)
-        reg2_num = self._register_to_number(reg2)
-        reg3_num = self._register_to_number(reg3)
-        
-        instruction = T3_Instruction(opcode, reg1_num, reg2_num, reg3_num, immediate)
+        # Registers are already T3-ISA register numbers
+        instruction = T3_Instruction(opcode, reg1, reg2, reg3, immediate)
         self.instructions.append(instruction)
     
-    def _register_to_number(self, reg: str) -> int:
-        """Convert register name to number."""
-        if reg.startswith('R'):
-            return int(reg[1:])
-        elif reg == 'PC':
-            return 8
-        elif reg == 'SP':
-            return 9
-        elif reg == 'FP':
-            return 10
-        else:
-            return 0
-    
     def _parse_tritarray(self, value: str) -> int:
         """Parse tritarray string to integer."""
         if value.startswith('0t'):
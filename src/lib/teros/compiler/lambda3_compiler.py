@@ -85,6 +85,8 @@ class Token:
     Provides token information for the compiler.
     """
     
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     def __init__(self, type: TokenType, value: str, line: int = 0, column: int = 0):
         """
         Initialize token.
@@ -375,6 +377,8 @@ class ASTNode:
     Provides base functionality for AST nodes.
     """
     
+    __slots__ = ('node_type', 'children', 'value', 'line', 'column')
+    
     def __init__(self, node_type: str):
         """
         Initialize AST node.
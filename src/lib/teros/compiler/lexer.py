@@ -7,96 +7,117 @@ tokenizing source code into a stream of tokens.
 
 from typing import List, Optional, Dict, Any, Iterator
 import re
-from enum import Enum
 
 
-class TokenType(Enum):
-    """Token types for Lambda³ language."""
+class TokenType:
+    """
+    Token types for Lambda³ language.
+    
+    Token types are plain ``int`` constants rather than ``Enum`` members so
+    that the parser's ``token.type == TokenType.X`` checks are integer
+    comparisons instead of ``Enum.__eq__`` calls.
+    """
     
     # Literals
-    INTEGER = "INTEGER"
-    FLOAT = "FLOAT"
-    STRING = "STRING"
-    TRIT = "TRIT"
-    TRITARRAY = "TRITARRAY"
-    BOOLEAN = "BOOLEAN"
+    INTEGER = 0
+    FLOAT = 1
+    STRING = 2
+    TRIT = 3
+    TRITARRAY = 4
+    BOOLEAN = 5
     
     # Identifiers
-    IDENTIFIER = "IDENTIFIER"
+    IDENTIFIER = 6
     
     # Keywords
-    LET = "LET"
-    IN = "IN"
-    IF = "IF"
-    THEN = "THEN"
-    ELSE = "ELSE"
-    FUN = "FUN"
-    LAMBDA = "LAMBDA"
-    MATCH = "MATCH"
-    WITH = "WITH"
-    CASE = "CASE"
-    OF = "OF"
-    REC = "REC"
-    AND = "AND"
-    OR = "OR"
-    NOT = "NOT"
-    TRUE = "TRUE"
-    FALSE = "FALSE"
-    NEGATIVE = "NEGATIVE"
-    NEUTRAL = "NEUTRAL"
-    POSITIVE = "POSITIVE"
+    LET = 7
+    IN = 8
+    IF = 9
+    THEN = 10
+    ELSE = 11
+    FUN = 12
+    LAMBDA = 13
+    MATCH = 14
+    WITH = 15
+    CASE = 16
+    OF = 17
+    REC = 18
+    AND = 19
+    OR = 20
+    NOT = 21
+    TRUE = 22
+    FALSE = 23
+    NEGATIVE = 24
+    NEUTRAL = 25
+    POSITIVE = 26
     
     # Operators
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    MULTIPLY = "MULTIPLY"
-    DIVIDE = "DIVIDE"
-    MODULO = "MODULO"
-    POWER = "POWER"
-    EQUAL = "EQUAL"
-    NOT_EQUAL = "NOT_EQUAL"
-    LESS = "LESS"
-    LESS_EQUAL = "LESS_EQUAL"
-    GREATER = "GREATER"
-    GREATER_EQUAL = "GREATER_EQUAL"
-    AND_OP = "AND_OP"
-    OR_OP = "OR_OP"
-    NOT_OP = "NOT_OP"
-    TERNARY_AND = "TERNARY_AND"
-    TERNARY_OR = "TERNARY_OR"
-    TERNARY_NOT = "TERNARY_NOT"
-    TERNARY_XOR = "TERNARY_XOR"
-    TERNARY_CONS = "TERNARY_CONS"
-    TERNARY_ANY = "TERNARY_ANY"
-    TERNARY_NAND = "TERNARY_NAND"
+    PLUS = 27
+    MINUS = 28
+    MULTIPLY = 29
+    DIVIDE = 30
+    MODULO = 31
+    POWER = 32
+    EQUAL = 33
+    NOT_EQUAL = 34
+    LESS = 35
+    LESS_EQUAL = 36
+    GREATER = 37
+    GREATER_EQUAL = 38
+    AND_OP = 39
+    OR_OP = 40
+    NOT_OP = 41
+    TERNARY_AND = 42
+    TERNARY_OR = 43
+    TERNARY_NOT = 44
+    TERNARY_XOR = 45
+    TERNARY_CONS = 46
+    TERNARY_ANY = 47
+    TERNARY_NAND = 48
     
     # Punctuation
-    LEFT_PAREN = "LEFT_PAREN"
-    RIGHT_PAREN = "RIGHT_PAREN"
-    LEFT_BRACKET = "LEFT_BRACKET"
-    RIGHT_BRACKET = "RIGHT_BRACKET"
-    LEFT_BRACE = "LEFT_BRACE"
-    RIGHT_BRACE = "RIGHT_BRACE"
-    COMMA = "COMMA"
-    SEMICOLON = "SEMICOLON"
-    COLON = "COLON"
-    DOT = "DOT"
-    ARROW = "ARROW"
-    PIPE = "PIPE"
-    ASSIGN = "ASSIGN"
+    LEFT_PAREN = 49
+    RIGHT_PAREN = 50
+    LEFT_BRACKET = 51
+    RIGHT_BRACKET = 52
+    LEFT_BRACE = 53
+    RIGHT_BRACE = 54
+    COMMA = 55
+    SEMICOLON = 56
+    COLON = 57
+    DOT = 58
+    ARROW = 59
+    PIPE = 60
+    ASSIGN = 61
     
     # Special
-    NEWLINE = "NEWLINE"
-    WHITESPACE = "WHITESPACE"
-    COMMENT = "COMMENT"
-    EOF = "EOF"
-    ERROR = "ERROR"
+    NEWLINE = 62
+    WHITESPACE = 63
+    COMMENT = 64
+    EOF = 65
+    ERROR = 66
+    
+    # Statement keywords referenced by the parser
+    RETURN = 67
+    WHILE = 68
+    FOR = 69
+
+
+# Token type names, used for token and error reprs
+TOKEN_NAMES: Dict[int, str] = {
+    value: name for name, value in vars(TokenType).items() if name.isupper()
+}
+
+
+def token_name(token_type: int) -> str:
+    """Get the name of a token type."""
+    return TOKEN_NAMES.get(token_type, str(token_type))
 
 
 class Token:
     """Token class for Lambda³ language."""
     
-    def __init__(self, type_: TokenType, value: str, line: int = 1, column: int = 1):
+    def __init__(self, type_: int, value: str, line: int = 1, column: int = 1):
         """
         Initialize a token.
         
@@ -113,11 +134,11 @@ class Token:
     
     def __str__(self) -> str:
         """String representation."""
-        return f"Token({self.type.value}, '{self.value}', line={self.line}, col={self.column})"
+        return f"Token({token_name(self.type)}, '{self.value}', line={self.line}, col={self.column})"
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return f"Token({self.type.value}, '{self.value}', line={self.line}, col={self.column})"
+        return f"Token({token_name(self.type)}, '{self.value}', line={self.line}, col={self.column})"
     
     def __eq__(self, other) -> bool:
         """Equality comparison."""
@@ -136,91 +157,97 @@ class Lambda3Lexer:
     Tokenizes Lambda³ source code into a stream of tokens.
     """
     
+    # Token patterns, tried in order (first match wins)
+    PATTERNS = [
+        # Keywords
+        (r'\blet\b', TokenType.LET),
+        (r'\bin\b', TokenType.IN),
+        (r'\bif\b', TokenType.IF),
+        (r'\bthen\b', TokenType.THEN),
+        (r'\belse\b', TokenType.ELSE),
+        (r'\bfun\b', TokenType.FUN),
+        (r'\blambda\b', TokenType.LAMBDA),
+        (r'\bmatch\b', TokenType.MATCH),
+        (r'\bwith\b', TokenType.WITH),
+        (r'\bcase\b', TokenType.CASE),
+        (r'\bof\b', TokenType.OF),
+        (r'\brec\b', TokenType.REC),
+        (r'\band\b', TokenType.AND),
+        (r'\bor\b', TokenType.OR),
+        (r'\bnot\b', TokenType.NOT),
+        (r'\btrue\b', TokenType.TRUE),
+        (r'\bfalse\b', TokenType.FALSE),
+        (r'\bnegative\b', TokenType.NEGATIVE),
+        (r'\bneutral\b', TokenType.NEUTRAL),
+        (r'\bpositive\b', TokenType.POSITIVE),
+        
+        # Literals
+        (r'\b\d+\.\d+\b', TokenType.FLOAT),
+        (r'\b\d+\b', TokenType.INTEGER),
+        (r'"[^"]*"', TokenType.STRING),
+        (r"'[^']*'", TokenType.STRING),
+        (r'\b0t[+-0]+\b', TokenType.TRITARRAY),
+        (r'\b[+-]\b', TokenType.TRIT),
+        (r'\b0\b', TokenType.TRIT),
+        
+        # Operators
+        (r'\+', TokenType.PLUS),
+        (r'-', TokenType.MINUS),
+        (r'\*', TokenType.MULTIPLY),
+        (r'/', TokenType.DIVIDE),
+        (r'%', TokenType.MODULO),
+        (r'\^', TokenType.POWER),
+        (r'==', TokenType.EQUAL),
+        (r'!=', TokenType.NOT_EQUAL),
+        (r'<', TokenType.LESS),
+        (r'<=', TokenType.LESS_EQUAL),
+        (r'>', TokenType.GREATER),
+        (r'>=', TokenType.GREATER_EQUAL),
+        (r'&&', TokenType.AND_OP),
+        (r'\|\|', TokenType.OR_OP),
+        (r'!', TokenType.NOT_OP),
+        (r'&', TokenType.TERNARY_AND),
+        (r'\|', TokenType.TERNARY_OR),
+        (r'~', TokenType.TERNARY_NOT),
+        (r'\^', TokenType.TERNARY_XOR),
+        (r'->', TokenType.TERNARY_CONS),
+        (r'\?', TokenType.TERNARY_ANY),
+        (r'!&', TokenType.TERNARY_NAND),
+        
+        # Punctuation
+        (r'\(', TokenType.LEFT_PAREN),
+        (r'\)', TokenType.RIGHT_PAREN),
+        (r'\[', TokenType.LEFT_BRACKET),
+        (r'\]', TokenType.RIGHT_BRACKET),
+        (r'\{', TokenType.LEFT_BRACE),
+        (r'\}', TokenType.RIGHT_BRACE),
+        (r',', TokenType.COMMA),
+        (r';', TokenType.SEMICOLON),
+        (r':', TokenType.COLON),
+        (r'\.', TokenType.DOT),
+        (r'=>', TokenType.ARROW),
+        (r'\|', TokenType.PIPE),
+        (r'=', TokenType.ASSIGN),
+        
+        # Special
+        (r'\n', TokenType.NEWLINE),
+        (r'\s+', TokenType.WHITESPACE),
+        (r'//.*', TokenType.COMMENT),
+        (r'/\*.*?\*/', TokenType.COMMENT),
+    ]
+    
+    # Every pattern becomes a named group of one alternation, compiled once
+    # per class: a single match call picks the first pattern that matches
+    _master_pattern = re.compile('|'.join(
+        f'(?P<t{index}>{pattern})' for index, (pattern, _) in enumerate(PATTERNS)
+    ))
+    _group_types = {
+        f't{index}': token_type for index, (_, token_type) in enumerate(PATTERNS)
+    }
+    
     def __init__(self):
         """Initialize the lexer."""
-        # Define token patterns
-        self.patterns = [
-            # Keywords
-            (r'\blet\b', TokenType.LET),
-            (r'\bin\b', TokenType.IN),
-            (r'\bif\b', TokenType.IF),
-            (r'\bthen\b', TokenType.THEN),
-            (r'\belse\b', TokenType.ELSE),
-            (r'\bfun\b', TokenType.FUN),
-            (r'\blambda\b', TokenType.LAMBDA),
-            (r'\bmatch\b', TokenType.MATCH),
-            (r'\bwith\b', TokenType.WITH),
-            (r'\bcase\b', TokenType.CASE),
-            (r'\bof\b', TokenType.OF),
-            (r'\brec\b', TokenType.REC),
-            (r'\band\b', TokenType.AND),
-            (r'\bor\b', TokenType.OR),
-            (r'\bnot\b', TokenType.NOT),
-            (r'\btrue\b', TokenType.TRUE),
-            (r'\bfalse\b', TokenType.FALSE),
-            (r'\bnegative\b', TokenType.NEGATIVE),
-            (r'\bneutral\b', TokenType.NEUTRAL),
-            (r'\bpositive\b', TokenType.POSITIVE),
-            
-            # Literals
-            (r'\b\d+\.\d+\b', TokenType.FLOAT),
-            (r'\b\d+\b', TokenType.INTEGER),
-            (r'"[^"]*"', TokenType.STRING),
-            (r"'[^']*'", TokenType.STRING),
-            (r'\b0t[+-0]+\b', TokenType.TRITARRAY),
-            (r'\b[+-]\b', TokenType.TRIT),
-            (r'\b0\b', TokenType.TRIT),
-            
-            # Operators
-            (r'\+', TokenType.PLUS),
-            (r'-', TokenType.MINUS),
-            (r'\*', TokenType.MULTIPLY),
-            (r'/', TokenType.DIVIDE),
-            (r'%', TokenType.MODULO),
-            (r'\^', TokenType.POWER),
-            (r'==', TokenType.EQUAL),
-            (r'!=', TokenType.NOT_EQUAL),
-            (r'<', TokenType.LESS),
-            (r'<=', TokenType.LESS_EQUAL),
-            (r'>', TokenType.GREATER),
-            (r'>=', TokenType.GREATER_EQUAL),
-            (r'&&', TokenType.AND_OP),
-            (r'\|\|', TokenType.OR_OP),
-            (r'!', TokenType.NOT_OP),
-            (r'&', TokenType.TERNARY_AND),
-            (r'\|', TokenType.TERNARY_OR),
-            (r'~', TokenType.TERNARY_NOT),
-            (r'\^', TokenType.TERNARY_XOR),
-            (r'->', TokenType.TERNARY_CONS),
-            (r'\?', TokenType.TERNARY_ANY),
-            (r'!&', TokenType.TERNARY_NAND),
-            
-            # Punctuation
-            (r'\(', TokenType.LEFT_PAREN),
-            (r'\)', TokenType.RIGHT_PAREN),
-            (r'\[', TokenType.LEFT_BRACKET),
-            (r'\]', TokenType.RIGHT_BRACKET),
-            (r'\{', TokenType.LEFT_BRACE),
-            (r'\}', TokenType.RIGHT_BRACE),
-            (r',', TokenType.COMMA),
-            (r';', TokenType.SEMICOLON),
-            (r':', TokenType.COLON),
-            (r'\.', TokenType.DOT),
-            (r'=>', TokenType.ARROW),
-            (r'\|', TokenType.PIPE),
-            (r'=', TokenType.ASSIGN),
-            
-            # Special
-            (r'\n', TokenType.NEWLINE),
-            (r'\s+', TokenType.WHITESPACE),
-            (r'//.*', TokenType.COMMENT),
-            (r'/\*.*?\*/', TokenType.COMMENT),
-        ]
-        
-        # Compile patterns
-        self.compiled_patterns = []
-        for pattern, token_type in self.patterns:
-            self.compiled_patterns.append((re.compile(pattern), token_type))
+        self.patterns = self.PATTERNS
     
     def tokenize(self, source_code: str) -> List[Token]:
         """
@@ -238,42 +265,23 @@ class Lambda3Lexer:
         column = 1
         
         while position < len(source_code):
-            matched = False
-            
-            # Try to match each pattern
-            for pattern, token_type in self.compiled_patterns:
-                match = pattern.match(source_code, position)
-                if match:
-                    value = match.group(0)
-                    
-                    # Skip whitespace and comments
-                    if token_type in [TokenType.WHITESPACE, TokenType.COMMENT]:
-                        # Update position and line/column
-                        position = match.end()
-                        if token_type == TokenType.NEWLINE:
-                            line += 1
-                            column = 1
-                        else:
-                            column += len(value)
-                        matched = True
-                        break
-                    
-                    # Create token
-                    token = Token(token_type, value, line, column)
-                    tokens.append(token)
-                    
-                    # Update position and line/column
-                    position = match.end()
-                    if token_type == TokenType.NEWLINE:
-                        line += 1
-                        column = 1
-                    else:
-                        column += len(value)
-                    
-                    matched = True
-                    break
-            
-            if not matched:
+            match = self._master_pattern.match(source_code, position)
+            if match:
+                token_type = self._group_types[match.lastgroup]
+                value = match.group(0)
+                position = match.end()
+                
+                # Skip whitespace and comments
+                if token_type != TokenType.WHITESPACE and token_type != TokenType.COMMENT:
+                    tokens.append(Token(token_type, value, line, column))
+                
+                # Update line/column
+                if token_type == TokenType.NEWLINE:
+                    line += 1
+                    column = 1
+                else:
+                    column += len(value)
+            else:
                 # No pattern matched, create error token
                 char = source_code[position]
                 error_token = Token(TokenType.ERROR, char, line, column)
@@ -9,6 +9,12 @@ from typing import List, Optional, Dict, Any, Union
 from .parser import ASTNode, LiteralNode, IdentifierNode, BinaryOpNode, UnaryOpNode, FunctionCallNode, LambdaNode, IfExprNode, LetStmtNode, FunctionDeclNode
 
 
+# Literal types that arithmetic can be folded over, and that can decide a
+# branch at compile time
+_FOLDABLE_LITERALS = frozenset(["integer", "float", "trit"])
+_CONDITION_LITERALS = frozenset(["boolean", "trit"])
+
+
 class OptimizationPass:
     """Base class for optimization passes."""
     
@@ -74,9 +80,10 @@ class ConstantFoldingPass(OptimizationPass):
         right = self._fold_constants(node.right)
         
         # Check if both operands are literals
-        if (isinstance(left, LiteralNode) and isinstance(right, LiteralNode) and
-            left.literal_type in ["integer", "float", "trit"] and
-            right.literal_type in ["integer", "float", "trit"]):
+        # (AST node classes are not subclassed, so an exact type check suffices)
+        if (type(left) is LiteralNode and type(right) is LiteralNode and
+            left.literal_type in _FOLDABLE_LITERALS and
+            right.literal_type in _FOLDABLE_LITERALS):
             
             # Perform constant folding
             result = self._evaluate_binary_op(left.value, node.operator, right.value, left.literal_type)
@@ -95,7 +102,7 @@ class ConstantFoldingPass(OptimizationPass):
         operand = self._fold_constants(node.operand)
         
         # Check if operand is literal
-        if isinstance(operand, LiteralNode) and operand.literal_type in ["integer", "float", "trit"]:
+        if type(operand) is LiteralNode and operand.literal_type in _FOLDABLE_LITERALS:
             # Perform constant folding
             result = self._evaluate_unary_op(operand.value, node.operator, operand.literal_type)
             if result is not None:
@@ -113,7 +120,7 @@ class ConstantFoldingPass(OptimizationPass):
         condition = self._fold_constants(node.condition)
         
         # Check if condition is constant
-        if isinstance(condition, LiteralNode) and condition.literal_type in ["boolean", "trit"]:
+        if type(condition) is LiteralNode and condition.literal_type in _CONDITION_LITERALS:
             if condition.value:
                 self.applied += 1
                 return self._fold_constants(node.then_expr)
@@ -197,10 +204,17 @@ class DeadCodeEliminationPass(OptimizationPass):
     
     def __init__(self):
         super().__init__("DeadCodeElimination")
+        # id(node) -> (node, identifier names used in it), per apply();
+        # the node is kept so its id cannot be reused while cached
+        self._used_names: Dict[int, tuple] = {}
     
     def apply(self, ast: ASTNode) -> ASTNode:
         """Apply dead code elimination optimization."""
-        return self._eliminate_dead_code(ast)
+        self._used_names = {}
+        try:
+            return self._eliminate_dead_code(ast)
+        finally:
+            self._used_names = {}
     
     def _eliminate_dead_code(self, node: ASTNode) -> ASTNode:
         """Eliminate dead code in a node."""
@@ -222,7 +236,7 @@ class DeadCodeEliminationPass(OptimizationPass):
         else_expr = self._eliminate_dead_code(node.else_expr) if node.else_expr else None
         
         # Check if condition is constant
-        if isinstance(condition, LiteralNode) and condition.literal_type in ["boolean", "trit"]:
+        if type(condition) is LiteralNode and condition.literal_type in _CONDITION_LITERALS:
             if condition.value:
                 self.applied += 1
                 return then_expr
@@ -258,16 +272,31 @@ class DeadCodeEliminationPass(OptimizationPass):
     
     def _is_variable_used(self, variable: str, node: ASTNode) -> bool:
         """Check if a variable is used in a node."""
-        if node.node_type == "IDENTIFIER" and node.value == variable:
-            return True
+        return variable in self._identifiers_in(node)
+    
+    def _identifiers_in(self, node: ASTNode) -> frozenset:
+        """
+        Names of all identifiers in a node.
         
-        # Recursively check children
+        Memoized for the current apply(), so the bodies of nested lets
+        are scanned once rather than once per enclosing let.
+        """
+        cached = self._used_names.get(id(node))
+        if cached is not None:
+            return cached[1]
+        
+        names = set()
+        if node.node_type == "IDENTIFIER":
+            names.add(node.value)
+        
+        # Recursively collect from children
         if hasattr(node, 'children'):
             for child in node.children:
-                if self._is_variable_used(variable, child):
-                    return True
+                names.update(self._identifiers_in(child))
         
-        return False
+        names = frozenset(names)
+        self._used_names[id(node)] = (node, names)
+        return names
 
 
 class InliningPass(OptimizationPass):
@@ -333,6 +362,10 @@ class InliningPass(OptimizationPass):
         for param, arg in zip(func_def.parameters, arguments):
             substitutions[param] = arg
         
+        # Nothing to bind: the body is used as-is, without walking it
+        if not substitutions:
+            return func_def.body
+        
         # Substitute parameters in function body
         return self._substitute_variables(func_def.body, substitutions)
     
@@ -6,7 +6,14 @@ building an Abstract Syntax Tree (AST) from tokens.
 """
 
 from typing import List, Optional, Dict, Any, Union
-from .lexer import Token, TokenType
+from .lexer import Token, TokenType, token_name
+
+
+# Statement-starting tokens the parser resynchronizes on after an error
+_SYNC_TOKENS = frozenset((
+    TokenType.LET, TokenType.FUN, TokenType.IF,
+    TokenType.WHILE, TokenType.FOR, TokenType.RETURN,
+))
 
 
 class ASTNodeType:
@@ -37,6 +44,8 @@ class ASTNodeType:
 class ASTNode:
     """Base class for AST nodes."""
     
+    __slots__ = ('node_type', 'value', 'children', 'line', 'column')
+    
     def __init__(self, node_type: str, value: Any = None, children: List['ASTNode'] = None):
         """
         Initialize an AST node.
@@ -74,6 +83,8 @@ class ASTNode:
 class LiteralNode(ASTNode):
     """AST node for literals."""
     
+    __slots__ = ('literal_type',)
+    
     def __init__(self, value: Any, literal_type: str):
         super().__init__(ASTNodeType.LITERAL, value)
         self.literal_type = literal_type
@@ -82,6 +93,8 @@ class LiteralNode(ASTNode):
 class IdentifierNode(ASTNode):
     """AST node for identifiers."""
     
+    __slots__ = ()
+    
     def __init__(self, name: str):
         super().__init__(ASTNodeType.IDENTIFIER, name)
 
@@ -89,6 +102,8 @@ class IdentifierNode(ASTNode):
 class BinaryOpNode(ASTNode):
     """AST node for binary operations."""
     
+    __slots__ = ('operator', 'left', 'right')
+    
     def __init__(self, operator: str, left: ASTNode, right: ASTNode):
         super().__init__(ASTNodeType.BINARY_OP, operator, [left, right])
         self.operator = operator
@@ -99,6 +114,8 @@ class BinaryOpNode(ASTNode):
 class UnaryOpNode(ASTNode):
     """AST node for unary operations."""
     
+    __slots__ = ('operator', 'operand')
+    
     def __init__(self, operator: str, operand: ASTNode):
         super().__init__(ASTNodeType.UNARY_OP, operator, [operand])
         self.operator = operator
@@ -108,6 +125,8 @@ class UnaryOpNode(ASTNode):
 class FunctionCallNode(ASTNode):
     """AST node for function calls."""
     
+    __slots__ = ('function', 'arguments')
+    
     def __init__(self, function: ASTNode, arguments: List[ASTNode]):
         super().__init__(ASTNodeType.FUNCTION_CALL, function, arguments)
         self.function = function
@@ -117,6 +136,8 @@ class FunctionCallNode(ASTNode):
 class LambdaNode(ASTNode):
     """AST node for lambda expressions."""
     
+    __slots__ = ('parameters', 'body')
+    
     def __init__(self, parameters: List[str], body: ASTNode):
         super().__init__(ASTNodeType.LAMBDA, parameters, [body])
         self.parameters = parameters
@@ -126,6 +147,8 @@ class LambdaNode(ASTNode):
 class IfExprNode(ASTNode):
     """AST node for if expressions."""
     
+    __slots__ = ('condition', 'then_expr', 'else_expr')
+    
     def __init__(self, condition: ASTNode, then_expr: ASTNode, else_expr: Optional[ASTNode] = None):
         children = [condition, then_expr]
         if else_expr:
@@ -139,6 +162,8 @@ class IfExprNode(ASTNode):
 class MatchExprNode(ASTNode):
     """AST node for match expressions."""
     
+    __slots__ = ('expression', 'cases')
+    
     def __init__(self, expression: ASTNode, cases: List['CaseNode']):
         super().__init__(ASTNodeType.MATCH_EXPR, expression, cases)
         self.expression = expression
@@ -148,6 +173,8 @@ class MatchExprNode(ASTNode):
 class CaseNode(ASTNode):
     """AST node for case expressions."""
     
+    __slots__ = ('pattern', 'body')
+    
     def __init__(self, pattern: ASTNode, body: ASTNode):
         super().__init__(ASTNodeType.CASE, pattern, [body])
         self.pattern = pattern
@@ -157,6 +184,8 @@ class CaseNode(ASTNode):
 class LetStmtNode(ASTNode):
     """AST node for let statements."""
     
+    __slots__ = ('variable', 'body')
+    
     def __init__(self, variable: str, value: ASTNode, body: Optional[ASTNode] = None):
         children = [value]
         if body:
@@ -170,6 +199,8 @@ class LetStmtNode(ASTNode):
 class FunctionDeclNode(ASTNode):
     """AST node for function declarations."""
     
+    __slots__ = ('name', 'parameters', 'body')
+    
     def __init__(self, name: str, parameters: List[str], body: ASTNode):
         super().__init__(ASTNodeType.FUNCTION_DECL, name, [body])
         self.name = name
@@ -180,6 +211,8 @@ class FunctionDeclNode(ASTNode):
 class ReturnStmtNode(ASTNode):
     """AST node for return statements."""
     
+    __slots__ = ('expression',)
+    
     def __init__(self, expression: Optional[ASTNode] = None):
         super().__init__(ASTNodeType.RETURN_STMT, None, [expression] if expression else [])
         self.expression = expression
@@ -188,6 +221,8 @@ class ReturnStmtNode(ASTNode):
 class ExprStmtNode(ASTNode):
     """AST node for expression statements."""
     
+    __slots__ = ('expression',)
+    
     def __init__(self, expression: ASTNode):
         super().__init__(ASTNodeType.EXPR_STMT, None, [expression])
         self.expression = expression
@@ -196,6 +231,8 @@ class ExprStmtNode(ASTNode):
 class ProgramNode(ASTNode):
     """AST node for programs."""
     
+    __slots__ = ('statements',)
+    
     def __init__(self, statements: List[ASTNode]):
         super().__init__(ASTNodeType.PROGRAM, None, statements)
         self.statements = statements
@@ -204,6 +241,8 @@ class ProgramNode(ASTNode):
 class BlockNode(ASTNode):
     """AST node for blocks."""
     
+    __slots__ = ('statements',)
+    
     def __init__(self, statements: List[ASTNode]):
         super().__init__(ASTNodeType.BLOCK, None, statements)
         self.statements = statements
@@ -464,7 +503,7 @@ class Lambda3Parser:
         elif self.match(TokenType.LAMBDA):
             return self.lambda_expression()
         else:
-            raise ParseError(f"Expected expression, got {self.peek().type.value}")
+            raise ParseError(f"Expected expression, got {token_name(self.peek().type)}")
     
     def lambda_expression(self) -> LambdaNode:
         """Parse lambda expressions."""
@@ -485,7 +524,7 @@ class Lambda3Parser:
         return LambdaNode(parameters, body)
     
     # Helper methods
-    def match(self, *token_types: TokenType) -> bool:
+    def match(self, *token_types: int) -> bool:
         """Check if current token matches any of the given types."""
         for token_type in token_types:
             if self.check(token_type):
@@ -493,7 +532,7 @@ class Lambda3Parser:
                 return True
         return False
     
-    def check(self, token_type: TokenType) -> bool:
+    def check(self, token_type: int) -> bool:
         """Check if current token is of given type."""
         if self.is_at_end():
             return False
@@ -517,7 +556,7 @@ class Lambda3Parser:
         """Get previous token."""
         return self.tokens[self.current - 1]
     
-    def consume(self, token_type: TokenType, message: str) -> Token:
+    def consume(self, token_type: int, message: str) -> Token:
         """Consume token of given type."""
         if self.check(token_type):
             return self.advance()
@@ -531,7 +570,7 @@ class Lambda3Parser:
             if self.previous().type == TokenType.SEMICOLON:
                 return
             
-            if self.peek().type in [TokenType.LET, TokenType.FUN, TokenType.IF, TokenType.WHILE, TokenType.FOR, TokenType.RETURN]:
+            if self.peek().type in _SYNC_TOKENS:
                 return
             
             self.advance()
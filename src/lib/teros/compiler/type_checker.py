@@ -6,6 +6,7 @@ ensuring type safety and correctness of expressions.
 """
 
 from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
 from .parser import ASTNode, LiteralNode, IdentifierNode, BinaryOpNode, UnaryOpNode, FunctionCallNode, LambdaNode, IfExprNode, LetStmtNode, FunctionDeclNode
 
 
@@ -32,9 +33,85 @@ class TernaryType:
     ERROR = "error"
 
 
+# Type and operator classes, built once for constant-time membership tests
+_BASIC_TYPES = frozenset([
+    TernaryType.INTEGER, TernaryType.FLOAT, TernaryType.STRING,
+    TernaryType.BOOLEAN, TernaryType.TRIT, TernaryType.TRITARRAY, TernaryType.VOID
+])
+_NUMERIC_TYPES = frozenset([TernaryType.INTEGER, TernaryType.FLOAT])
+_TERNARY_TYPES = frozenset([TernaryType.TRIT, TernaryType.TRITARRAY])
+_CONDITION_TYPES = frozenset([TernaryType.BOOLEAN, TernaryType.TRIT])
+
+# Compatibility is an equivalence relation over type names. Each name in a
+# non-trivial class maps straight to its class, so two types are compatible
+# when their names match or they map to the same class
+_COMPATIBILITY_CLASS = {
+    type_name: type_class
+    for type_class in (_NUMERIC_TYPES, _TERNARY_TYPES)
+    for type_name in type_class
+}
+
+_ARITHMETIC_OPS = frozenset(["+", "-", "*", "/", "%", "^"])
+_COMPARISON_OPS = frozenset(["==", "!=", "<", "<=", ">", ">="])
+_LOGICAL_OPS = frozenset(["&&", "||", "&", "|", "^", "->", "?", "!&"])
+_NEGATION_OPS = frozenset(["-", "~"])
+
+
+@lru_cache(maxsize=None)
+def _binary_result_type(operator: str, left: str, right: str) -> str:
+    """
+    Result type name of a binary operation on compatible operands.
+    
+    Depends only on the operator and operand type names, so each
+    combination is worked out once.
+    """
+    if operator in _ARITHMETIC_OPS:
+        # Arithmetic operations
+        if left == TernaryType.FLOAT or right == TernaryType.FLOAT:
+            return TernaryType.FLOAT
+        elif left == TernaryType.TRITARRAY or right == TernaryType.TRITARRAY:
+            return TernaryType.TRITARRAY
+        elif left == TernaryType.TRIT or right == TernaryType.TRIT:
+            return TernaryType.TRIT
+        else:
+            return TernaryType.INTEGER
+    elif operator in _COMPARISON_OPS:
+        # Comparison operations
+        return TernaryType.BOOLEAN
+    elif operator in _LOGICAL_OPS:
+        # Logical operations
+        if left == TernaryType.TRITARRAY or right == TernaryType.TRITARRAY:
+            return TernaryType.TRITARRAY
+        else:
+            return TernaryType.TRIT
+    else:
+        return TernaryType.UNKNOWN
+
+
+@lru_cache(maxsize=None)
+def _binary_op_type(operator: str, left: str, right: str) -> Optional[str]:
+    """
+    Check a binary operation given its operand type names.
+    
+    Compatibility and the result type depend only on the type names, so
+    the whole check is memoized per (operator, left, right).
+    
+    Returns:
+        Result type name, or None if the operand types are incompatible
+    """
+    if not TypeInfo.of(left).is_compatible_with(TypeInfo.of(right)):
+        return None
+    return _binary_result_type(operator, left, right)
+
+
 class TypeInfo:
     """Type information for AST nodes."""
     
+    __slots__ = ('type_name', 'is_mutable', 'element_type', 'parameter_types', 'return_type')
+    
+    # Shared instances of plain (non-compound) types, see TypeInfo.of
+    _interned: Dict[str, 'TypeInfo'] = {}
+    
     def __init__(self, type_name: str, is_mutable: bool = False, 
                  element_type: Optional['TypeInfo'] = None,
                  parameter_types: Optional[List['TypeInfo']] = None,
@@ -55,6 +132,22 @@ class TypeInfo:
         self.parameter_types = parameter_types or []
         self.return_type = return_type
     
+    @classmethod
+    def of(cls, type_name: str) -> 'TypeInfo':
+        """
+        Get the shared instance of a plain type.
+        
+        Args:
+            type_name: Name of the type
+            
+        Returns:
+            Immutable-by-convention TypeInfo for the type
+        """
+        type_info = cls._interned.get(type_name)
+        if type_info is None:
+            type_info = cls._interned[type_name] = cls(type_name)
+        return type_info
+    
     def is_function(self) -> bool:
         """Check if this is a function type."""
         return self.type_name == TernaryType.FUNCTION
@@ -65,28 +158,17 @@ class TypeInfo:
     
     def is_basic_type(self) -> bool:
         """Check if this is a basic type."""
-        return self.type_name in [
-            TernaryType.INTEGER, TernaryType.FLOAT, TernaryType.STRING,
-            TernaryType.BOOLEAN, TernaryType.TRIT, TernaryType.TRITARRAY, TernaryType.VOID
-        ]
+        return self.type_name in _BASIC_TYPES
     
     def is_compatible_with(self, other: 'TypeInfo') -> bool:
         """Check if this type is compatible with another type."""
-        if self.type_name == other.type_name:
+        # Plain types are interned by TypeInfo.of, so most hits are identical
+        if self is other or self.type_name == other.type_name:
             return True
         
-        # Numeric types are compatible
-        if self.type_name in [TernaryType.INTEGER, TernaryType.FLOAT] and \
-           other.type_name in [TernaryType.INTEGER, TernaryType.FLOAT]:
-            return True
-        
-        # Trit and TritArray are compatible
-        if self.type_name == TernaryType.TRIT and other.type_name == TernaryType.TRITARRAY:
-            return True
-        if self.type_name == TernaryType.TRITARRAY and other.type_name == TernaryType.TRIT:
-            return True
-        
-        return False
+        # Numeric types are compatible, as are Trit and TritArray
+        type_class = _COMPATIBILITY_CLASS.get(self.type_name)
+        return type_class is not None and type_class is _COMPATIBILITY_CLASS.get(other.type_name)
     
     def __str__(self) -> str:
         """String representation."""
@@ -108,6 +190,8 @@ class TypeInfo:
 class Symbol:
     """Symbol in the symbol table."""
     
+    __slots__ = ('name', 'type_info', 'is_constant', 'value')
+    
     def __init__(self, name: str, type_info: TypeInfo, 
                  is_constant: bool = False, value: Any = None):
         """
@@ -134,7 +218,16 @@ class Symbol:
 
 
 class SymbolTable:
-    """Symbol table for managing scopes and symbols."""
+    """
+    Symbol table for managing scopes and symbols.
+    
+    All scopes of a chain share one flat name -> symbol dict, so a lookup
+    is a single probe however deeply scopes are nested. Each scope notes
+    the bindings it shadows and puts them back in exit_scope(), so scopes
+    must be exited innermost first.
+    """
+    
+    __slots__ = ('symbols', 'parent', '_visible', '_shadowed')
     
     def __init__(self, parent: Optional['SymbolTable'] = None):
         """
@@ -145,6 +238,10 @@ class SymbolTable:
         """
         self.symbols = {}
         self.parent = parent
+        # Innermost symbol for every name, shared with the whole chain
+        self._visible = parent._visible if parent is not None else {}
+        # Name -> symbol it hid when first defined here (None if unbound)
+        self._shadowed = {}
     
     def define(self, name: str, type_info: TypeInfo, 
                is_constant: bool = False, value: Any = None) -> Symbol:
@@ -161,7 +258,10 @@ class SymbolTable:
             Created symbol
         """
         symbol = Symbol(name, type_info, is_constant, value)
+        if name not in self.symbols and self.parent is not None:
+            self._shadowed[name] = self._visible.get(name)
         self.symbols[name] = symbol
+        self._visible[name] = symbol
         return symbol
     
     def lookup(self, name: str) -> Optional[Symbol]:
@@ -174,11 +274,7 @@ class SymbolTable:
         Returns:
             Symbol if found, None otherwise
         """
-        if name in self.symbols:
-            return self.symbols[name]
-        elif self.parent:
-            return self.parent.lookup(name)
-        return None
+        return self._visible.get(name)
     
     def lookup_local(self, name: str) -> Optional[Symbol]:
         """
@@ -198,6 +294,14 @@ class SymbolTable:
     
     def exit_scope(self) -> Optional['SymbolTable']:
         """Exit current scope."""
+        # Undo this scope's bindings in the shared dict
+        visible = self._visible
+        for name, previous in self._shadowed.items():
+            if previous is None:
+                del visible[name]
+            else:
+                visible[name] = previous
+        self._shadowed = {}
         return self.parent
 
 
@@ -214,6 +318,20 @@ class Lambda3TypeChecker:
         self.symbol_table = SymbolTable()
         self.errors = []
         self.warnings = []
+        
+        # Node checkers keyed by node type
+        self._checkers = {
+            "LITERAL": self._check_literal,
+            "IDENTIFIER": self._check_identifier,
+            "BINARY_OP": self._check_binary_op,
+            "UNARY_OP": self._check_unary_op,
+            "FUNCTION_CALL": self._check_function_call,
+            "LAMBDA": self._check_lambda,
+            "IF_EXPR": self._check_if_expr,
+            "LET_STMT": self._check_let_stmt,
+            "FUNCTION_DECL": self._check_function_decl,
+            "PROGRAM": self._check_program,
+        }
     
     def check_types(self, ast: ASTNode) -> ASTNode:
         """
@@ -245,45 +363,27 @@ class Lambda3TypeChecker:
         Returns:
             Type information for the node
         """
-        if node.node_type == "LITERAL":
-            return self._check_literal(node)
-        elif node.node_type == "IDENTIFIER":
-            return self._check_identifier(node)
-        elif node.node_type == "BINARY_OP":
-            return self._check_binary_op(node)
-        elif node.node_type == "UNARY_OP":
-            return self._check_unary_op(node)
-        elif node.node_type == "FUNCTION_CALL":
-            return self._check_function_call(node)
-        elif node.node_type == "LAMBDA":
-            return self._check_lambda(node)
-        elif node.node_type == "IF_EXPR":
-            return self._check_if_expr(node)
-        elif node.node_type == "LET_STMT":
-            return self._check_let_stmt(node)
-        elif node.node_type == "FUNCTION_DECL":
-            return self._check_function_decl(node)
-        elif node.node_type == "PROGRAM":
-            return self._check_program(node)
-        else:
-            return TypeInfo(TernaryType.UNKNOWN)
+        checker = self._checkers.get(node.node_type)
+        if checker is None:
+            return TypeInfo.of(TernaryType.UNKNOWN)
+        return checker(node)
     
     def _check_literal(self, node: LiteralNode) -> TypeInfo:
         """Check literal node."""
         if node.literal_type == "integer":
-            return TypeInfo(TernaryType.INTEGER)
+            return TypeInfo.of(TernaryType.INTEGER)
         elif node.literal_type == "float":
-            return TypeInfo(TernaryType.FLOAT)
+            return TypeInfo.of(TernaryType.FLOAT)
         elif node.literal_type == "string":
-            return TypeInfo(TernaryType.STRING)
+            return TypeInfo.of(TernaryType.STRING)
         elif node.literal_type == "boolean":
-            return TypeInfo(TernaryType.BOOLEAN)
+            return TypeInfo.of(TernaryType.BOOLEAN)
         elif node.literal_type == "trit":
-            return TypeInfo(TernaryType.TRIT)
+            return TypeInfo.of(TernaryType.TRIT)
         elif node.literal_type == "tritarray":
-            return TypeInfo(TernaryType.TRITARRAY)
+            return TypeInfo.of(TernaryType.TRITARRAY)
         else:
-            return TypeInfo(TernaryType.UNKNOWN)
+            return TypeInfo.of(TernaryType.UNKNOWN)
     
     def _check_identifier(self, node: IdentifierNode) -> TypeInfo:
         """Check identifier node."""
@@ -292,56 +392,36 @@ class Lambda3TypeChecker:
             return symbol.type_info
         else:
             self.errors.append(f"Undefined variable: {node.value}")
-            return TypeInfo(TernaryType.ERROR)
+            return TypeInfo.of(TernaryType.ERROR)
     
     def _check_binary_op(self, node: BinaryOpNode) -> TypeInfo:
         """Check binary operation node."""
         left_type = self._check_node(node.left)
         right_type = self._check_node(node.right)
         
-        # Check for type compatibility
-        if not left_type.is_compatible_with(right_type):
+        # Check compatibility and determine the result type in one lookup
+        result_type = _binary_op_type(node.operator, left_type.type_name, right_type.type_name)
+        if result_type is None:
             self.errors.append(f"Type mismatch in binary operation: {left_type} {node.operator} {right_type}")
-            return TypeInfo(TernaryType.ERROR)
+            return TypeInfo.of(TernaryType.ERROR)
         
-        # Determine result type based on operation
-        if node.operator in ["+", "-", "*", "/", "%", "^"]:
-            # Arithmetic operations
-            if left_type.type_name == TernaryType.FLOAT or right_type.type_name == TernaryType.FLOAT:
-                return TypeInfo(TernaryType.FLOAT)
-            elif left_type.type_name == TernaryType.TRITARRAY or right_type.type_name == TernaryType.TRITARRAY:
-                return TypeInfo(TernaryType.TRITARRAY)
-            elif left_type.type_name == TernaryType.TRIT or right_type.type_name == TernaryType.TRIT:
-                return TypeInfo(TernaryType.TRIT)
-            else:
-                return TypeInfo(TernaryType.INTEGER)
-        elif node.operator in ["==", "!=", "<", "<=", ">", ">="]:
-            # Comparison operations
-            return TypeInfo(TernaryType.BOOLEAN)
-        elif node.operator in ["&&", "||", "&", "|", "^", "->", "?", "!&"]:
-            # Logical operations
-            if left_type.type_name == TernaryType.TRITARRAY or right_type.type_name == TernaryType.TRITARRAY:
-                return TypeInfo(TernaryType.TRITARRAY)
-            else:
-                return TypeInfo(TernaryType.TRIT)
-        else:
-            return TypeInfo(TernaryType.UNKNOWN)
+        return TypeInfo.of(result_type)
     
     def _check_unary_op(self, node: UnaryOpNode) -> TypeInfo:
         """Check unary operation node."""
         operand_type = self._check_node(node.operand)
         
-        if node.operator in ["-", "~"]:
+        if node.operator in _NEGATION_OPS:
             # Arithmetic/logic negation
             return operand_type
         elif node.operator == "!":
             # Logical negation
             if operand_type.type_name == TernaryType.BOOLEAN:
-                return TypeInfo(TernaryType.BOOLEAN)
+                return TypeInfo.of(TernaryType.BOOLEAN)
             else:
-                return TypeInfo(TernaryType.TRIT)
+                return TypeInfo.of(TernaryType.TRIT)
         else:
-            return TypeInfo(TernaryType.UNKNOWN)
+            return TypeInfo.of(TernaryType.UNKNOWN)
     
     def _check_function_call(self, node: FunctionCallNode) -> TypeInfo:
         """Check function call node."""
@@ -349,46 +429,57 @@ class Lambda3TypeChecker:
         
         if not function_type.is_function():
             self.errors.append(f"Cannot call non-function: {function_type}")
-            return TypeInfo(TernaryType.ERROR)
+            return TypeInfo.of(TernaryType.ERROR)
         
         # Check argument types
         if len(node.arguments) != len(function_type.parameter_types):
             self.errors.append(f"Argument count mismatch: expected {len(function_type.parameter_types)}, got {len(node.arguments)}")
-            return TypeInfo(TernaryType.ERROR)
+            return TypeInfo.of(TernaryType.ERROR)
         
         for i, (arg, param_type) in enumerate(zip(node.arguments, function_type.parameter_types)):
             arg_type = self._check_node(arg)
             if not arg_type.is_compatible_with(param_type):
                 self.errors.append(f"Argument {i+1} type mismatch: expected {param_type}, got {arg_type}")
         
-        return function_type.return_type or TypeInfo(TernaryType.VOID)
+        return function_type.return_type or TypeInfo.of(TernaryType.VOID)
     
-    def _check_lambda(self, node: LambdaNode) -> TypeInfo:
-        """Check lambda node."""
-        # Enter new scope
-        old_table = self.symbol_table
-        self.symbol_table = self.symbol_table.enter_scope()
-        
-        # Add parameters to scope
-        parameter_types = []
-        for param in node.parameters:
-            param_type = TypeInfo(TernaryType.UNKNOWN)  # Infer from usage
-            self.symbol_table.define(param, param_type)
-            parameter_types.append(param_type)
-        
-        # Check body
-        body_type = self._check_node(node.body)
+    def _check_scoped_body(self, parameters: List[str], body: ASTNode) -> TypeInfo:
+        """
+        Check a function body in a new scope binding its parameters.
         
-        # Restore scope
-        self.symbol_table = old_table
+        Returns:
+            Function type built from the parameters and body type
+        """
+        # Enter new scope; only the table reference is saved, the
+        # enclosing scopes are shared rather than copied
+        old_table = self.symbol_table
+        scope = self.symbol_table = old_table.enter_scope()
+        try:
+            # Add parameters to scope
+            parameter_types = []
+            for param in parameters:
+                param_type = TypeInfo.of(TernaryType.UNKNOWN)  # Infer from usage
+                self.symbol_table.define(param, param_type)
+                parameter_types.append(param_type)
+            
+            # Check body
+            body_type = self._check_node(body)
+        finally:
+            # Restore scope even if checking the body raised
+            scope.exit_scope()
+            self.symbol_table = old_table
         
         return TypeInfo(TernaryType.FUNCTION, parameter_types=parameter_types, return_type=body_type)
     
+    def _check_lambda(self, node: LambdaNode) -> TypeInfo:
+        """Check lambda node."""
+        return self._check_scoped_body(node.parameters, node.body)
+    
     def _check_if_expr(self, node: IfExprNode) -> TypeInfo:
         """Check if expression node."""
         condition_type = self._check_node(node.condition)
         
-        if condition_type.type_name not in [TernaryType.BOOLEAN, TernaryType.TRIT]:
+        if condition_type.type_name not in _CONDITION_TYPES:
             self.warnings.append(f"Condition should be boolean or trit, got {condition_type}")
         
         then_type = self._check_node(node.then_expr)
@@ -397,7 +488,7 @@ class Lambda3TypeChecker:
             else_type = self._check_node(node.else_expr)
             if not then_type.is_compatible_with(else_type):
                 self.errors.append(f"Type mismatch in if-else: then {then_type}, else {else_type}")
-                return TypeInfo(TernaryType.ERROR)
+                return TypeInfo.of(TernaryType.ERROR)
             return then_type
         else:
             return then_type
@@ -414,29 +505,13 @@ class Lambda3TypeChecker:
         if node.body:
             return self._check_node(node.body)
         else:
-            return TypeInfo(TernaryType.VOID)
+            return TypeInfo.of(TernaryType.VOID)
     
     def _check_function_decl(self, node: FunctionDeclNode) -> TypeInfo:
         """Check function declaration node."""
-        # Enter new scope
-        old_table = self.symbol_table
-        self.symbol_table = self.symbol_table.enter_scope()
-        
-        # Add parameters to scope
-        parameter_types = []
-        for param in node.parameters:
-            param_type = TypeInfo(TernaryType.UNKNOWN)  # Infer from usage
-            self.symbol_table.define(param, param_type)
-            parameter_types.append(param_type)
-        
-        # Check body
-        body_type = self._check_node(node.body)
-        
-        # Create function type
-        function_type = TypeInfo(TernaryType.FUNCTION, parameter_types=parameter_types, return_type=body_type)
+        function_type = self._check_scoped_body(node.parameters, node.body)
         
         # Define function in outer scope
-        self.symbol_table = old_table
         self.symbol_table.define(node.name, function_type)
         
         return function_type
@@ -446,7 +521,7 @@ class Lambda3TypeChecker:
         for stmt in node.children:
             self._check_node(stmt)
         
-        return TypeInfo(TernaryType.VOID)
+        return TypeInfo.of(TernaryType.VOID)
     
     def get_errors(self) -> List[str]:
         """Get type checking errors."""
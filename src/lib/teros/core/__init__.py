@@ -9,11 +9,21 @@ This module provides the fundamental building blocks for ternary computing:
 - T3_Instruction: T3-ISA instruction format
 """
 
-from .trit import Trit
-from .tritarray import TritArray
-from .ternary_memory import TernaryMemory
-from .t3_pcb import T3_PCB
-from .t3_instruction import T3_Instruction
+from .lazy_exports import lazy_exports
+
+# Exported name -> defining submodule. Submodules are imported on first
+# access, so importing one of them (e.g. core.trit) does not also load
+# the others and their dependencies (NumPy for TernaryMemory)
+_EXPORTS = {
+    "Trit": ".trit",
+    "TritArray": ".tritarray",
+    "TernaryMemory": ".ternary_memory",
+    "T3_PCB": ".t3_pcb",
+    "T3_Instruction": ".t3_instruction",
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
+
 
 __all__ = [
     "Trit",
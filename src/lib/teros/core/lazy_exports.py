@@ -0,0 +1,39 @@
+"""
+Lazy exports - Package attributes imported on first access.
+
+A package lists the names it re-exports with the submodule defining each;
+the submodule is imported when the name is first looked up (PEP 562), so
+importing the package, or one of its submodules, does not load the rest.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(namespace: Dict[str, Any],
+                 exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a package's module __getattr__ and __dir__.
+    
+    Args:
+        namespace: The package's globals()
+        exports: Exported name -> defining submodule, relative to the package
+        
+    Returns:
+        (__getattr__, __dir__) to bind in the package namespace
+    """
+    package = namespace["__name__"]
+    
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        # Later lookups find the name without going through __getattr__
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__
@@ -28,6 +28,13 @@ class T3_Instruction:
     REGISTER_SIZE = 3
     IMMEDIATE_SIZE = 15
     
+    # Trit offset of each field within an encoded instruction
+    OPCODE_OFFSET = 0
+    REG1_OFFSET = OPCODE_OFFSET + OPCODE_SIZE
+    REG2_OFFSET = REG1_OFFSET + REGISTER_SIZE
+    REG3_OFFSET = REG2_OFFSET + REGISTER_SIZE
+    IMMEDIATE_OFFSET = REG3_OFFSET + REGISTER_SIZE
+    
     # Opcode definitions
     # Data Movement Instructions
     LOAD = 0b000  # 0
@@ -129,33 +136,13 @@ class T3_Instruction:
     
     def encode(self) -> TritArray:
         """Encode instruction as TritArray."""
-        # Create 27-trit instruction
-        instruction = TritArray([0] * self.INSTRUCTION_SIZE)
-        
-        # Encode opcode (3 trits)
-        opcode_trits = self._encode_value(self.opcode, self.OPCODE_SIZE)
-        for i in range(self.OPCODE_SIZE):
-            instruction[i] = opcode_trits[i]
-        
-        # Encode registers (3 trits each)
-        reg1_trits = self._encode_value(self.reg1, self.REGISTER_SIZE)
-        for i in range(self.REGISTER_SIZE):
-            instruction[i + self.OPCODE_SIZE] = reg1_trits[i]
-        
-        reg2_trits = self._encode_value(self.reg2, self.REGISTER_SIZE)
-        for i in range(self.REGISTER_SIZE):
-            instruction[i + self.OPCODE_SIZE + self.REGISTER_SIZE] = reg2_trits[i]
-        
-        reg3_trits = self._encode_value(self.reg3, self.REGISTER_SIZE)
-        for i in range(self.REGISTER_SIZE):
-            instruction[i + self.OPCODE_SIZE + 2 * self.REGISTER_SIZE] = reg3_trits[i]
-        
-        # Encode immediate/address (15 trits)
-        immediate_trits = self._encode_value(self.immediate.to_decimal(), self.IMMEDIATE_SIZE)
-        for i in range(self.IMMEDIATE_SIZE):
-            instruction[i + self.OPCODE_SIZE + 3 * self.REGISTER_SIZE] = immediate_trits[i]
-        
-        return instruction
+        # Fixed-width fields, concatenated in layout order (27 trits)
+        trits = (self._encode_value(self.opcode, self.OPCODE_SIZE)
+                 + self._encode_value(self.reg1, self.REGISTER_SIZE)
+                 + self._encode_value(self.reg2, self.REGISTER_SIZE)
+                 + self._encode_value(self.reg3, self.REGISTER_SIZE)
+                 + self._encode_value(self.immediate.to_decimal(), self.IMMEDIATE_SIZE))
+        return TritArray(trits)
     
     @classmethod
     def decode(cls, instruction: TritArray) -> 'T3_Instruction':
@@ -163,60 +150,19 @@ class T3_Instruction:
         if len(instruction) != cls.INSTRUCTION_SIZE:
             raise ValueError(f"Invalid instruction size: {len(instruction)}")
         
-        # Decode opcode
-        opcode_trits = [instruction[i] for i in range(cls.OPCODE_SIZE)]
-        opcode = cls._decode_value(opcode_trits)
-        
-        # Decode registers
-        reg1_trits = [instruction[i] for i in range(cls.OPCODE_SIZE, cls.OPCODE_SIZE + cls.REGISTER_SIZE)]
-        reg1 = cls._decode_value(reg1_trits)
-        
-        reg2_trits = [instruction[i] for i in range(cls.OPCODE_SIZE + cls.REGISTER_SIZE, 
-                                                    cls.OPCODE_SIZE + 2 * cls.REGISTER_SIZE)]
-        reg2 = cls._decode_value(reg2_trits)
-        
-        reg3_trits = [instruction[i] for i in range(cls.OPCODE_SIZE + 2 * cls.REGISTER_SIZE,
-                                                   cls.OPCODE_SIZE + 3 * cls.REGISTER_SIZE)]
-        reg3 = cls._decode_value(reg3_trits)
-        
-        # Decode immediate/address
-        immediate_trits = [instruction[i] for i in range(cls.OPCODE_SIZE + 3 * cls.REGISTER_SIZE,
-                                                          cls.INSTRUCTION_SIZE)]
-        immediate = cls._decode_value(immediate_trits)
+        # Every field sits at a fixed offset, so each is a single slice
+        trits = instruction._trits
+        opcode = cls._decode_value(trits[cls.OPCODE_OFFSET:cls.REG1_OFFSET])
+        reg1 = cls._decode_value(trits[cls.REG1_OFFSET:cls.REG2_OFFSET])
+        reg2 = cls._decode_value(trits[cls.REG2_OFFSET:cls.REG3_OFFSET])
+        reg3 = cls._decode_value(trits[cls.REG3_OFFSET:cls.IMMEDIATE_OFFSET])
+        immediate = cls._decode_value(trits[cls.IMMEDIATE_OFFSET:cls.INSTRUCTION_SIZE])
         
         return cls(opcode, reg1, reg2, reg3, immediate)
     
     def _encode_value(self, value: int, size: int) -> List[int]:
-        """Encode a value as trits."""
-        # Convert to balanced ternary
-        trits = []
-        abs_value = abs(value)
-        
-        while abs_value > 0:
-            trits.append(abs_value % 3)
-            abs_value //= 3
-        
-        # Convert to balanced ternary (-1, 0, 1)
-        for i in range(len(trits)):
-            if trits[i] == 2:
-                trits[i] = -1
-                if i + 1 < len(trits):
-                    trits[i + 1] += 1
-                else:
-                    trits.append(1)
-        
-        # Pad to required size
-        while len(trits) < size:
-            trits.append(0)
-        
-        # Truncate if too long
-        trits = trits[:size]
-        
-        # Handle negative values
-        if value < 0:
-            trits = [-t for t in trits]
-        
-        return trits
+        """Encode a value as a fixed-width field of balanced trits."""
+        return TritArray(value, size)._trits
     
     @staticmethod
     def _decode_value(trits: List[int]) -> int:
@@ -137,19 +137,15 @@ class TernaryMemory:
         if not self.is_valid_address(address) or not self.is_valid_address(address + size - 1):
             raise IndexError(f"Invalid memory range: {address} to {address + size - 1}")
         
-        trits = []
-        for i in range(size):
-            trits.append(int(self.memory[address + i]))
-        
-        return TritArray(trits)
+        return TritArray(self.memory[address:address + size].tolist())
     
     def store_tritarray(self, address: int, tritarray: TritArray) -> None:
         """Store a TritArray to memory."""
         if not self.is_valid_address(address) or not self.is_valid_address(address + len(tritarray) - 1):
             raise IndexError(f"Invalid memory range: {address} to {address + len(tritarray) - 1}")
         
-        for i, trit in enumerate(tritarray):
-            self.memory[address + i] = trit.value
+        # One slice copy into the int8 buffer, no per-trit Trit objects
+        self.memory[address:address + len(tritarray)] = tritarray._trits
     
     def load_bytes(self, address: int, size: int) -> bytes:
         """Load bytes from memory (for binary compatibility)."""
@@ -172,6 +168,15 @@ class TernaryMemory:
         size = segment['size']
         self.memory[start:start + size] = 0
     
+    def clear_range(self, address: int, size: int) -> None:
+        """Set a range of trits to 0 in one operation."""
+        if size <= 0:
+            return
+        if not self.is_valid_address(address) or not self.is_valid_address(address + size - 1):
+            raise IndexError(f"Invalid memory range: {address} to {address + size - 1}")
+        
+        self.memory[address:address + size] = 0
+    
     def clear_all(self) -> None:
         """Clear all memory."""
         self.memory.fill(0)
@@ -10,7 +10,6 @@ This is the fundamental building block for all ternary operations in TEROS.
 """
 
 from typing import Union, Optional
-import numpy as np
 
 
 class Trit:
@@ -23,6 +22,8 @@ class Trit:
     - 1: Positive/True
     """
     
+    __slots__ = ('_value',)
+    
     # Valid ternary values
     NEGATIVE = -1
     NEUTRAL = 0
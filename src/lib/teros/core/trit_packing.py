@@ -0,0 +1,63 @@
+"""
+Trit packing - Dense byte encoding for balanced trits.
+
+Trits are packed 5 per byte as a base-3 number (3^5 = 243 <= 256), each
+trit stored as the digit trit + 1. The first trit of a group is the most
+significant digit, so a byte reads left to right like its trits. A short
+final group is padded with 0 trits.
+"""
+
+from typing import List, Sequence
+
+
+TRITS_PER_PACKED_BYTE = 5
+
+# Trit digits of every packed byte value (most significant first)
+_UNPACKED_BYTES = [
+    tuple((value // 3 ** shift) % 3 - 1 for shift in (4, 3, 2, 1, 0))
+    for value in range(3 ** TRITS_PER_PACKED_BYTE)
+]
+
+
+def pack_trits(trits: Sequence[int]) -> bytes:
+    """
+    Pack balanced trits 5 per byte.
+    
+    Args:
+        trits: Trit values (-1, 0 or 1)
+        
+    Returns:
+        Packed bytes (ceil(len(trits) / 5) of them)
+    """
+    out = bytearray()
+    for i in range(0, len(trits), TRITS_PER_PACKED_BYTE):
+        group = trits[i:i + TRITS_PER_PACKED_BYTE]
+        value = 0
+        for trit in group:
+            value = value * 3 + trit + 1
+        for _ in range(TRITS_PER_PACKED_BYTE - len(group)):
+            value = value * 3 + 1
+        out.append(value)
+    return bytes(out)
+
+
+def unpack_trits(data: bytes) -> List[int]:
+    """
+    Unpack bytes produced by pack_trits.
+    
+    Args:
+        data: Packed bytes
+        
+    Returns:
+        Trit values, including any padding trits of the last byte
+        
+    Raises:
+        ValueError: If a byte is not a valid 5-trit group
+    """
+    trits = []
+    try:
+        for value in data:
+            trits.extend(_UNPACKED_BYTES[value])
+    except IndexError:
+        raise ValueError("Invalid packed trit byte")
+    return trits
@@ -5,11 +5,61 @@ A TritArray represents a multi-trit number in ternary arithmetic,
 similar to how binary numbers work but with base-3 arithmetic.
 """
 
-from typing import Union, List, Optional, Iterator
-import numpy as np
+from typing import Union, List, Optional, Iterator, Tuple
+from functools import lru_cache
 from .trit import Trit
 
 
+# Balanced digits of every base-243 chunk (5 trits, least significant first),
+# offset by one so that chunk value 0 is -1-1-1-1-1
+_CHUNK_DIGITS = [
+    tuple((value // 3 ** shift) % 3 - 1 for shift in range(5))
+    for value in range(3 ** 5)
+]
+
+
+@lru_cache(maxsize=4096)
+def _balanced_digits(value: int) -> Tuple[int, ...]:
+    """
+    Convert an integer to balanced ternary digits, least significant first.
+    
+    Results are cached, so the returned tuple is shared; copy it before
+    mutating.
+    
+    Adding (3^k - 1) / 2 shifts every balanced digit up by one, so the
+    digits are the plain base-3 digits of the shifted value minus one and
+    no carry chain is needed; they are peeled off five at a time with one
+    divmod per chunk and a table lookup.
+    """
+    # 3^5 > 2^7, so each chunk covers at least 7 bits of the magnitude
+    chunks = (abs(value).bit_length() + 2) // 7 + 1
+    shifted = value + (3 ** (5 * chunks) - 1) // 2
+    trits = []
+    for _ in range(chunks):
+        shifted, chunk = divmod(shifted, 243)
+        trits.extend(_CHUNK_DIGITS[chunk])
+    while trits and trits[-1] == 0:
+        trits.pop()
+    return tuple(trits)
+
+
+# Base-3 digit character of each balanced trit, offset by one
+_OFFSET_DIGIT = {-1: '0', 0: '1', 1: '2'}
+
+
+def _balanced_value(trits: List[int]) -> int:
+    """
+    Convert balanced ternary digits (least significant first) to an integer.
+    
+    Inverse of _balanced_digits: the digits plus one are parsed as a plain
+    base-3 numeral by int(), then the (3^k - 1) / 2 offset is removed.
+    """
+    if not trits:
+        return 0
+    numeral = ''.join(map(_OFFSET_DIGIT.__getitem__, reversed(trits)))
+    return int(numeral, 3) - (3 ** len(trits) - 1) // 2
+
+
 class TritArray:
     """
     Multi-trit number implementation for ternary arithmetic.
@@ -36,7 +86,8 @@ class TritArray:
         elif isinstance(trits, str):
             self._trits = self._from_string(trits, size)
         elif isinstance(trits, (list, tuple)):
-            self._trits = [int(t) if isinstance(t, Trit) else int(t) for t in trits]
+            # int() covers Trit through __int__, no per-trit type check needed
+            self._trits = [int(t) for t in trits]
             self._validate_trits()
         else:
             raise ValueError(f"Invalid input type: {type(trits)}")
@@ -44,6 +95,19 @@ class TritArray:
         if size is not None and len(self._trits) != size:
             self._resize(size)
     
+    @classmethod
+    def _wrap(cls, trits: List[int]) -> 'TritArray':
+        """
+        Adopt an already valid list of trit ints without copying it.
+        
+        The caller hands over ownership of the list, so results of the
+        arithmetic below skip the per-trit conversion and validation of
+        the public constructor.
+        """
+        instance = object.__new__(cls)
+        instance._trits = trits
+        return instance
+    
     def _validate_trits(self) -> None:
         """Validate that all trits are valid ternary values."""
         for i, trit in enumerate(self._trits):
@@ -55,43 +119,7 @@ class TritArray:
         if value == 0:
             return [0] if size is None else [0] * size
         
-        trits = []
-        abs_value = abs(value)
-        
-        # Convert to base-3
-        while abs_value > 0:
-            trits.append(abs_value % 3)
-            abs_value //= 3
-        
-        # Convert to balanced ternary (-1, 0, 1)
-        i = 0
-        while i < len(trits):
-            if trits[i] == 2:
-                trits[i] = -1
-                if i + 1 < len(trits):
-                    trits[i + 1] += 1
-                else:
-                    trits.append(1)
-            elif trits[i] == 3:
-                trits[i] = 0
-                if i + 1 < len(trits):
-                    trits[i + 1] += 1
-                else:
-                    trits.append(1)
-            elif trits[i] > 3:
-                remainder = trits[i] % 3
-                carry = trits[i] // 3
-                trits[i] = remainder
-                if i + 1 < len(trits):
-                    trits[i + 1] += carry
-                else:
-                    trits.append(carry)
-            else:
-                i += 1
-        
-        # Handle negative numbers
-        if value < 0:
-            trits = [-t for t in trits]
+        trits = list(_balanced_digits(value))
         
         # Pad to size if specified
         if size is not None:
@@ -232,79 +260,69 @@ class TritArray:
     
     def __neg__(self) -> 'TritArray':
         """Unary negation."""
-        return TritArray([-t for t in self._trits])
+        return TritArray._wrap([-t for t in self._trits])
     
     def __abs__(self) -> 'TritArray':
         """Absolute value."""
-        return TritArray([abs(t) for t in self._trits])
+        return TritArray._wrap([abs(t) for t in self._trits])
     
     def _ternary_add(self, other: 'TritArray') -> 'TritArray':
-        """Ternary addition with carry."""
-        max_len = max(len(self), len(other))
-        result = []
-        carry = 0
-        
-        for i in range(max_len):
-            a = self._trits[i] if i < len(self) else 0
-            b = other._trits[i] if i < len(other) else 0
-            
-            # Ternary addition with carry
-            sum_val = a + b + carry
-            if sum_val > 1:
-                result.append(sum_val - 3)
-                carry = 1
-            elif sum_val < -1:
-                result.append(sum_val + 3)
-                carry = -1
-            else:
-                result.append(sum_val)
-                carry = 0
-        
-        if carry != 0:
-            result.append(carry)
+        """
+        Ternary addition with carry.
         
-        return TritArray(result)
+        Both operands are packed into Python integers so the whole carry
+        chain runs as a single bigint addition; the sum keeps at least the
+        width of the longer operand.
+        """
+        max_len = max(len(self), len(other))
+        total = _balanced_value(self._trits) + _balanced_value(other._trits)
+        result = list(_balanced_digits(total))
+        if len(result) < max_len:
+            result.extend([0] * (max_len - len(result)))
+        return TritArray._wrap(result)
     
     def _ternary_sub(self, other: 'TritArray') -> 'TritArray':
         """Ternary subtraction with borrow."""
         return self._ternary_add(-other)
     
     def _ternary_mul(self, other: 'TritArray') -> 'TritArray':
-        """Ternary multiplication."""
-        result = TritArray(0)
+        """
+        Ternary multiplication.
         
-        for i, trit in enumerate(other._trits):
-            if trit != 0:
-                partial = self._shift_left(i)
-                if trit == -1:
-                    partial = -partial
-                result = result._ternary_add(partial)
+        Multiplies the packed operands as Python integers instead of
+        summing one shifted partial product per trit; the product keeps
+        the width of the widest partial product.
+        """
+        width = 1
+        for i in range(len(other._trits) - 1, -1, -1):
+            if other._trits[i] != 0:
+                width = len(self._trits) + i
+                break
         
-        return result
+        product = _balanced_value(self._trits) * _balanced_value(other._trits)
+        result = list(_balanced_digits(product))
+        if len(result) < width:
+            result.extend([0] * (width - len(result)))
+        return TritArray._wrap(result)
     
     def _shift_left(self, positions: int) -> 'TritArray':
         """Left shift by specified positions."""
         if positions == 0:
-            return TritArray(self._trits.copy())
+            return TritArray._wrap(self._trits.copy())
         
-        result = [0] * positions + self._trits
-        return TritArray(result)
+        return TritArray._wrap([0] * positions + self._trits)
     
     def _shift_right(self, positions: int) -> 'TritArray':
         """Right shift by specified positions."""
         if positions >= len(self._trits):
             return TritArray(0)
         
-        result = self._trits[positions:]
-        return TritArray(result)
+        return TritArray._wrap(self._trits[positions:])
     
     # Conversion methods
     def to_decimal(self) -> int:
         """Convert to decimal integer."""
-        result = 0
-        for i, trit in enumerate(self._trits):
-            result += trit * (3 ** i)
-        return result
+        return _balanced_value(self._trits)
     
     def to_binary(self) -> int:
         """Convert to binary representation."""
@@ -344,20 +362,18 @@ class TritArray:
         if last_nonzero < 0:
             return TritArray(0)
         
-        return TritArray(self._trits[:last_nonzero + 1])
+        return TritArray._wrap(self._trits[:last_nonzero + 1])
     
     def pad(self, size: int, value: int = 0) -> 'TritArray':
         """Pad the array to the specified size."""
         if size <= len(self._trits):
-            return TritArray(self._trits.copy())
+            return TritArray._wrap(self._trits.copy())
         
-        result = self._trits.copy()
-        result.extend([value] * (size - len(self._trits)))
-        return TritArray(result)
+        return TritArray(self._trits + [value] * (size - len(self._trits)))
     
     def reverse(self) -> 'TritArray':
         """Reverse the order of trits."""
-        return TritArray(list(reversed(self._trits)))
+        return TritArray._wrap(self._trits[::-1])
     
     # Class methods
     @classmethod
@@ -377,6 +393,11 @@ class TritArray:
         """Create TritArray from decimal value."""
         return cls(value, size)
     
+    @classmethod
+    def from_int(cls, value: int, size: Optional[int] = None) -> 'TritArray':
+        """Create TritArray from integer value (alias of from_decimal)."""
+        return cls.from_decimal(value, size)
+    
     @classmethod
     def from_binary(cls, value: int, size: Optional[int] = None) -> 'TritArray':
         """Create TritArray from binary value."""
@@ -28,6 +28,12 @@ class AllocationStrategy(Enum):
     BUDDY = "buddy"
 
 
+# Pool addresses encode ((pool ordinal + 1) << _POOL_SHIFT) | block index
+_POOL_SHIFT = 24
+_POOL_TYPES = list(PoolType)
+_POOL_ORDINALS = {pool_type: ordinal for ordinal, pool_type in enumerate(_POOL_TYPES)}
+
+
 class TernaryMemoryPool:
     """
     Ternary Memory Pool - Manages memory allocation for ternary objects.
@@ -55,8 +61,7 @@ class TernaryMemoryPool:
             PoolType.HUGE: self._create_pool(PoolType.HUGE, 2048, 50)
         }
         
-        # Allocation tracking
-        self.allocations = {}  # address -> allocation_info
+        # Allocation tracking (per-block columns live in each pool)
         self.free_blocks = {}  # pool_type -> List[free_blocks]
         self.used_blocks = {}  # pool_type -> Set[used_addresses]
         
@@ -70,7 +75,7 @@ class TernaryMemoryPool:
         }
         
         # Threading
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()  # garbage_collect re-enters deallocate
         
         # Statistics
         self.stats = {
@@ -88,11 +93,24 @@ class TernaryMemoryPool:
             'type': pool_type,
             'block_size': block_size,
             'num_blocks': num_blocks,
-            'blocks': [None] * num_blocks,
-            'free_list': list(range(num_blocks)),
-            'used_set': set()
+            'blocks': [None] * num_blocks,  # object size per used block
+            'allocated_at': [0.0] * num_blocks,
+            'bitmap': bytearray((num_blocks + 7) // 8),  # bit set = block used
+            'used_count': 0
         }
     
+    @staticmethod
+    def _find_free_block(pool: Dict[str, Any]) -> Optional[int]:
+        """Find the lowest free block index, scanning 64 blocks per step."""
+        bitmap = pool['bitmap']
+        for offset in range(0, len(bitmap), 8):
+            used = int.from_bytes(bitmap[offset:offset + 8], 'little')
+            free = ~used & 0xFFFFFFFFFFFFFFFF
+            if free:
+                block_index = offset * 8 + (free & -free).bit_length() - 1
+                return block_index if block_index < pool['num_blocks'] else None
+        return None
+    
     def allocate(self, size: int, pool_type: PoolType = None) -> Optional[int]:
         """
         Allocate memory for ternary object.
@@ -119,9 +137,6 @@ class TernaryMemoryPool:
                 if address is None:
                     return None
                 
-                # Track allocation
-                self._track_allocation(address, size, pool_type)
-                
                 # Update statistics
                 self.stats['total_allocations'] += 1
                 self.stats['current_allocations'] += 1
@@ -146,21 +161,18 @@ class TernaryMemoryPool:
         """
         with self.lock:
             try:
-                if address not in self.allocations:
+                location = self._locate(address)
+                if location is None:
                     return False
                 
-                allocation = self.allocations[address]
-                pool_type = allocation['pool_type']
-                size = allocation['size']
+                pool_type, block_index = location
+                size = self.pools[pool_type]['blocks'][block_index]
                 
                 # Deallocate from pool
                 success = self._deallocate_from_pool(pool_type, address)
                 if not success:
                     return False
                 
-                # Remove from tracking
-                del self.allocations[address]
-                
                 # Update statistics
                 self.stats['total_deallocations'] += 1
                 self.stats['current_allocations'] -= 1
@@ -173,6 +185,32 @@ class TernaryMemoryPool:
                 print(f"Failed to deallocate memory: {e}")
                 return False
     
+    @property
+    def allocations(self) -> Dict[int, Dict[str, Any]]:
+        """Snapshot of live allocations as address -> allocation info."""
+        return {
+            self._calculate_address(pool_type, block_index): {
+                'size': size,
+                'pool_type': pool_type,
+                'allocated_at': pool['allocated_at'][block_index]
+            }
+            for pool_type, pool in self.pools.items()
+            for block_index, size in enumerate(pool['blocks'])
+            if size is not None
+        }
+    
+    def _locate(self, address: int) -> Optional[Tuple[PoolType, int]]:
+        """Decode an address into its pool type and block index."""
+        ordinal = (address >> _POOL_SHIFT) - 1
+        if not 0 <= ordinal < len(_POOL_TYPES):
+            return None
+        
+        pool_type = _POOL_TYPES[ordinal]
+        block_index = self._calculate_block_index(pool_type, address)
+        if block_index >= self.pools[pool_type]['num_blocks']:
+            return None
+        return pool_type, block_index
+    
     def _select_pool_type(self, size: int) -> PoolType:
         """Select appropriate pool type for size."""
         if size <= 8:
@@ -193,13 +231,16 @@ class TernaryMemoryPool:
         """Allocate memory from specific pool."""
         pool = self.pools[pool_type]
         
-        # Check if pool has free blocks
-        if not pool['free_list']:
+        # Find a free block
+        block_index = self._find_free_block(pool)
+        if block_index is None:
             return None
         
         # Allocate block
-        block_index = pool['free_list'].pop(0)
-        pool['used_set'].add(block_index)
+        pool['bitmap'][block_index >> 3] |= 1 << (block_index & 7)
+        pool['used_count'] += 1
+        pool['blocks'][block_index] = size
+        pool['allocated_at'][block_index] = time.time()
         
         # Calculate address
         address = self._calculate_address(pool_type, block_index)
@@ -213,36 +254,27 @@ class TernaryMemoryPool:
         # Calculate block index from address
         block_index = self._calculate_block_index(pool_type, address)
         
-        if block_index not in pool['used_set']:
+        if not 0 <= block_index < pool['num_blocks']:
+            return False
+        
+        bit = 1 << (block_index & 7)
+        if not pool['bitmap'][block_index >> 3] & bit:
             return False
         
         # Free block
-        pool['used_set'].remove(block_index)
-        pool['free_list'].append(block_index)
+        pool['bitmap'][block_index >> 3] &= ~bit
+        pool['used_count'] -= 1
+        pool['blocks'][block_index] = None
         
         return True
     
     def _calculate_address(self, pool_type: PoolType, block_index: int) -> int:
         """Calculate memory address from pool type and block index."""
-        # Simple address calculation - in real implementation,
-        # this would be more sophisticated
-        base_address = hash(pool_type.value) * 1000000
-        return base_address + (block_index * 1000)
+        return ((_POOL_ORDINALS[pool_type] + 1) << _POOL_SHIFT) | block_index
     
     def _calculate_block_index(self, pool_type: PoolType, address: int) -> int:
         """Calculate block index from memory address."""
-        # Simple block index calculation - in real implementation,
-        # this would be more sophisticated
-        base_address = hash(pool_type.value) * 1000000
-        return (address - base_address) // 1000
-    
-    def _track_allocation(self, address: int, size: int, pool_type: PoolType) -> None:
-        """Track memory allocation."""
-        self.allocations[address] = {
-            'size': size,
-            'pool_type': pool_type,
-            'allocated_at': time.time()
-        }
+        return address & ((1 << _POOL_SHIFT) - 1)
     
     def garbage_collect(self) -> Dict[str, int]:
         """
@@ -264,13 +296,16 @@ class TernaryMemoryPool:
                 memory_freed = 0
                 
                 for address in unreferenced:
-                    if address in self.allocations:
-                        allocation = self.allocations[address]
-                        size = allocation['size']
-                        
-                        if self.deallocate(address):
-                            objects_freed += 1
-                            memory_freed += size
+                    location = self._locate(address)
+                    if location is None:
+                        continue
+                    
+                    pool_type, block_index = location
+                    size = self.pools[pool_type]['blocks'][block_index]
+                    
+                    if size is not None and self.deallocate(address):
+                        objects_freed += 1
+                        memory_freed += size
                 
                 # Update GC statistics
                 self.gc_stats['collections'] += 1
@@ -293,11 +328,13 @@ class TernaryMemoryPool:
         # or reference counting to find unreferenced objects
         
         unreferenced = []
-        for address in self.allocations:
-            # Simple heuristic: objects older than 1 second are unreferenced
-            allocation = self.allocations[address]
-            if time.time() - allocation['allocated_at'] > 1.0:
-                unreferenced.append(address)
+        now = time.time()
+        for pool_type, pool in self.pools.items():
+            blocks = pool['blocks']
+            for block_index, allocated_at in enumerate(pool['allocated_at']):
+                # Simple heuristic: objects older than 1 second are unreferenced
+                if blocks[block_index] is not None and now - allocated_at > 1.0:
+                    unreferenced.append(self._calculate_address(pool_type, block_index))
         
         return unreferenced
     
@@ -322,8 +359,8 @@ class TernaryMemoryPool:
                     pool_type.value: {
                         'block_size': pool['block_size'],
                         'num_blocks': pool['num_blocks'],
-                        'free_blocks': len(pool['free_list']),
-                        'used_blocks': len(pool['used_set'])
+                        'free_blocks': pool['num_blocks'] - pool['used_count'],
+                        'used_blocks': pool['used_count']
                     }
                     for pool_type, pool in self.pools.items()
                 },
@@ -335,12 +372,10 @@ class TernaryMemoryPool:
         """Cleanup memory pool."""
         with self.lock:
             # Clear all allocations
-            self.allocations.clear()
-            
-            # Reset pools
             for pool in self.pools.values():
-                pool['free_list'] = list(range(pool['num_blocks']))
-                pool['used_set'].clear()
+                pool['bitmap'] = bytearray(len(pool['bitmap']))
+                pool['used_count'] = 0
+                pool['blocks'] = [None] * pool['num_blocks']
             
             # Reset statistics
             self.stats['current_allocations'] = 0
@@ -10,6 +10,7 @@ import struct
 import sys
 from enum import Enum
 from ..core.trit import Trit
+from ..core.trit_packing import pack_trits, unpack_trits
 
 
 class Endianness(Enum):
@@ -327,6 +328,40 @@ class TritCodec:
         else:
             return self.decoder.decode_bytes(data)
     
+    def pack(self, trits: List[Union[Trit, int]]) -> bytes:
+        """
+        Encode trits densely, 5 per byte (see core.trit_packing).
+        
+        Args:
+            trits: List of trit values
+            
+        Returns:
+            Packed bytes
+            
+        Raises:
+            ValueError: If a trit value is invalid
+        """
+        values = [trit.value if isinstance(trit, Trit) else trit for trit in trits]
+        if any(value not in (-1, 0, 1) for value in values):
+            raise ValueError("Invalid trit value in packed encoding")
+        return pack_trits(values)
+    
+    def unpack(self, data: bytes, trit_count: int = None) -> List[Trit]:
+        """
+        Decode trits packed by pack.
+        
+        Args:
+            data: Packed data to decode
+            trit_count: Expected number of trits (if None, decode all)
+            
+        Returns:
+            List of Trit objects
+        """
+        values = unpack_trits(data)
+        if trit_count is not None:
+            values = values[:trit_count]
+        return [Trit(value) for value in values]
+    
     def get_encoding_info(self) -> dict:
         """Get encoding information."""
         return {
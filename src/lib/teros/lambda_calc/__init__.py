@@ -3,8 +3,8 @@ TEROS Lambda Integration
 Python wrapper for native lambda engine
 """
 
-from .tvm_backend import LambdaTerm, lambda_reduce, lambda_parse
+from .tvm_backend import LambdaTerm, TermArena, lambda_reduce, lambda_reduce_many, lambda_parse
 from .lambda_repl import LambdaREPL
 
-__all__ = ['LambdaTerm', 'lambda_reduce', 'lambda_parse', 'LambdaREPL']
+__all__ = ['LambdaTerm', 'TermArena', 'lambda_reduce', 'lambda_reduce_many', 'lambda_parse', 'LambdaREPL']
 
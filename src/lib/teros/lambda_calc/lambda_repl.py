@@ -2,8 +2,11 @@
 Lambda REPL - Interactive Lambda Calculus REPL for TESH
 """
 
+import sys
+from collections import ChainMap, OrderedDict
+
 from .tvm_backend import (
-    LambdaTerm, lambda_reduce, lambda_parse,
+    LambdaTerm, TermArena, lambda_reduce, lambda_reduce_many, lambda_parse,
     church_numeral, church_boolean,
     COMBINATOR_I, COMBINATOR_K, COMBINATOR_S,
     CHURCH_ZERO, CHURCH_ONE, CHURCH_TWO,
@@ -11,48 +14,90 @@ from .tvm_backend import (
 )
 
 
+# Standard library preloaded into every REPL
+PREDEFINED = {
+    ':0': CHURCH_ZERO,
+    ':1': CHURCH_ONE,
+    ':2': CHURCH_TWO,
+    ':3': church_numeral(3),
+    ':4': church_numeral(4),
+    ':5': church_numeral(5),
+    
+    ':true': CHURCH_TRUE,
+    ':false': CHURCH_FALSE,
+    
+    ':I': COMBINATOR_I,
+    ':K': COMBINATOR_K,
+    ':S': COMBINATOR_S,
+}
+
+# Normal forms of the standard library by id of the (hash-consed) term,
+# reduced once at import as one batch; aliases such as :K and :true are the
+# same term and reduce once. PREDEFINED keeps the terms, so the ids stay valid
+PREDEFINED_NORMAL_FORMS = {
+    id(term): normal_form
+    for term, normal_form in zip(
+        PREDEFINED.values(),
+        lambda_reduce_many(list(PREDEFINED.values()), max_steps=1000))
+}
+
+# Startup banner, written to stdout in one call
+BANNER = "\n".join([
+    "╔═══════════════════════════════════════════════════╗",
+    "║   Lambda³ REPL - Ternary Lambda Calculus         ║",
+    "║   Running on TEROS Native                        ║",
+    "╚═══════════════════════════════════════════════════╝",
+    "",
+    "Commands:",
+    "  :parse <term>    - Parse and show AST",
+    "  :reduce <term>   - Reduce to normal form",
+    "  :step <term>     - Show reduction steps",
+    "  :help            - Show this help",
+    "  :quit            - Exit REPL",
+    "",
+    "Predefined:",
+    "  :0, :1, :2, ...  - Church numerals",
+    "  :true, :false    - Church booleans",
+    "  :I, :K, :S       - Combinators",
+    "",
+    "",
+])
+
+
 class LambdaREPL:
     """Interactive Lambda Calculus REPL"""
     
     def __init__(self):
-        self.env = {}
+        # Session layers over the shared standard library: nothing is
+        # copied per session and session entries shadow library ones
+        self.env = ChainMap({}, PREDEFINED)
         self.history = []
         self.verbose = False
         
-        # Preload standard library
-        self.env[':0'] = CHURCH_ZERO
-        self.env[':1'] = CHURCH_ONE
-        self.env[':2'] = CHURCH_TWO
-        self.env[':3'] = church_numeral(3)
-        self.env[':4'] = church_numeral(4)
-        self.env[':5'] = church_numeral(5)
+        # Recent normal forms, encodings and :step traces (printed lines),
+        # least recently used first. Keyed by id of the resolved term, which
+        # is hash-consed, so a source names whatever term the session binds
+        # it to; each entry holds its term, keeping the id valid. Normal
+        # forms of the standard library are in PREDEFINED_NORMAL_FORMS
+        self._normal_forms = OrderedDict()
+        self.normal_form_cache_size = 128
+        self._encodings = OrderedDict()
+        self.encoding_cache_size = 128
+        self._step_cache = OrderedDict()
+        self.step_cache_size = 128
         
-        self.env[':true'] = CHURCH_TRUE
-        self.env[':false'] = CHURCH_FALSE
-        
-        self.env[':I'] = COMBINATOR_I
-        self.env[':K'] = COMBINATOR_K
-        self.env[':S'] = COMBINATOR_S
+        # Commands taking an argument, keyed by name (without the ':')
+        self.commands = {
+            'parse': self.cmd_parse,
+            'reduce': self.cmd_reduce,
+            'step': self.cmd_step,
+            'encode': self.cmd_encode,
+        }
     
     def run(self):
         """Run interactive REPL"""
-        print("╔═══════════════════════════════════════════════════╗")
-        print("║   Lambda³ REPL - Ternary Lambda Calculus         ║")
-        print("║   Running on TEROS Native                        ║")
-        print("╚═══════════════════════════════════════════════════╝")
-        print()
-        print("Commands:")
-        print("  :parse <term>    - Parse and show AST")
-        print("  :reduce <term>   - Reduce to normal form")
-        print("  :step <term>     - Show reduction steps")
-        print("  :help            - Show this help")
-        print("  :quit            - Exit REPL")
-        print()
-        print("Predefined:")
-        print("  :0, :1, :2, ...  - Church numerals")
-        print("  :true, :false    - Church booleans")
-        print("  :I, :K, :S       - Combinators")
-        print()
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
         
         while True:
             try:
@@ -67,17 +112,13 @@ class LambdaREPL:
                     break
                 elif line == ':help' or line == ':h':
                     self.show_help()
-                elif line.startswith(':parse '):
-                    self.cmd_parse(line[7:])
-                elif line.startswith(':reduce '):
-                    self.cmd_reduce(line[8:])
-                elif line.startswith(':step '):
-                    self.cmd_step(line[6:])
-                elif line.startswith(':encode '):
-                    self.cmd_encode(line[8:])
                 elif line.startswith(':'):
+                    name, _, arg = line[1:].partition(' ')
+                    handler = self.commands.get(name) if arg else None
+                    if handler:
+                        handler(arg)
                     # Check if it's a predefined term
-                    if line in self.env:
+                    elif line in self.env:
                         print(f"{line} = {self.env[line]}")
                     else:
                         print(f"Unknown command: {line}")
@@ -106,7 +147,18 @@ class LambdaREPL:
             return
         
         print(f"Input:  {term}")
-        result = lambda_reduce(term, max_steps=1000)
+        key = id(term)
+        result = PREDEFINED_NORMAL_FORMS.get(key)
+        if result is None:
+            cached = self._normal_forms.get(key)
+            if cached is not None:
+                self._normal_forms.move_to_end(key)
+                result = cached[1]
+            else:
+                result = lambda_reduce(term, max_steps=1000)
+                self._normal_forms[key] = (term, result)
+                if len(self._normal_forms) > self.normal_form_cache_size:
+                    self._normal_forms.popitem(last=False)
         print(f"Result: {result}")
     
     def cmd_step(self, source: str):
@@ -118,16 +170,29 @@ class LambdaREPL:
             print("Parse error")
             return
         
-        print(f"Step 0: {term}")
+        key = id(term)
+        cached = self._step_cache.get(key)
+        if cached is not None:
+            self._step_cache.move_to_end(key)
+            lines = cached[1]
+        else:
+            lines = [f"Step 0: {term}"]
+            
+            current = term
+            for step in range(1, 20):
+                next_term, changed = lambda_reduce_step(current)
+                if not changed:
+                    lines.append(f"Normal form reached at step {step-1}")
+                    break
+                lines.append(f"Step {step}: {next_term}")
+                current = next_term
+            
+            self._step_cache[key] = (term, lines)
+            if len(self._step_cache) > self.step_cache_size:
+                self._step_cache.popitem(last=False)
         
-        current = term
-        for step in range(1, 20):
-            next_term, changed = lambda_reduce_step(current)
-            if not changed:
-                print(f"Normal form reached at step {step-1}")
-                break
-            print(f"Step {step}: {next_term}")
-            current = next_term
+        for line in lines:
+            print(line)
     
     def cmd_encode(self, source: str):
         """Show ternary encoding"""
@@ -137,30 +202,21 @@ class LambdaREPL:
             return
         
         # Encode as ternary sequence
-        encoding = self.encode_ternary(term)
+        key = id(term)
+        cached = self._encodings.get(key)
+        if cached is not None:
+            self._encodings.move_to_end(key)
+        else:
+            arena = TermArena()
+            cached = (term, arena.encode(arena.add_term(term)), term.packed_size)
+            self._encodings[key] = cached
+            if len(self._encodings) > self.encoding_cache_size:
+                self._encodings.popitem(last=False)
+        _, encoding, packed_size = cached
         print(f"Term:     {term}")
         print(f"Ternary:  {encoding}")
         print(f"Length:   {len(encoding)} trits")
-    
-    def encode_ternary(self, term: LambdaTerm) -> str:
-        """
-        Encode lambda term as ternary string
-        -1 (Var), 0 (Abs), 1 (App)
-        """
-        from .tvm_backend import LambdaTermType
-        
-        if term.term_type == LambdaTermType.VAR:
-            return f"-1[{term.data}]"
-        elif term.term_type == LambdaTermType.ABS:
-            var_id, body = term.data
-            body_enc = self.encode_ternary(body)
-            return f"0[{var_id},{body_enc}]"
-        elif term.term_type == LambdaTermType.APP:
-            func, arg = term.data
-            func_enc = self.encode_ternary(func)
-            arg_enc = self.encode_ternary(arg)
-            return f"1[{func_enc},{arg_enc}]"
-        return "?"
+        print(f"Packed:   {packed_size} bytes")
     
     def resolve(self, source: str) -> LambdaTerm:
         """
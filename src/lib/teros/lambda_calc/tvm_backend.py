@@ -3,9 +3,17 @@ TVM Backend - Python wrapper for native lambda engine
 Bridges Lambda³ with TEROS TVM
 """
 
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
+from array import array
+import re
+import weakref
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property, lru_cache, reduce
+from ..core.trit_packing import pack_trits, unpack_trits
+
+# NumPy, set by _load_kernels once the packed codec kernels are compiled
+np = None
 
 
 class LambdaTermType(Enum):
@@ -15,120 +23,397 @@ class LambdaTermType(Enum):
     APP = 1   # Application
 
 
-@dataclass
+# Hash-consed terms built by LambdaTerm.var/abs/app, keyed on the node's
+# fields with children by identity. Each value holds its children, so a
+# key's ids stay valid for as long as the entry exists
+_INTERNED: 'weakref.WeakValueDictionary[tuple, LambdaTerm]' = weakref.WeakValueDictionary()
+
+
+@dataclass(frozen=True)
 class LambdaTerm:
     """
     Python representation of lambda term
     Mirrors the C struct for easy integration
+    Immutable, so the packed size is computed once per term
     """
     term_type: LambdaTermType
     data: Union[int, tuple]
     
+    @cached_property
+    def packed_size(self) -> int:
+        """Bytes taken by TermArena.encode_packed"""
+        arena = TermArena()
+        tags, ids = arena.encode_packed(arena.add_term(self))
+        return len(tags) + len(ids)
+    
     def __str__(self) -> str:
-        """Pretty print lambda term"""
-        if self.term_type == LambdaTermType.VAR:
-            return f"x{self.data}"
-        elif self.term_type == LambdaTermType.ABS:
-            var_id, body = self.data
-            return f"(\\x{var_id}.{body})"
-        elif self.term_type == LambdaTermType.APP:
-            func, arg = self.data
-            return f"({func} {arg})"
-        return "?"
+        """
+        Pretty print lambda term
+        One walk with an explicit stack, joined once; nesting neither
+        recurses nor re-copies the rendering of every subterm
+        """
+        parts = []
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                parts.append(item)
+            elif item.term_type == LambdaTermType.VAR:
+                parts.append(f"x{item.data}")
+            elif item.term_type == LambdaTermType.ABS:
+                var_id, body = item.data
+                parts.append(f"(\\x{var_id}.")
+                stack.append(")")
+                stack.append(body)
+            elif item.term_type == LambdaTermType.APP:
+                func, arg = item.data
+                parts.append("(")
+                stack.extend((")", arg, " ", func))
+            else:
+                parts.append("?")
+        return "".join(parts)
+    
+    # The constructors below hash-cons: building a term equal to a live one
+    # (from the same children) returns that term, so equal subterms share
+    # one object and compare equal by identity
     
     @staticmethod
     def var(var_id: int) -> 'LambdaTerm':
         """Create variable"""
-        return LambdaTerm(LambdaTermType.VAR, var_id)
+        key = (-1, var_id)
+        term = _INTERNED.get(key)
+        if term is None:
+            term = _INTERNED[key] = LambdaTerm(LambdaTermType.VAR, var_id)
+        return term
     
     @staticmethod
     def abs(var_id: int, body: 'LambdaTerm') -> 'LambdaTerm':
         """Create abstraction"""
-        return LambdaTerm(LambdaTermType.ABS, (var_id, body))
+        key = (0, var_id, id(body))
+        term = _INTERNED.get(key)
+        if term is None:
+            term = _INTERNED[key] = LambdaTerm(LambdaTermType.ABS, (var_id, body))
+        return term
     
     @staticmethod
     def app(func: 'LambdaTerm', arg: 'LambdaTerm') -> 'LambdaTerm':
         """Create application"""
-        return LambdaTerm(LambdaTermType.APP, (func, arg))
+        key = (1, id(func), id(arg))
+        term = _INTERNED.get(key)
+        if term is None:
+            term = _INTERNED[key] = LambdaTerm(LambdaTermType.APP, (func, arg))
+        return term
 
 
 def lambda_substitute(term: LambdaTerm, var_id: int, replacement: LambdaTerm) -> LambdaTerm:
     """
     Substitution: M[x := N]
+    Post-order walk with an explicit stack; each distinct subterm is
+    rewritten once (shared subterms are memoized by identity) and
+    subterms without x are returned as they are
     """
+    # Trivial substitutions leave the term as it is
     if term.term_type == LambdaTermType.VAR:
-        if term.data == var_id:
-            return replacement
-        else:
-            return term
+        return replacement if term.data == var_id else term
+    if replacement.term_type == LambdaTermType.VAR and replacement.data == var_id:
+        return term  # x := x
     
-    elif term.term_type == LambdaTermType.ABS:
-        abs_var_id, body = term.data
-        if abs_var_id == var_id:
-            # Variable shadowed
-            return term
+    done = {}  # id(subterm) -> subterm with x replaced
+    stack = [term]
+    while stack:
+        node = stack[-1]
+        if id(node) in done:
+            stack.pop()
+            continue
+        
+        if node.term_type == LambdaTermType.VAR:
+            done[id(node)] = replacement if node.data == var_id else node
+        
+        elif node.term_type == LambdaTermType.ABS:
+            abs_var_id, body = node.data
+            if abs_var_id == var_id:
+                # Variable shadowed
+                done[id(node)] = node
+            elif id(body) not in done:
+                stack.append(body)
+                continue
+            else:
+                new_body = done[id(body)]
+                done[id(node)] = node if new_body is body else LambdaTerm.abs(abs_var_id, new_body)
+        
+        elif node.term_type == LambdaTermType.APP:
+            func, arg = node.data
+            if id(func) not in done or id(arg) not in done:
+                stack.append(arg)
+                stack.append(func)
+                continue
+            new_func = done[id(func)]
+            new_arg = done[id(arg)]
+            if new_func is func and new_arg is arg:
+                done[id(node)] = node
+            else:
+                done[id(node)] = LambdaTerm.app(new_func, new_arg)
+        
         else:
-            new_body = lambda_substitute(body, var_id, replacement)
-            return LambdaTerm.abs(abs_var_id, new_body)
+            done[id(node)] = node
+        stack.pop()
     
-    elif term.term_type == LambdaTermType.APP:
-        func, arg = term.data
-        new_func = lambda_substitute(func, var_id, replacement)
-        new_arg = lambda_substitute(arg, var_id, replacement)
-        return LambdaTerm.app(new_func, new_arg)
+    return done[id(term)]
+
+
+def _substitute_chain(term: LambdaTerm, bindings: List[Tuple[int, LambdaTerm]]) -> LambdaTerm:
+    """
+    Substitution of a whole chain: M[x1 := N1]...[xk := Nk] in one walk
+    Same result as lambda_substitute applied once per binding in order
+    (the xi must be distinct). An occurrence of xi becomes Ni with the
+    later bindings still in scope there applied to it; a binder in M that
+    rebinds some xj takes that binding out of scope below it
+    """
+    index = {var_id: i for i, (var_id, _) in enumerate(bindings)}
+    full = (1 << len(bindings)) - 1
+    done = {}      # (id(subterm), in-scope mask) -> rewritten subterm
+    replaced = {}  # (i, in-scope mask) -> Ni with later bindings applied
+    stack = [(term, full)]
+    while stack:
+        node, mask = stack[-1]
+        key = (id(node), mask)
+        if key in done:
+            stack.pop()
+            continue
+        
+        if not mask:
+            done[key] = node
+        
+        elif node.term_type == LambdaTermType.VAR:
+            i = index.get(node.data)
+            if i is None or not mask >> i & 1:
+                done[key] = node
+            else:
+                result = replaced.get((i, mask))
+                if result is None:
+                    result = bindings[i][1]
+                    for j in range(i + 1, len(bindings)):
+                        if mask >> j & 1:
+                            result = lambda_substitute(result, *bindings[j])
+                    replaced[(i, mask)] = result
+                done[key] = result
+        
+        elif node.term_type == LambdaTermType.ABS:
+            abs_var_id, body = node.data
+            i = index.get(abs_var_id)
+            inner = mask if i is None else mask & ~(1 << i)
+            body_key = (id(body), inner)
+            if body_key not in done:
+                stack.append((body, inner))
+                continue
+            new_body = done[body_key]
+            done[key] = node if new_body is body else LambdaTerm.abs(abs_var_id, new_body)
+        
+        elif node.term_type == LambdaTermType.APP:
+            func, arg = node.data
+            func_key = (id(func), mask)
+            arg_key = (id(arg), mask)
+            if func_key not in done or arg_key not in done:
+                stack.append((arg, mask))
+                stack.append((func, mask))
+                continue
+            new_func = done[func_key]
+            new_arg = done[arg_key]
+            if new_func is func and new_arg is arg:
+                done[key] = node
+            else:
+                done[key] = LambdaTerm.app(new_func, new_arg)
+        
+        else:
+            done[key] = node
+        stack.pop()
     
-    return term
+    return done[(id(term), full)]
+
+
+# Zipper frame kinds used by lambda_reduce_step and lambda_reduce
+_IN_ABS, _IN_FUNC, _IN_ARG = range(3)
 
 
 def lambda_reduce_step(term: LambdaTerm) -> tuple[LambdaTerm, bool]:
     """
     Perform single β-reduction step
     Returns (reduced_term, changed)
+    The leftmost-outermost redex is searched with an explicit stack of
+    (frame kind, parent) pairs, so deeply nested terms do not recurse;
+    only the path from the root to the redex is rebuilt
     """
-    if term.term_type == LambdaTermType.VAR:
-        return term, False
-    
-    elif term.term_type == LambdaTermType.ABS:
-        var_id, body = term.data
-        new_body, changed = lambda_reduce_step(body)
-        return LambdaTerm.abs(var_id, new_body), changed
-    
-    elif term.term_type == LambdaTermType.APP:
-        func, arg = term.data
-        
-        # Check if this is a β-redex: (λx.M) N
-        if func.term_type == LambdaTermType.ABS:
-            var_id, body = func.data
-            # β-reduction: (λx.M) N → M[x := N]
-            result = lambda_substitute(body, var_id, arg)
-            return result, True
-        
-        # Try to reduce func
-        new_func, func_changed = lambda_reduce_step(func)
-        if func_changed:
-            return LambdaTerm.app(new_func, arg), True
+    frames = []
+    focus = term
+    while True:
+        if focus.term_type == LambdaTermType.APP:
+            func, arg = focus.data
+            
+            # Check if this is a β-redex: (λx.M) N
+            if func.term_type == LambdaTermType.ABS:
+                var_id, body = func.data
+                # β-reduction: (λx.M) N → M[x := N]
+                result = lambda_substitute(body, var_id, arg)
+                break
+            
+            # Try to reduce func first
+            frames.append((_IN_FUNC, focus))
+            focus = func
         
-        # Try to reduce arg
-        new_arg, arg_changed = lambda_reduce_step(arg)
-        if arg_changed:
-            return LambdaTerm.app(func, new_arg), True
+        elif focus.term_type == LambdaTermType.ABS:
+            frames.append((_IN_ABS, focus))
+            focus = focus.data[1]
         
-        return term, False
+        else:
+            # No redex below: go on with the innermost argument not tried yet
+            while frames:
+                kind, parent = frames.pop()
+                if kind == _IN_FUNC:
+                    frames.append((_IN_ARG, parent))
+                    focus = parent.data[1]
+                    break
+            else:
+                return term, False
     
-    return term, False
+    for kind, parent in reversed(frames):
+        if kind == _IN_ABS:
+            result = LambdaTerm.abs(parent.data[0], result)
+        elif kind == _IN_FUNC:
+            result = LambdaTerm.app(result, parent.data[1])
+        else:
+            result = LambdaTerm.app(parent.data[0], result)
+    return result, True
 
 
 def lambda_reduce(term: LambdaTerm, max_steps: int = 1000) -> LambdaTerm:
     """
     Reduce term to normal form
+    Same leftmost-outermost order as repeated lambda_reduce_step, but the
+    search resumes at each contracted redex instead of restarting from the
+    root: the path to the redex is kept as a stack of frames (a zipper),
+    and the term is rebuilt once at the end
+    Redexes contracted in a row at one position are remembered; since
+    terms are hash-consed, meeting one of them again means the reduction
+    there cycles (as with Ω), and the rest of the step budget is skipped
+    A curried redex (λx.λy.…M) a b … contracts all of its applications
+    in a single substitution pass over M
     """
-    current = term
-    for step in range(max_steps):
-        next_term, changed = lambda_reduce_step(current)
-        if not changed:
-            break
-        current = next_term
-    return current
+    # Frames: (_IN_ABS, var_id) body of λvar_id
+    #         (_IN_FUNC, arg)   function side of an application to arg
+    #         (_IN_ARG, func)   argument side of an application of func
+    frames = []
+    focus = term
+    steps = 0
+    trail = []     # redexes contracted in a row at the current position
+    on_trail = {}  # id(redex) -> index in trail
+    
+    while steps < max_steps:
+        if focus.term_type == LambdaTermType.APP:
+            func, arg = focus.data
+            if func.term_type == LambdaTermType.ABS:
+                seen_at = on_trail.get(id(focus))
+                if seen_at is not None:
+                    # Periodic from trail[seen_at]: jump to the redex the
+                    # step limit would stop at
+                    period = len(trail) - seen_at
+                    focus = trail[seen_at + (max_steps - steps) % period]
+                    break
+                on_trail[id(focus)] = len(trail)
+                trail.append(focus)
+                
+                # β-reduction: (λx.M) N → M[x := N]
+                var_id, body = func.data
+                if (body.term_type == LambdaTermType.ABS and frames
+                        and frames[-1][0] == _IN_FUNC and steps + 1 < max_steps):
+                    # (λx.λy.M) N P: contract the whole chain at once,
+                    # one step per application as before
+                    bindings = [(var_id, arg)]
+                    while (body.term_type == LambdaTermType.ABS and frames
+                           and frames[-1][0] == _IN_FUNC
+                           and steps + len(bindings) < max_steps):
+                        var_id, body = body.data
+                        bindings.append((var_id, frames.pop()[1]))
+                    steps += len(bindings)
+                    # A binding whose variable is rebound further down the
+                    # chain never reaches M
+                    rebound = set()
+                    live = []
+                    for binding in reversed(bindings):
+                        if binding[0] not in rebound:
+                            rebound.add(binding[0])
+                            live.append(binding)
+                    live.reverse()
+                    focus = _substitute_chain(body, live)
+                    trail.clear()
+                    on_trail.clear()
+                else:
+                    focus = lambda_substitute(body, var_id, arg)
+                    steps += 1
+                # The enclosing application becomes a redex when its
+                # function side turns into an abstraction
+                if (frames and frames[-1][0] == _IN_FUNC
+                        and focus.term_type == LambdaTermType.ABS):
+                    trail.clear()
+                    on_trail.clear()
+                    while (frames and frames[-1][0] == _IN_FUNC
+                           and focus.term_type == LambdaTermType.ABS):
+                        focus = LambdaTerm.app(focus, frames.pop()[1])
+                continue
+            if trail:
+                trail.clear()
+                on_trail.clear()
+            frames.append((_IN_FUNC, arg))
+            focus = func
+            continue
+        if trail:
+            trail.clear()
+            on_trail.clear()
+        if focus.term_type == LambdaTermType.ABS:
+            var_id, body = focus.data
+            frames.append((_IN_ABS, var_id))
+            focus = body
+            continue
+        
+        # focus has no redex: climb to the next unsearched argument
+        while frames:
+            kind, data = frames.pop()
+            if kind == _IN_FUNC:
+                frames.append((_IN_ARG, focus))
+                focus = data
+                break
+            elif kind == _IN_ARG:
+                focus = LambdaTerm.app(data, focus)
+            else:
+                focus = LambdaTerm.abs(data, focus)
+        else:
+            return focus
+    
+    # Step limit reached: plug the focus back into its context
+    while frames:
+        kind, data = frames.pop()
+        if kind == _IN_FUNC:
+            focus = LambdaTerm.app(focus, data)
+        elif kind == _IN_ARG:
+            focus = LambdaTerm.app(data, focus)
+        else:
+            focus = LambdaTerm.abs(data, focus)
+    return focus
+
+
+def lambda_reduce_many(terms: Sequence[LambdaTerm], max_steps: int = 1000) -> List[LambdaTerm]:
+    """
+    Reduce a batch of terms to normal form
+    Terms are hash-consed, so repeated inputs are the same object and are
+    reduced only once; their subterms are shared across the batch too
+    """
+    normal_forms = {}  # id(term) -> normal form
+    results = []
+    for term in terms:
+        result = normal_forms.get(id(term))
+        if result is None:
+            result = normal_forms[id(term)] = lambda_reduce(term, max_steps)
+        results.append(result)
+    return results
 
 
 def lambda_parse(source: str) -> Optional[LambdaTerm]:
@@ -138,67 +423,128 @@ def lambda_parse(source: str) -> Optional[LambdaTerm]:
               M N   for application
               x     for variable
     """
-    # Simple recursive descent parser
-    source = source.strip()
+    # Tokenize once, then a recursive descent over token positions
+    tokens = _tokenize(source)
+    if not tokens:
+        return None
     
-    # Lambda abstraction
-    if source.startswith('λ') or source.startswith('\\'):
-        # Format: λx.body or \x.body
-        rest = source[1:].strip()
-        if '.' not in rest:
+    term, pos = _parse_term(tokens, 0)
+    if term is None or pos != len(tokens):
+        return None
+    return term
+
+
+# Binders, punctuation and identifiers, each optionally preceded by spaces
+_TOKEN = re.compile(r'\s*(?:([λ\\.()])|(\w+))')
+
+
+def _tokenize(source: str) -> Optional[List[str]]:
+    """Split source into tokens, or None if it contains stray characters"""
+    source = source.rstrip()
+    tokens = []
+    pos = 0
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if not match:
             return None
-        var_part, body_part = rest.split('.', 1)
-        var_part = var_part.strip()
-        body_part = body_part.strip()
-        
-        # Extract variable ID
-        if var_part.startswith('x'):
-            var_id = int(var_part[1:])
+        tokens.append(match.group(1) or match.group(2))
+        pos = match.end()
+    return tokens
+
+
+def _var_id(name: str) -> Optional[int]:
+    """Variable ID of x<N> or a single letter"""
+    if name.startswith('x') and name[1:].isdigit():
+        return int(name[1:])
+    if len(name) == 1 and name.isalpha():
+        return ord(name) - ord('a')
+    return None
+
+
+def _parse_term(tokens: List[str], pos: int) -> Tuple[Optional[LambdaTerm], int]:
+    """
+    Parse a left-associative application chain starting at pos
+    An abstraction extends as far right as possible (to the closing
+    parenthesis or end of input). Returns (term or None, next position)
+    """
+    terms = []
+    while pos < len(tokens) and tokens[pos] != ')':
+        token = tokens[pos]
+        if token == 'λ' or token == '\\':
+            # Lambda abstraction: λx.body
+            if pos + 2 >= len(tokens) or tokens[pos + 2] != '.':
+                return None, pos
+            var_id = _var_id(tokens[pos + 1])
+            if var_id is None:
+                return None, pos
+            body, pos = _parse_term(tokens, pos + 3)
+            if body is None:
+                return None, pos
+            terms.append(LambdaTerm.abs(var_id, body))
+            break
+        elif token == '(':
+            # Grouping
+            inner, pos = _parse_term(tokens, pos + 1)
+            if inner is None or pos >= len(tokens):
+                return None, pos
+            terms.append(inner)
+            pos += 1
         else:
-            var_id = ord(var_part) - ord('a')
-        
-        # Parse body
-        body = lambda_parse(body_part)
-        if body is None:
-            return None
-        
-        return LambdaTerm.abs(var_id, body)
-    
-    # Application (space-separated)
-    if ' ' in source:
-        parts = source.split(' ', 1)
-        func = lambda_parse(parts[0])
-        arg = lambda_parse(parts[1])
-        if func and arg:
-            return LambdaTerm.app(func, arg)
-        return None
-    
-    # Variable
-    if source.startswith('x'):
-        var_id = int(source[1:])
-        return LambdaTerm.var(var_id)
-    elif len(source) == 1 and source.isalpha():
-        var_id = ord(source) - ord('a')
-        return LambdaTerm.var(var_id)
+            # Variable
+            var_id = _var_id(token) if token != '.' else None
+            if var_id is None:
+                return None, pos
+            terms.append(LambdaTerm.var(var_id))
+            pos += 1
     
-    return None
+    if not terms:
+        return None, pos
+    return reduce(LambdaTerm.app, terms), pos
 
 
 # ============================================================================
 # CHURCH ENCODINGS
 # ============================================================================
 
+def _church_bodies(count: int) -> Tuple[LambdaTerm, ...]:
+    """
+    Bodies f^N(x) for N < count
+    Each is one application on top of the previous, so they share structure
+    """
+    f = LambdaTerm.var(0)
+    bodies = [LambdaTerm.var(1)]
+    for _ in range(count - 1):
+        bodies.append(LambdaTerm.app(f, bodies[-1]))
+    return tuple(bodies)
+
+
+# Church numerals 0..1023, built once at import (about 3k shared nodes)
+_CHURCH_BODIES = _church_bodies(1024)
+_CHURCH_NUMERALS = tuple(
+    LambdaTerm.abs(0, LambdaTerm.abs(1, body)) for body in _CHURCH_BODIES
+)
+
+
 def church_numeral(n: int) -> LambdaTerm:
     """
     Create Church numeral N
     N = λf.λx.f^N(x)
+    Small numerals come from a prebuilt table and larger ones are memoized;
+    terms are never mutated, so callers share one instance
     """
-    # Start with x (var 1)
-    result = LambdaTerm.var(1)
+    if n < len(_CHURCH_NUMERALS):
+        return _CHURCH_NUMERALS[max(n, 0)]
+    return _church_numeral_large(n)
+
+
+@lru_cache(maxsize=None)
+def _church_numeral_large(n: int) -> LambdaTerm:
+    """Church numeral N beyond the table, extending its largest body"""
+    f = LambdaTerm.var(0)
+    result = _CHURCH_BODIES[-1]
     
-    # Apply f (var 0) n times
-    for i in range(n):
-        f = LambdaTerm.var(0)
+    # Apply f (var 0) the remaining times
+    for _ in range(n - len(_CHURCH_BODIES) + 1):
         result = LambdaTerm.app(f, result)
     
     # Wrap in λx. and λf.
@@ -245,6 +591,442 @@ S_body = LambdaTerm.app(
 COMBINATOR_S = LambdaTerm.abs(0, LambdaTerm.abs(1, LambdaTerm.abs(2, S_body)))
 
 
+# ============================================================================
+# TERM ARENA
+# ============================================================================
+
+def pack_id_deltas(ids: Sequence[int]) -> bytes:
+    """
+    Encode var_ids as the delta from the previous id, zigzag-mapped
+    to unsigned and written as base-128 varints
+    Runs of the same bound variable cost one byte per occurrence
+    """
+    out = bytearray()
+    last = 0
+    for var_id in ids:
+        delta = var_id - last
+        last = var_id
+        value = delta << 1 if delta >= 0 else (-delta << 1) - 1
+        while value >= 0x80:
+            out.append(value & 0x7f | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def unpack_id_deltas(data: bytes) -> array:
+    """Decode var_ids written by pack_id_deltas"""
+    ids = array('i')
+    last = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        last += -((value + 1) >> 1) if value & 1 else value >> 1
+        ids.append(last)
+        value = 0
+        shift = 0
+    if shift:
+        raise ValueError("Truncated id stream")
+    return ids
+
+
+def _encode_packed_kernel(tag, data1, data2, root, out_tags, out_ids):
+    """
+    Pre-order walk over the arena columns into preallocated outputs
+    Returns (num_tags, num_ids), or (-1, -1) if the outputs overflow
+    """
+    capacity = out_tags.shape[0]
+    stack = np.empty(capacity + 1, dtype=np.int32)
+    stack[0] = root
+    top = 1
+    n_tags = 0
+    n_ids = 0
+    while top > 0:
+        if n_tags >= capacity or top + 1 > capacity:
+            return -1, -1
+        top -= 1
+        i = stack[top]
+        t = tag[i]
+        out_tags[n_tags] = t
+        n_tags += 1
+        if t == 1:
+            stack[top] = data2[i]
+            stack[top + 1] = data1[i]
+            top += 2
+        else:
+            out_ids[n_ids] = data1[i]
+            n_ids += 1
+            if t == 0:
+                stack[top] = data2[i]
+                top += 1
+    return n_tags, n_ids
+
+
+def _pack_kernel(trits, count, out):
+    """Pack count trits 5 per byte into out, padding with 0 trits"""
+    for k in range(out.shape[0]):
+        value = 0
+        for j in range(5):
+            index = k * 5 + j
+            if index < count:
+                value = value * 3 + trits[index] + 1
+            else:
+                value = value * 3 + 1
+        out[k] = value
+
+
+def _pack_id_deltas_kernel(ids, count, out):
+    """Write count ids into out as zigzag delta varints; returns bytes used"""
+    n = 0
+    last = 0
+    for k in range(count):
+        delta = np.int64(ids[k]) - last
+        last = np.int64(ids[k])
+        value = delta << 1 if delta >= 0 else ((-delta) << 1) - 1
+        while value >= 0x80:
+            out[n] = (value & 0x7f) | 0x80
+            n += 1
+            value >>= 7
+        out[n] = value
+        n += 1
+    return n
+
+
+def _unpack_id_deltas_kernel(data, out):
+    """Decode zigzag delta varints into out; returns count, or -1 if truncated"""
+    n = 0
+    last = np.int64(0)
+    value = np.int64(0)
+    shift = 0
+    for k in range(data.shape[0]):
+        byte = np.int64(data[k])
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        if value & 1:
+            last -= (value + 1) >> 1
+        else:
+            last += value >> 1
+        out[n] = last
+        n += 1
+        value = 0
+        shift = 0
+    if shift:
+        return -1
+    return n
+
+
+def _decode_packed_kernel(packed, ids, base, out_tag, out_data1, out_data2):
+    """
+    Decode packed tag/id streams into preallocated node columns
+    New nodes are numbered from base; returns (num_nodes, root),
+    or (-1, -1) if the streams are malformed
+    """
+    capacity = out_tag.shape[0]
+    frame_tag = np.empty(capacity, dtype=np.int8)
+    frame_var = np.empty(capacity, dtype=np.int32)
+    frame_first = np.empty(capacity, dtype=np.int32)
+    frame_count = np.empty(capacity, dtype=np.int8)
+    top = 0
+    n = 0
+    id_pos = 0
+    for pos in range(capacity):
+        t = (packed[pos // 5] // 3 ** (4 - pos % 5)) % 3 - 1
+        if t == 1:
+            frame_tag[top] = 1
+            frame_count[top] = 0
+            top += 1
+            continue
+        if id_pos >= ids.shape[0]:
+            return -1, -1
+        if t == 0:
+            frame_tag[top] = 0
+            frame_var[top] = ids[id_pos]
+            frame_count[top] = 0
+            id_pos += 1
+            top += 1
+            continue
+        
+        out_tag[n] = -1
+        out_data1[n] = ids[id_pos]
+        out_data2[n] = 0
+        id_pos += 1
+        node = base + n
+        n += 1
+        
+        # Close every frame this node completes
+        while top > 0:
+            k = top - 1
+            if frame_tag[k] == 1 and frame_count[k] == 0:
+                frame_first[k] = node
+                frame_count[k] = 1
+                break
+            top -= 1
+            out_tag[n] = frame_tag[k]
+            if frame_tag[k] == 0:
+                out_data1[n] = frame_var[k]
+            else:
+                out_data1[n] = frame_first[k]
+            out_data2[n] = node
+            node = base + n
+            n += 1
+        if top == 0:
+            return n, node
+    return -1, -1
+
+
+# Whether the kernels above are Numba-compiled; None until first tried
+_NUMBA = None
+
+
+def _load_kernels() -> bool:
+    """
+    Compile the packed codec kernels with Numba on first use
+    Numba is optional and slow to import, so it is only imported when a
+    term is first packed or unpacked. Returns False if it is unavailable
+    Compiled code is not cached on disk: the cache records the importing
+    module's name, and this package is imported as both teros and lib.teros
+    """
+    global _NUMBA, np
+    global _encode_packed_kernel, _pack_kernel, _pack_id_deltas_kernel
+    global _unpack_id_deltas_kernel, _decode_packed_kernel
+    if _NUMBA is None:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _NUMBA = False
+        else:
+            np = numpy
+            _encode_packed_kernel = njit(_encode_packed_kernel)
+            _pack_kernel = njit(_pack_kernel)
+            _pack_id_deltas_kernel = njit(_pack_id_deltas_kernel)
+            _unpack_id_deltas_kernel = njit(_unpack_id_deltas_kernel)
+            _decode_packed_kernel = njit(_decode_packed_kernel)
+            _NUMBA = True
+    return _NUMBA
+
+
+class TermArena:
+    """
+    Struct-of-arrays term store
+    Mirrors the C layout [tag | data1 | data2], one column per field:
+      VAR: [-1 | var_id   | 0      ]
+      ABS: [ 0 | var_id   | body   ]
+      APP: [ 1 | func     | arg    ]
+    Nodes are referenced by index; the tag is the term's trit
+    """
+    
+    def __init__(self):
+        self.tag = array('b')
+        self.data1 = array('i')
+        self.data2 = array('i')
+    
+    def __len__(self) -> int:
+        return len(self.tag)
+    
+    def _push(self, tag: int, data1: int, data2: int) -> int:
+        self.tag.append(tag)
+        self.data1.append(data1)
+        self.data2.append(data2)
+        return len(self.tag) - 1
+    
+    def mk_var(self, var_id: int) -> int:
+        """Add variable, return its index"""
+        return self._push(-1, var_id, 0)
+    
+    def mk_abs(self, var_id: int, body: int) -> int:
+        """Add abstraction, return its index"""
+        return self._push(0, var_id, body)
+    
+    def mk_app(self, func: int, arg: int) -> int:
+        """Add application, return its index"""
+        return self._push(1, func, arg)
+    
+    def add_term(self, term: LambdaTerm) -> int:
+        """
+        Flatten a LambdaTerm into the arena (post-order, no recursion)
+        Returns the index of the root node
+        """
+        results = []
+        stack = [(term, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.term_type == LambdaTermType.VAR:
+                results.append(self.mk_var(node.data))
+            elif not expanded:
+                stack.append((node, True))
+                if node.term_type == LambdaTermType.ABS:
+                    stack.append((node.data[1], False))
+                else:
+                    func, arg = node.data
+                    stack.append((arg, False))
+                    stack.append((func, False))
+            elif node.term_type == LambdaTermType.ABS:
+                body = results.pop()
+                results.append(self.mk_abs(node.data[0], body))
+            else:
+                arg = results.pop()
+                func = results.pop()
+                results.append(self.mk_app(func, arg))
+        return results[-1]
+    
+    def to_term(self, index: int) -> LambdaTerm:
+        """Rebuild the LambdaTerm rooted at index (no recursion)"""
+        tag, data1, data2 = self.tag, self.data1, self.data2
+        results = []
+        stack = [(index, False)]
+        while stack:
+            i, expanded = stack.pop()
+            t = tag[i]
+            if t == -1:
+                results.append(LambdaTerm.var(data1[i]))
+            elif not expanded:
+                stack.append((i, True))
+                if t == 0:
+                    stack.append((data2[i], False))
+                else:
+                    stack.append((data2[i], False))
+                    stack.append((data1[i], False))
+            elif t == 0:
+                results.append(LambdaTerm.abs(data1[i], results.pop()))
+            else:
+                arg = results.pop()
+                results.append(LambdaTerm.app(results.pop(), arg))
+        return results[-1]
+    
+    def encode(self, root: int) -> str:
+        """
+        Encode the term rooted at root as ternary string
+        -1[var_id] (Var), 0[var_id,body] (Abs), 1[func,arg] (App)
+        """
+        tag, data1, data2 = self.tag, self.data1, self.data2
+        parts = []
+        stack = [root]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                parts.append(item)
+                continue
+            t = tag[item]
+            if t == -1:
+                parts.append(f"-1[{data1[item]}]")
+            elif t == 0:
+                parts.append(f"0[{data1[item]},")
+                stack.append("]")
+                stack.append(data2[item])
+            else:
+                parts.append("1[")
+                stack.extend(("]", data2[item], ",", data1[item]))
+        return "".join(parts)
+    
+    def encode_packed(self, root: int) -> Tuple[bytes, bytes]:
+        """
+        Encode the term rooted at root as two streams:
+        pre-order tag trits packed 5 per byte, and the var_ids of
+        VAR/ABS nodes in the same order (see pack_id_deltas)
+        """
+        if _load_kernels():
+            capacity = len(self.tag)
+            out_tags = np.empty(capacity, dtype=np.int8)
+            out_ids = np.empty(capacity, dtype=np.intc)
+            n_tags, n_ids = _encode_packed_kernel(
+                np.frombuffer(self.tag, dtype=np.int8),
+                np.frombuffer(self.data1, dtype=np.intc),
+                np.frombuffer(self.data2, dtype=np.intc),
+                root, out_tags, out_ids)
+            # Overflow means shared subterms; the Python walk handles those
+            if n_tags >= 0:
+                packed = np.empty((n_tags + 4) // 5, dtype=np.uint8)
+                _pack_kernel(out_tags, n_tags, packed)
+                id_bytes = np.empty(n_ids * 5, dtype=np.uint8)
+                n_bytes = _pack_id_deltas_kernel(out_ids, n_ids, id_bytes)
+                return packed.tobytes(), id_bytes[:n_bytes].tobytes()
+        
+        tag, data1, data2 = self.tag, self.data1, self.data2
+        tags = []
+        ids = array('i')
+        stack = [root]
+        while stack:
+            i = stack.pop()
+            t = tag[i]
+            tags.append(t)
+            if t == -1:
+                ids.append(data1[i])
+            elif t == 0:
+                ids.append(data1[i])
+                stack.append(data2[i])
+            else:
+                stack.append(data2[i])
+                stack.append(data1[i])
+        return pack_trits(tags), pack_id_deltas(ids)
+    
+    def add_packed(self, tags: bytes, ids: bytes) -> int:
+        """
+        Decode streams from encode_packed into the arena
+        The tag stream is a prefix code, so padding trits are never read
+        Returns the index of the root node
+        """
+        if _load_kernels():
+            id_values = np.empty(len(ids), dtype=np.intc)
+            n_ids = _unpack_id_deltas_kernel(
+                np.frombuffer(ids, dtype=np.uint8), id_values)
+            if n_ids < 0:
+                raise ValueError("Truncated id stream")
+            capacity = len(tags) * 5
+            out_tag = np.empty(capacity, dtype=np.int8)
+            out_data1 = np.empty(capacity, dtype=np.intc)
+            out_data2 = np.empty(capacity, dtype=np.intc)
+            count, root = _decode_packed_kernel(
+                np.frombuffer(tags, dtype=np.uint8),
+                id_values[:n_ids],
+                len(self.tag), out_tag, out_data1, out_data2)
+            if count < 0:
+                raise ValueError("Malformed packed term")
+            self.tag.frombytes(out_tag[:count].tobytes())
+            self.data1.frombytes(out_data1[:count].tobytes())
+            self.data2.frombytes(out_data2[:count].tobytes())
+            return int(root)
+        
+        ids = unpack_id_deltas(ids)
+        trits = unpack_trits(tags)
+        frames = []  # [tag, var_id, children]
+        pos = 0
+        id_pos = 0
+        while True:
+            t = trits[pos]
+            pos += 1
+            if t == 0:
+                frames.append([0, ids[id_pos], []])
+                id_pos += 1
+                continue
+            if t == 1:
+                frames.append([1, 0, []])
+                continue
+            
+            node = self.mk_var(ids[id_pos])
+            id_pos += 1
+            
+            # Close every frame this node completes
+            while frames:
+                frame = frames[-1]
+                frame[2].append(node)
+                if frame[0] == 1 and len(frame[2]) < 2:
+                    break
+                frames.pop()
+                if frame[0] == 0:
+                    node = self.mk_abs(frame[1], frame[2][0])
+                else:
+                    node = self.mk_app(frame[2][0], frame[2][1])
+            else:
+                return node
+
+
 # ============================================================================
 # TVM INTEGRATION (TODO)
 # ============================================================================
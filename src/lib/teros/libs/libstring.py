@@ -9,6 +9,12 @@ import re
 from ..core.trit import Trit
 from ..core.tritarray import TritArray
 
+# Character -> trit value; any other character reads as 0
+_CHAR_TO_VALUE = {'1': 1, '-': -1}
+
+# Trit value -> character
+_VALUE_TO_CHAR = {1: '1', 0: '0', -1: '-'}
+
 
 class TernaryString:
     """
@@ -46,7 +52,7 @@ class TernaryString:
     
     def __str__(self) -> str:
         """Convert to string representation."""
-        return ''.join(self._trit_to_char(trit) for trit in self.trits)
+        return ''.join([_VALUE_TO_CHAR[trit.value] for trit in self.trits])
     
     def __repr__(self) -> str:
         """Get string representation."""
@@ -54,21 +60,11 @@ class TernaryString:
     
     def _trit_to_char(self, trit: Trit) -> str:
         """Convert trit to character."""
-        if trit.value == 1:
-            return '1'
-        elif trit.value == -1:
-            return '-'
-        else:
-            return '0'
+        return _VALUE_TO_CHAR[trit.value]
     
     def _char_to_trit(self, char: str) -> Trit:
         """Convert character to trit."""
-        if char == '1':
-            return Trit(1)
-        elif char == '-':
-            return Trit(-1)
-        else:
-            return Trit(0)
+        return Trit(_CHAR_TO_VALUE.get(char, 0))
     
     def append(self, trit: Trit) -> None:
         """Append trit to string."""
@@ -83,6 +79,14 @@ class TernaryString:
         else:
             raise IndexError("String index out of range")
     
+    def insert_string(self, index: int, string: 'TernaryString') -> None:
+        """Insert all trits of string at index in one splice."""
+        if 0 <= index <= self.length:
+            self.trits[index:index] = string.trits
+            self.length = len(self.trits)
+        else:
+            raise IndexError("String index out of range")
+    
     def remove(self, index: int) -> Trit:
         """Remove trit at index."""
         if 0 <= index < self.length:
@@ -92,6 +96,14 @@ class TernaryString:
         else:
             raise IndexError("String index out of range")
     
+    def remove_range(self, start: int, end: int) -> None:
+        """Remove trits from start up to end in one splice."""
+        if 0 <= start <= end <= self.length:
+            del self.trits[start:end]
+            self.length = len(self.trits)
+        else:
+            raise IndexError("String index out of range")
+    
     def substring(self, start: int, end: int = None) -> 'TernaryString':
         """Get substring."""
         if end is None:
@@ -134,11 +146,73 @@ class TernaryString:
         
         return result
     
+    def replace_all(self, old: 'TernaryString', new: 'TernaryString') -> Tuple['TernaryString', List[int]]:
+        """
+        Replace every non-overlapping occurrence of old, left to right.
+        
+        Matches are found with a single KMP scan and the result is built in
+        one pass, so the cost is linear in the string length.
+        
+        Returns:
+            Tuple of (new string, start positions of the replaced
+            occurrences in this string)
+        """
+        pattern = [trit.value for trit in old.trits]
+        if not pattern:
+            return self.copy(), []
+        
+        # failure[i]: length of the longest proper border of pattern[:i+1]
+        failure = [0] * len(pattern)
+        k = 0
+        for i in range(1, len(pattern)):
+            while k and pattern[i] != pattern[k]:
+                k = failure[k - 1]
+            if pattern[i] == pattern[k]:
+                k += 1
+            failure[i] = k
+        
+        result = []
+        matches = []
+        last = 0  # End of the previous match
+        k = 0
+        for i, trit in enumerate(self.trits):
+            value = trit.value
+            while k and value != pattern[k]:
+                k = failure[k - 1]
+            if value == pattern[k]:
+                k += 1
+            if k == len(pattern):
+                result.extend(self.trits[last:i + 1 - k])
+                result.extend(new.trits)
+                last = i + 1
+                matches.append(last - k)
+                k = 0  # Matches do not overlap
+        
+        result.extend(self.trits[last:])
+        return TernaryString(result), matches
+    
     def split(self, delimiter: 'TernaryString') -> List['TernaryString']:
         """Split string by delimiter."""
         if len(delimiter) == 0:
             return [TernaryString([trit]) for trit in self.trits]
         
+        if len(delimiter) == 1:
+            # Single-trit delimiter (e.g. newline): slice out each part
+            # instead of copying it one trit at a time
+            value = delimiter.trits[0].value
+            result = []
+            start = 0
+            for i, trit in enumerate(self.trits):
+                if trit.value == value:
+                    if i > start:
+                        result.append(TernaryString(self.trits[start:i]))
+                    start = i + 1
+            
+            if start < self.length:
+                result.append(TernaryString(self.trits[start:]))
+            
+            return result
+        
         result = []
         current = TernaryString()
         
@@ -297,15 +371,7 @@ class TernaryString:
     @classmethod
     def from_string(cls, string: str) -> 'TernaryString':
         """Create from string."""
-        trits = []
-        for char in string:
-            if char == '1':
-                trits.append(Trit(1))
-            elif char == '-':
-                trits.append(Trit(-1))
-            else:
-                trits.append(Trit(0))
-        return cls(trits)
+        return cls([Trit(_CHAR_TO_VALUE.get(char, 0)) for char in string])
     
     def copy(self) -> 'TernaryString':
         """Create copy of string."""
@@ -386,12 +452,7 @@ class TernaryStringBuilder:
     
     def _trit_to_char(self, trit: Trit) -> str:
         """Convert trit to character."""
-        if trit.value == 1:
-            return '1'
-        elif trit.value == -1:
-            return '-'
-        else:
-            return '0'
+        return _VALUE_TO_CHAR[trit.value]
 
 
 class TernaryStringUtils:
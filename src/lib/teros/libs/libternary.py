@@ -5,11 +5,19 @@ This module provides advanced ternary arithmetic operations and functions.
 """
 
 from typing import List, Union, Tuple, Optional
+import itertools
 import math
 from ..core.trit import Trit
 from ..core.tritarray import TritArray
 
 
+# Full adder truth table: (a, b, carry_in) -> (sum, carry_out)
+_SUM_CARRY = {
+    (a, b, c): ((a + b + c + 1) % 3 - 1, (a + b + c + 1) // 3)
+    for a, b, c in itertools.product((-1, 0, 1), repeat=3)
+}
+
+
 class TernaryMath:
     """
     Ternary Mathematics - Advanced ternary arithmetic operations.
@@ -37,28 +45,14 @@ class TernaryMath:
         result = []
         carry = 0
         
-        for i in range(max_len - 1, -1, -1):
-            a_val = a_padded[i].value
-            b_val = b_padded[i].value
-            
-            # Ternary addition with carry
-            sum_val = a_val + b_val + carry
-            
-            # Handle carry
-            if sum_val > 1:
-                carry = 1
-                sum_val -= 3
-            elif sum_val < -1:
-                carry = -1
-                sum_val += 3
-            else:
-                carry = 0
-            
-            result.insert(0, Trit(sum_val))
+        # Least significant trit first, one table lookup per position
+        for a_val, b_val in zip(a_padded._trits, b_padded._trits):
+            sum_val, carry = _SUM_CARRY[a_val, b_val, carry]
+            result.append(sum_val)
         
         # Add final carry if needed
         if carry != 0:
-            result.insert(0, Trit(carry))
+            result.append(carry)
         
         return TritArray(result)
     
@@ -6,18 +6,39 @@ using mark-and-sweep algorithm optimized for ternary data structures.
 """
 
 from typing import Dict, List, Optional, Any, Union, Set
+from array import array
+from enum import IntEnum
 import time
+import numpy as np
 from ..core.ternary_memory import TernaryMemory
-from ..core.trit import Trit
 from ..core.tritarray import TritArray
 
 
+class ObjectState(IntEnum):
+    """State of an object table slot, stored as one byte per slot."""
+    FREE = 0
+    ALIVE = 1
+    MARKED = 2
+
+
+_ALIVE = bytes([ObjectState.ALIVE])
+_MARKED = bytes([ObjectState.MARKED])
+
+
 class TernaryGarbageCollector:
     """
     Garbage collector for ternary memory.
     
     Implements mark-and-sweep garbage collection optimized for
     ternary data structures and memory layout.
+    
+    Object records are stored as parallel arrays (one column per field)
+    indexed by slot. Freed slots are reused by later registrations, but
+    object IDs are never reused: each registration gets a fresh ID that
+    is mapped to its slot, so a stale ID cannot reach the object that
+    took over its slot. Each slot's ``ObjectState``
+    is kept in a bytearray, so resetting marks and finding unmarked
+    objects are single scans over raw bytes.
     """
     
     def __init__(self, memory: TernaryMemory):
@@ -30,9 +51,23 @@ class TernaryGarbageCollector:
         self.memory = memory
         self.marked_objects = set()
         self.root_objects = set()
-        self.object_map = {}
         self.object_id = 0
         
+        # Object table columns
+        self._ids = array('q')
+        self._addresses = array('q')
+        self._sizes = array('q')
+        self._types: List[Optional[str]] = []
+        self._timestamps = array('d')
+        self._states = bytearray()
+        self._free_slots: List[int] = []
+        self._slots: Dict[int, int] = {}  # Object ID -> slot
+        self._live_count = 0
+        self._live_size = 0
+        
+        # Address -> object ID, built for the duration of a mark phase
+        self._address_index: Optional[Dict[int, int]] = None
+        
         # Collection statistics
         self.stats = {
             'total_collections': 0,
@@ -48,6 +83,20 @@ class TernaryGarbageCollector:
         self.collection_threshold = 0.8  # Collect when 80% of memory is used
         self.min_collection_interval = 1.0  # Minimum time between collections
     
+    @property
+    def object_map(self) -> Dict[int, Dict[str, Any]]:
+        """Snapshot of live objects as object ID -> record."""
+        return {
+            self._ids[slot]: {
+                'address': self._addresses[slot],
+                'size': self._sizes[slot],
+                'type': self._types[slot],
+                'marked': self._states[slot] == ObjectState.MARKED,
+                'timestamp': self._timestamps[slot]
+            }
+            for slot in range(len(self._states)) if self._states[slot]
+        }
+    
     def collect(self) -> int:
         """
         Run garbage collection.
@@ -90,16 +139,30 @@ class TernaryGarbageCollector:
             Object ID for tracking
         """
         self.object_id += 1
-        self.object_map[self.object_id] = {
-            'address': address,
-            'size': size,
-            'type': obj_type,
-            'marked': False,
-            'timestamp': time.time()
-        }
-        
+        obj_id = self.object_id
+        
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._ids[slot] = obj_id
+            self._addresses[slot] = address
+            self._sizes[slot] = size
+            self._types[slot] = obj_type
+            self._timestamps[slot] = time.time()
+            self._states[slot] = ObjectState.ALIVE
+        else:
+            slot = len(self._states)
+            self._ids.append(obj_id)
+            self._addresses.append(address)
+            self._sizes.append(size)
+            self._types.append(obj_type)
+            self._timestamps.append(time.time())
+            self._states.append(ObjectState.ALIVE)
+        
+        self._slots[obj_id] = slot
+        self._live_count += 1
+        self._live_size += size
         self.stats['objects_allocated'] += 1
-        return self.object_id
+        return obj_id
     
     def unregister_object(self, obj_id: int) -> bool:
         """
@@ -111,8 +174,10 @@ class TernaryGarbageCollector:
         Returns:
             True if unregistration successful, False otherwise
         """
-        if obj_id in self.object_map:
-            del self.object_map[obj_id]
+        slot = self._slots.get(obj_id)
+        if slot is not None:
+            self.root_objects.discard(obj_id)
+            self._release(slot)
             return True
         return False
     
@@ -140,8 +205,8 @@ class TernaryGarbageCollector:
     
     def get_memory_usage(self) -> Dict[str, Any]:
         """Get current memory usage."""
-        total_objects = len(self.object_map)
-        marked_objects = sum(1 for obj in self.object_map.values() if obj['marked'])
+        total_objects = self._live_count
+        marked_objects = self._states.count(ObjectState.MARKED)
         
         return {
             'total_objects': total_objects,
@@ -151,6 +216,19 @@ class TernaryGarbageCollector:
             'memory_usage': self._calculate_memory_usage()
         }
     
+    def _is_live(self, obj_id: int) -> bool:
+        """Check if an object ID refers to a registered object."""
+        return obj_id in self._slots
+    
+    def _release(self, slot: int) -> None:
+        """Return an object's slot to the free list."""
+        del self._slots[self._ids[slot]]
+        self._live_count -= 1
+        self._live_size -= self._sizes[slot]
+        self._states[slot] = ObjectState.FREE
+        self._types[slot] = None
+        self._free_slots.append(slot)
+    
     def _should_collect(self) -> bool:
         """Check if garbage collection should run."""
         # Check memory usage threshold
@@ -168,64 +246,87 @@ class TernaryGarbageCollector:
     
     def _calculate_memory_usage(self) -> float:
         """Calculate current memory usage."""
-        if not self.object_map:
+        if not self._live_count:
             return 0.0
         
-        total_size = sum(obj['size'] for obj in self.object_map.values())
         max_memory = self.memory.size
-        return total_size / max_memory if max_memory > 0 else 0.0
+        return self._live_size / max_memory if max_memory > 0 else 0.0
     
     def _mark_phase(self) -> None:
         """Mark phase of garbage collection."""
         # Clear previous marks
         self.marked_objects.clear()
+        self._states = self._states.replace(_MARKED, _ALIVE)
         
-        # Mark all objects as unmarked
-        for obj_id, obj in self.object_map.items():
-            obj['marked'] = False
+        # Index live objects by address once, so resolving each scanned
+        # reference is a dict lookup rather than a scan of the table
+        self._address_index = self._build_address_index()
         
         # Mark root objects
-        for obj_id in self.root_objects:
-            if obj_id in self.object_map:
-                self._mark_object(obj_id)
+        try:
+            for obj_id in self.root_objects:
+                if self._is_live(obj_id):
+                    self._mark_object(obj_id)
+        finally:
+            self._address_index = None
+    
+    def _build_address_index(self) -> Dict[int, int]:
+        """
+        Map the address of every live object to its object ID.
+        
+        The state and address columns are read in place as NumPy arrays,
+        so finding the live slots and gathering their addresses are
+        single vectorized passes over the table.
+        
+        Returns:
+            Address -> object ID (the lowest slot if objects share an address)
+        """
+        live = np.flatnonzero(np.frombuffer(self._states, dtype=np.uint8))
+        addresses = np.frombuffer(self._addresses, dtype=np.int64)[live]
+        ids = np.frombuffer(self._ids, dtype=np.int64)[live]
+        # Later keys win in dict(), so reverse to keep the lowest slot
+        return dict(zip(addresses[::-1].tolist(), ids[::-1].tolist()))
     
     def _mark_object(self, obj_id: int) -> None:
         """
         Mark an object and all objects it references.
         
+        Uses an explicit work stack, so long reference chains neither
+        recurse nor hit the interpreter's recursion limit.
+        
         Args:
             obj_id: Object ID to mark
         """
-        if obj_id in self.marked_objects:
-            return
-        
-        if obj_id not in self.object_map:
-            return
-        
-        # Mark this object
-        self.marked_objects.add(obj_id)
-        self.object_map[obj_id]['marked'] = True
-        
-        # Find and mark referenced objects
-        obj = self.object_map[obj_id]
-        referenced_objects = self._find_referenced_objects(obj)
-        
-        for ref_obj_id in referenced_objects:
-            self._mark_object(ref_obj_id)
+        states = self._states
+        slots = self._slots
+        stack = [obj_id]
+        while stack:
+            obj_id = stack.pop()
+            slot = slots.get(obj_id)
+            if slot is None or states[slot] != ObjectState.ALIVE:
+                continue
+            
+            # Mark this object
+            self.marked_objects.add(obj_id)
+            states[slot] = ObjectState.MARKED
+            
+            # Queue referenced objects
+            stack.extend(self._find_referenced_objects(obj_id))
     
-    def _find_referenced_objects(self, obj: Dict[str, Any]) -> List[int]:
+    def _find_referenced_objects(self, obj_id: int) -> List[int]:
         """
         Find objects referenced by the given object.
         
         Args:
-            obj: Object to analyze
+            obj_id: Object ID to analyze
             
         Returns:
             List of referenced object IDs
         """
         referenced = []
-        address = obj['address']
-        size = obj['size']
+        slot = self._slots[obj_id]
+        address = self._addresses[slot]
+        size = self._sizes[slot]
         
         # Scan the object's memory for references
         for offset in range(0, size, 3):  # Check every 3 trits (address size)
@@ -253,47 +354,44 @@ class TernaryGarbageCollector:
     
     def _find_object_at_address(self, address: int) -> Optional[int]:
         """Find object ID at the given address."""
-        for obj_id, obj in self.object_map.items():
-            if obj['address'] == address:
-                return obj_id
-        return None
+        if self._address_index is not None:
+            return self._address_index.get(address)
+        
+        slot = -1
+        try:
+            while True:
+                slot = self._addresses.index(address, slot + 1)
+                if self._states[slot]:
+                    return self._ids[slot]
+        except ValueError:
+            return None
     
     def _sweep_phase(self) -> int:
         """Sweep phase of garbage collection."""
         collected = 0
         
-        # Find unmarked objects
-        unmarked_objects = []
-        for obj_id, obj in self.object_map.items():
-            if not obj['marked']:
-                unmarked_objects.append(obj_id)
-        
-        # Collect unmarked objects
-        for obj_id in unmarked_objects:
-            obj = self.object_map[obj_id]
-            
+        # Collect live, unmarked objects
+        states = self._states
+        slot = states.find(_ALIVE)
+        while slot != -1:
             # Clear the object's memory
-            self._clear_object_memory(obj)
+            self._clear_object_memory(slot)
             
-            # Remove from object map
-            del self.object_map[obj_id]
+            self.stats['memory_freed'] += self._sizes[slot]
             
             # Remove from root objects if present
-            self.root_objects.discard(obj_id)
+            self.root_objects.discard(self._ids[slot])
             
+            self._release(slot)
             collected += 1
-            self.stats['memory_freed'] += obj['size']
+            slot = states.find(_ALIVE, slot + 1)
         
         return collected
     
-    def _clear_object_memory(self, obj: Dict[str, Any]) -> None:
-        """Clear memory occupied by an object."""
-        address = obj['address']
-        size = obj['size']
-        
+    def _clear_object_memory(self, slot: int) -> None:
+        """Clear memory occupied by the object in a slot."""
         # Clear memory by setting all trits to 0
-        for i in range(size):
-            self.memory.store_trit(address + i, Trit(0))
+        self.memory.clear_range(self._addresses[slot], self._sizes[slot])
     
     def force_collection(self) -> int:
         """Force garbage collection regardless of thresholds."""
@@ -331,10 +429,10 @@ class TernaryGarbageCollector:
     
     def __str__(self) -> str:
         """String representation."""
-        return f"TernaryGarbageCollector(objects={len(self.object_map)}, collections={self.stats['total_collections']})"
+        return f"TernaryGarbageCollector(objects={self._live_count}, collections={self.stats['total_collections']})"
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return (f"TernaryGarbageCollector(objects={len(self.object_map)}, "
+        return (f"TernaryGarbageCollector(objects={self._live_count}, "
                 f"collections={self.stats['total_collections']}, "
                 f"collected={self.stats['total_collected']})")
@@ -0,0 +1,216 @@
+"""
+TEROS Ternary Kernels
+
+This module provides kernels for balanced ternary arithmetic on trit
+arrays (least significant trit first), used by the ALU in place of its
+per-trit loops. Products of very small operands are a table lookup.
+The loops are compiled with Numba when it is installed; without it,
+whole-array NumPy passes are used instead.
+"""
+
+import numpy as np
+from ..core.tritarray import TritArray, _balanced_digits
+
+
+# The ALU adds operands of at least this many trits with add_trits; below
+# it the conversion to and from arrays costs more than it saves
+KERNEL_MIN_TRITS = 32
+
+# Operands of up to this many trits (|n| <= 40) are multiplied by table lookup
+SMALL_OPERAND_TRITS = 4
+
+
+def _add_kernel(a, b, out):
+    """
+    Add trit arrays a and b into out (length >= max(len) + 1).
+    Returns the number of trits written.
+    """
+    n = max(a.shape[0], b.shape[0])
+    carry = 0
+    for i in range(n):
+        total = carry
+        if i < a.shape[0]:
+            total += a[i]
+        if i < b.shape[0]:
+            total += b[i]
+        # total is in -3..3; shift by 4 so the division is non-negative
+        carry = (total + 4) // 3 - 1
+        out[i] = total - 3 * carry
+    if carry != 0:
+        out[n] = carry
+        return n + 1
+    return n
+
+
+def _mul_kernel(a, b, acc, out):
+    """
+    Multiply trit arrays a and b into out (length len(a) + len(b)),
+    using acc (int64, same length) for the unnormalized digit sums.
+    """
+    acc[:] = 0
+    for i in range(a.shape[0]):
+        if a[i] != 0:
+            for j in range(b.shape[0]):
+                acc[i + j] += a[i] * b[j]
+    
+    # Single carry sweep back into balanced digits
+    carry = 0
+    for k in range(acc.shape[0]):
+        total = acc[k] + carry
+        digit = (total + 1) % 3 - 1
+        carry = (total - digit) // 3
+        out[k] = digit
+
+
+# Whether the kernels above are Numba-compiled; None until first tried
+_NUMBA = None
+
+
+def _load_kernels() -> bool:
+    """
+    Compile the kernels with Numba on first use.
+    
+    Numba is optional and slow to import, so it is only imported when a
+    kernel is first needed. Compiled code is not cached on disk: the cache
+    records the importing module's name, and this package is imported as
+    both teros and lib.teros.
+    
+    Returns:
+        True if the kernels are compiled
+    """
+    global _NUMBA, _add_kernel, _mul_kernel
+    if _NUMBA is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _NUMBA = False
+        else:
+            _add_kernel = njit(_add_kernel)
+            _mul_kernel = njit(_mul_kernel)
+            _NUMBA = True
+    return _NUMBA
+
+
+def _normalize_signed_digits(digits: np.ndarray) -> None:
+    """
+    Turn digit sums into balanced trits in place, keeping the value.
+    
+    Each pass splits every digit into 3 * transfer + remainder, with the
+    remainder in -1..1, and adds each transfer to the next digit up. The
+    passes need no carry loop; they repeat until every digit is a trit,
+    which is usually a handful of passes, although a run of equal trits
+    can still ripple one position per pass. The top digit must have room
+    for the result (it never transfers).
+    """
+    while True:
+        transfer = (digits + 1) // 3
+        if not transfer.any():
+            break
+        digits -= 3 * transfer
+        digits[1:] += transfer[:-1]
+
+
+def _to_array(a: TritArray, dtype=np.int8) -> np.ndarray:
+    """Trits of a TritArray as an array."""
+    return np.array(a._trits, dtype=dtype)
+
+
+def add_trits(a: TritArray, b: TritArray) -> TritArray:
+    """
+    Ternary addition with carry.
+    
+    Args:
+        a: First operand
+        b: Second operand
+        
+    Returns:
+        Sum as TritArray, max(len(a), len(b)) trits plus one for a final
+        carry (the same trits as TernaryALU.add)
+    """
+    n = max(len(a), len(b))
+    if _load_kernels():
+        out = np.empty(n + 1, dtype=np.int8)
+        count = _add_kernel(_to_array(a), _to_array(b), out)
+        return TritArray._wrap(out[:count].tolist())
+    
+    # The digit sums are in -2..2 and always fit in n + 1 trits
+    digits = np.zeros(n + 1, dtype=np.int8)
+    digits[:len(a)] += _to_array(a)
+    digits[:len(b)] += _to_array(b)
+    _normalize_signed_digits(digits)
+    count = n + 1 if digits[n] != 0 else n
+    return TritArray._wrap(digits[:count].tolist())
+
+
+# Built on the first small multiplication: _SMALL_OPERANDS maps trit tuples
+# of up to SMALL_OPERAND_TRITS trits to (value, index of the most significant
+# nonzero trit or -1), _SMALL_PRODUCTS maps value pairs to product digits
+_SMALL_OPERANDS = None
+_SMALL_PRODUCTS = None
+
+
+def _small_tables():
+    """Build the small-operand tables (81 x 81 products) once."""
+    global _SMALL_OPERANDS, _SMALL_PRODUCTS
+    if _SMALL_PRODUCTS is None:
+        import itertools
+        _SMALL_OPERANDS = {
+            trits: (
+                sum(trit * 3 ** i for i, trit in enumerate(trits)),
+                max((i for i, trit in enumerate(trits) if trit), default=-1),
+            )
+            for length in range(1, SMALL_OPERAND_TRITS + 1)
+            for trits in itertools.product((-1, 0, 1), repeat=length)
+        }
+        # The uncached digit function keeps the 6561 products out of
+        # TritArray's digit cache
+        limit = (3 ** SMALL_OPERAND_TRITS - 1) // 2
+        _SMALL_PRODUCTS = {
+            (x, y): _balanced_digits.__wrapped__(x * y)
+            for x in range(-limit, limit + 1)
+            for y in range(-limit, limit + 1)
+        }
+    return _SMALL_OPERANDS, _SMALL_PRODUCTS
+
+
+def mul_trits(a: TritArray, b: TritArray) -> TritArray:
+    """
+    Ternary multiplication.
+    
+    Args:
+        a: First operand
+        b: Second operand
+        
+    Returns:
+        Product as TritArray, as wide as the widest nonzero partial
+        product (the same trits as TernaryALU.mul)
+    """
+    if len(a) <= SMALL_OPERAND_TRITS and len(b) <= SMALL_OPERAND_TRITS:
+        operands, products = _small_tables()
+        value_a, _ = operands[tuple(a._trits)]
+        value_b, top_b = operands[tuple(b._trits)]
+        digits = products[value_a, value_b]
+        width = len(a) + top_b if top_b >= 0 else 1
+        return TritArray._wrap(list(digits) + [0] * (width - len(digits)))
+    
+    if _load_kernels():
+        a_np = _to_array(a)
+        b_np = _to_array(b)
+        acc = np.empty(len(a_np) + len(b_np), dtype=np.int64)
+        out = np.empty(len(acc), dtype=np.int8)
+        _mul_kernel(a_np, b_np, acc, out)
+    else:
+        # Convolving the trits gives the digit sums of the product; leave
+        # room above them for the transfers out of sums up to min(len)
+        sums = np.convolve(_to_array(a, np.int64), _to_array(b, np.int64))
+        headroom = len(np.base_repr(min(len(a), len(b)), 3)) + 1
+        out = np.zeros(len(sums) + headroom, dtype=np.int64)
+        out[:len(sums)] = sums
+        _normalize_signed_digits(out)
+    
+    # Keep the width of the widest partial product, as TritArray does
+    nonzero_b = np.flatnonzero(b._trits)
+    width = len(a) + int(nonzero_b[-1]) if len(nonzero_b) else 1
+    nonzero = np.flatnonzero(out)
+    used = int(nonzero[-1]) + 1 if len(nonzero) else 0
+    return TritArray._wrap(out[:max(width, used)].tolist())
@@ -3,8 +3,10 @@ Lambda Calculus Commands for TESH
 Extends TESH with lambda calculus support
 """
 
+import re
 import sys
 import os
+from functools import lru_cache
 
 # Add paths for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'Lambda3_Project'))
@@ -62,6 +64,52 @@ LAMBDA_LIBRARY = {
     ':cdr': r'\p.p (\h.\t.t)',
 }
 
+@lru_cache(maxsize=None)
+def _library_ast(key: str):
+    """
+    Parse a library term on its first use; later bare references to it
+    reuse the AST. A definition that fails to parse raises when it is
+    used, not when the module is imported
+    """
+    return parse(LAMBDA_LIBRARY[key])
+
+# Single-pass matcher for library references (longest names first so that
+# e.g. ':succ' is never split into a shorter key)
+_LIBRARY_REF = re.compile('|'.join(
+    re.escape(key) for key in sorted(LAMBDA_LIBRARY, key=len, reverse=True)
+))
+
+
+def expand_library_refs(text: str) -> str:
+    """Replace every library reference in text with its definition"""
+    return _LIBRARY_REF.sub(lambda m: LAMBDA_LIBRARY[m.group(0)], text)
+
+
+def _library_listing() -> str:
+    """Format the predefined library, grouped by category"""
+    result_lines = ["Lambda Library:", "=" * 60]
+    
+    # Group by category
+    categories = {
+        'Numbers': [':0', ':1', ':2', ':3', ':4', ':5'],
+        'Booleans': [':true', ':false', ':not', ':and', ':or'],
+        'Combinators': [':I', ':K', ':S', ':Y'],
+        'Arithmetic': [':succ', ':add', ':mult', ':pred'],
+        'Lists': [':cons', ':nil', ':car', ':cdr'],
+    }
+    
+    for category, keys in categories.items():
+        result_lines.append(f"\n{category}:")
+        for key in keys:
+            if key in LAMBDA_LIBRARY:
+                result_lines.append(f"  {key:8s} = {LAMBDA_LIBRARY[key]}")
+    
+    return "\n".join(result_lines)
+
+
+# The library is fixed, so its listing is formatted once for every :library
+LIBRARY_LISTING = _library_listing()
+
 
 # ============================================================================
 # LAMBDA COMMANDS
@@ -105,9 +153,10 @@ class LambdaCommands:
         cmd = parts[0]
         arg = parts[1] if len(parts) > 1 else ""
         
-        # Expand library references in arg
-        for key, value in LAMBDA_LIBRARY.items():
-            arg = arg.replace(key, value)
+        # Expand library references in arg (bare references resolve to
+        # their pre-parsed term)
+        if arg not in LAMBDA_LIBRARY:
+            arg = expand_library_refs(arg)
         
         # Handle commands
         if cmd == ':lambda':
@@ -132,6 +181,13 @@ class LambdaCommands:
             # Direct lambda term evaluation
             return self.cmd_lambda(command_line)
     
+    def resolve(self, term_str: str):
+        """Parse a term, reusing parsed library terms for bare references"""
+        key = term_str.strip()
+        if key in LAMBDA_LIBRARY:
+            return _library_ast(key)
+        return parse(term_str)
+    
     def cmd_lambda(self, term_str: str) -> str:
         """Evaluate a lambda term"""
         if not parse:
@@ -139,7 +195,7 @@ class LambdaCommands:
         
         try:
             # Parse
-            term = parse(term_str)
+            term = self.resolve(term_str)
             result_lines = [f"Term: {term}"]
             
             # Type inference
@@ -171,7 +227,7 @@ class LambdaCommands:
             return "Error: Lambda3 not available"
         
         try:
-            term = parse(term_str)
+            term = self.resolve(term_str)
             result_lines = [f"Reducing: {term}", "-" * 60]
             
             # For now, just show final result
@@ -190,7 +246,7 @@ class LambdaCommands:
             return "Error: Lambda3 not available"
         
         try:
-            term = parse(term_str)
+            term = self.resolve(term_str)
             type_ = infer_type(term)
             return f"{term} : {type_}"
         
@@ -203,7 +259,7 @@ class LambdaCommands:
             return "Error: Lambda3 not available"
         
         try:
-            term = parse(term_str)
+            term = self.resolve(term_str)
             trits = encode(term)
             eff = encoding_efficiency(term)
             
@@ -223,24 +279,7 @@ class LambdaCommands:
     
     def cmd_library(self) -> str:
         """Show predefined library"""
-        result_lines = ["Lambda Library:", "=" * 60]
-        
-        # Group by category
-        categories = {
-            'Numbers': [':0', ':1', ':2', ':3', ':4', ':5'],
-            'Booleans': [':true', ':false', ':not', ':and', ':or'],
-            'Combinators': [':I', ':K', ':S', ':Y'],
-            'Arithmetic': [':succ', ':add', ':mult', ':pred'],
-            'Lists': [':cons', ':nil', ':car', ':cdr'],
-        }
-        
-        for category, keys in categories.items():
-            result_lines.append(f"\n{category}:")
-            for key in keys:
-                if key in LAMBDA_LIBRARY:
-                    result_lines.append(f"  {key:8s} = {LAMBDA_LIBRARY[key]}")
-        
-        return "\n".join(result_lines)
+        return LIBRARY_LISTING
 
 
 # ============================================================================
@@ -257,7 +296,7 @@ if __name__ == '__main__':
         ':library',
         ':I',
         r'(\x.x) y',
-        ':type \x.x',
+        r':type \x.x',
         ':encode :I',
         ':0',
         ':true',
@@ -15,6 +15,15 @@ from ..core.tritarray import TritArray
 from ..hal.driver_framework import ConsoleDriver
 
 
+# Startup banner, folded into one constant and written in one call
+BANNER = (
+    "=== TESH (Ternary Shell) ===\n"
+    "Welcome to the Ternary Operating System Shell\n"
+    "Type 'help' for available commands, 'exit' to quit\n"
+    "\n"
+)
+
+
 class CommandType(Enum):
     """Command types."""
     BUILTIN = "builtin"
@@ -212,10 +221,8 @@ class TESHShell:
         self.running = True
         self.stats['session_start_time'] = time.time()
         
-        print("=== TESH (Ternary Shell) ===")
-        print("Welcome to the Ternary Operating System Shell")
-        print("Type 'help' for available commands, 'exit' to quit")
-        print()
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
         
         try:
             while self.running and not self.exit_requested:
@@ -9,6 +9,15 @@ from typing import Union, Optional
 import numpy as np
 from ..core.trit import Trit
 from ..core.tritarray import TritArray
+from ..optimization.ternary_kernels import KERNEL_MIN_TRITS, add_trits, mul_trits
+
+
+# Half adder truth table: (a, b) -> (sum, carry)
+_HALF_ADD = {
+    (-1, -1): (1, -1), (-1, 0): (-1, 0), (-1, 1): (0, 0),
+    (0, -1): (-1, 0), (0, 0): (0, 0), (0, 1): (1, 0),
+    (1, -1): (0, 0), (1, 0): (1, 0), (1, 1): (-1, 1),
+}
 
 
 class TernaryALU:
@@ -374,6 +383,9 @@ class TernaryALU:
     def _ternary_add(self, a: TritArray, b: TritArray) -> TritArray:
         """Internal ternary addition with carry."""
         max_len = max(len(a), len(b))
+        if max_len >= KERNEL_MIN_TRITS:
+            return add_trits(a, b)
+        
         result = []
         carry = 0
         
@@ -381,18 +393,11 @@ class TernaryALU:
             a_val = a._trits[i] if i < len(a) else 0
             b_val = b._trits[i] if i < len(b) else 0
             
-            # Use lookup table for addition
-            sum_val = self._add_table[a_val + 1, b_val + 1, 0] + carry
-            
-            if sum_val > 1:
-                result.append(sum_val - 3)
-                carry = 1
-            elif sum_val < -1:
-                result.append(sum_val + 3)
-                carry = -1
-            else:
-                result.append(sum_val)
-                carry = 0
+            # Two half adders; at most one of the carries is non-zero
+            sum_val, carry_ab = _HALF_ADD[a_val, b_val]
+            sum_val, carry_in = _HALF_ADD[sum_val, carry]
+            result.append(sum_val)
+            carry = carry_ab + carry_in
         
         if carry != 0:
             result.append(carry)
@@ -404,17 +409,13 @@ class TernaryALU:
         return self._ternary_add(a, self.neg(b))
     
     def _ternary_mul(self, a: TritArray, b: TritArray) -> TritArray:
-        """Internal ternary multiplication."""
-        result = TritArray(0)
-        
-        for i, trit in enumerate(b._trits):
-            if trit != 0:
-                partial = self._shift_left(a, i)
-                if trit == -1:
-                    partial = self.neg(partial)
-                result = self._ternary_add(result, partial)
+        """
+        Internal ternary multiplication.
         
-        return result
+        Tiny operands are a table lookup and longer ones one kernel call,
+        instead of a shifted partial-product addition per trit of b.
+        """
+        return mul_trits(a, b)
     
     def _ternary_and(self, a: TritArray, b: TritArray) -> TritArray:
         """Internal ternary AND operation."""
@@ -8,6 +8,7 @@ with debugging, profiling, and interactive features.
 from typing import List, Optional, Dict, Any, Callable, Union
 import time
 import json
+import numpy as np
 from ..core.t3_instruction import T3_Instruction
 from .tvm import TVM
 
@@ -263,8 +264,10 @@ class TVMInterpreter:
         if not self.tvm.program:
             return {'error': 'No program loaded'}
         
-        times = []
-        instruction_counts = []
+        # Per-run samples are written into preallocated columns and
+        # summarised with array reductions once the runs are done
+        times = np.empty(iterations, dtype=np.float64)
+        instruction_counts = np.empty(iterations, dtype=np.int64)
         
         for i in range(iterations):
             self.reset()
@@ -273,16 +276,19 @@ class TVMInterpreter:
             self.run()
             
             end_time = time.time()
-            times.append(end_time - start_time)
-            instruction_counts.append(self.tvm.instruction_count)
+            times[i] = end_time - start_time
+            instruction_counts[i] = self.tvm.instruction_count
+        
+        total_time = float(times.sum())
+        total_instructions = int(instruction_counts.sum())
         
         return {
             'iterations': iterations,
-            'avg_time': sum(times) / len(times),
-            'min_time': min(times),
-            'max_time': max(times),
-            'avg_instructions': sum(instruction_counts) / len(instruction_counts),
-            'instructions_per_second': sum(instruction_counts) / sum(times)
+            'avg_time': total_time / iterations,
+            'min_time': float(times.min()),
+            'max_time': float(times.max()),
+            'avg_instructions': total_instructions / iterations,
+            'instructions_per_second': total_instructions / total_time
         }
     
     def save_state(self, filename: str) -> None:
@@ -5,11 +5,18 @@ Provides utilities for testing kernel components and QEMU integration.
 
 import subprocess
 import sys
+import threading
 import time
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+# QEMU executable resolved on $PATH once per process (None if missing)
+QEMU_BIN = shutil.which('qemu-system-x86_64')
+
+
 class TerosTestFramework:
     """Test framework for TEROS kernel testing."""
     
@@ -23,6 +30,10 @@ class TerosTestFramework:
         """
         Run kernel in QEMU and capture output.
         
+        The serial output is read line by line as QEMU produces it; once a
+        line contains expected_output, QEMU is stopped without waiting for
+        the timeout.
+        
         Args:
             kernel_image: Path to kernel binary
             timeout: Maximum execution time in seconds
@@ -36,10 +47,13 @@ class TerosTestFramework:
         if not kernel_path.exists():
             return False, f"Kernel image not found: {kernel_path}"
         
+        if QEMU_BIN is None:
+            return False, "QEMU not found. Please install qemu-system-x86."
+        
         try:
             # Run QEMU with serial output
             cmd = [
-                'qemu-system-x86_64',
+                QEMU_BIN,
                 '-kernel', str(kernel_path),
                 '-serial', 'stdio',
                 '-display', 'none'
@@ -50,15 +64,27 @@ class TerosTestFramework:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
+                bufsize=1,
                 cwd=str(self.project_root)
             )
             
-            # Wait for output or timeout
+            # Stream output until the expected line, QEMU exit or timeout;
+            # the watchdog kill closes the pipe and ends the loop
+            lines = []
+            watchdog = threading.Timer(timeout, process.kill)
+            watchdog.start()
             try:
-                stdout, _ = process.communicate(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                stdout, _ = process.communicate()
+                for line in process.stdout:
+                    lines.append(line)
+                    if expected_output and expected_output in line:
+                        break
+            finally:
+                watchdog.cancel()
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+                process.stdout.close()
+            stdout = ''.join(lines)
             
             # Check for expected output
             success = True
@@ -106,16 +132,45 @@ class TerosTestFramework:
         except Exception as e:
             return False, f"Error running test: {str(e)}"
     
-    def build_kernel(self) -> Tuple[bool, str]:
+    def run_unit_tests(self, test_modules: List[str],
+                       max_workers: Optional[int] = None) -> List[Tuple[str, bool, str]]:
+        """
+        Run several Python unit test modules concurrently.
+        
+        Each module runs in its own pytest subprocess, so a thread per
+        module is enough to overlap them; output is captured per module.
+        
+        Args:
+            test_modules: Module paths (e.g., 'tests.unit.test_trit')
+            max_workers: Maximum number of concurrent runs (default: CPU count)
+            
+        Returns:
+            List of (module, success, output) in the order given
+        """
+        if not test_modules:
+            return []
+        
+        workers = min(len(test_modules), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.run_unit_test, test_modules)
+            return [(module, success, output)
+                    for module, (success, output) in zip(test_modules, results)]
+    
+    def build_kernel(self, jobs: Optional[int] = None) -> Tuple[bool, str]:
         """
         Build the TEROS kernel.
         
+        Object files are independent, so make compiles them in parallel.
+        
+        Args:
+            jobs: Number of parallel make jobs (default: CPU count)
+            
         Returns:
             Tuple of (success, output)
         """
         try:
             result = subprocess.run(
-                ['make', 'all'],
+                ['make', f'-j{jobs or os.cpu_count() or 1}', 'all'],
                 capture_output=True,
                 text=True,
                 cwd=str(self.project_root)
@@ -131,16 +186,20 @@ def main():
     
     import argparse
     parser = argparse.ArgumentParser(description='TEROS Test Framework')
-    parser.add_argument('--test', help='Test module to run')
+    parser.add_argument('--test', action='append',
+                        help='Test module to run (repeat to run several concurrently)')
     parser.add_argument('--qemu', help='Run kernel in QEMU')
     parser.add_argument('--build', action='store_true', help='Build kernel')
     
     args = parser.parse_args()
     
     if args.test:
-        success, output = framework.run_unit_test(args.test)
-        print(output)
-        sys.exit(0 if success else 1)
+        results = framework.run_unit_tests(args.test)
+        for module, success, output in results:
+            if len(results) > 1:
+                print(f"=== {module}: {'PASSED' if success else 'FAILED'} ===")
+            print(output)
+        sys.exit(0 if all(success for _, success, _ in results) else 1)
     elif args.qemu:
         success, output = framework.run_in_qemu(args.qemu)
         print(output)
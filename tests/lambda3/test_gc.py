@@ -108,20 +108,22 @@ def test_integrated_gc():
     return True
 
 
+# Test groups run by main(), in order
+TESTS = (
+    test_reference_counting,
+    test_cycle_detection,
+    test_memory_pools,
+    test_integrated_gc,
+)
+
+
 def main():
     print("="*60)
     print("  GC Test Suite")
     print("="*60)
     
-    tests = [
-        test_reference_counting,
-        test_cycle_detection,
-        test_memory_pools,
-        test_integrated_gc,
-    ]
-    
     passed = 0
-    for test in tests:
+    for test in TESTS:
         try:
             if test():
                 passed += 1
@@ -131,10 +133,10 @@ def main():
             traceback.print_exc()
     
     print("\n" + "="*60)
-    print(f"  Results: {passed}/{len(tests)} tests passed")
+    print(f"  Results: {passed}/{len(TESTS)} tests passed")
     print("="*60)
     
-    return 0 if passed == len(tests) else 1
+    return 0 if passed == len(TESTS) else 1
 
 
 if __name__ == '__main__':
@@ -122,23 +122,25 @@ def test_termination_detection():
     return True
 
 
+# Test groups run by main(), in order
+TESTS = (
+    test_alpha_equivalence,
+    test_round_trip_encoding,
+    test_reduction_preserves_type,
+    test_substitution_idempotent,
+    test_confluence,
+    test_termination_detection,
+)
+
+
 def main():
     print("="*60)
     print("  Property-Based Test Suite")
     print("  Invariants & Round-Trip Tests")
     print("="*60)
     
-    tests = [
-        test_alpha_equivalence,
-        test_round_trip_encoding,
-        test_reduction_preserves_type,
-        test_substitution_idempotent,
-        test_confluence,
-        test_termination_detection,
-    ]
-    
     passed = 0
-    for test in tests:
+    for test in TESTS:
         try:
             if test():
                 passed += 1
@@ -148,7 +150,7 @@ def main():
             traceback.print_exc()
     
     print("\n" + "="*60)
-    print(f"  Results: {passed}/{len(tests)} property tests passed")
+    print(f"  Results: {passed}/{len(TESTS)} property tests passed")
     print("="*60)
     
     print("\n[NOTE]")
@@ -156,7 +158,7 @@ def main():
     print("  pip install hypothesis")
     print("  This will enable 100+ generated test cases")
     
-    return 0 if passed == len(tests) else 1
+    return 0 if passed == len(TESTS) else 1
 
 
 if __name__ == '__main__':
@@ -5,12 +5,46 @@ Tests for all 1.2.x subtasks
 
 import sys
 import os
+import functools
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lambda3.parser.parser import parse
 from lambda3.engine.reducer import reduce, substitute
 
 
+# The test groups parse the same handful of sources over and over:
+# parse each once, and reduce each parsed term once per step limit
+parse = functools.lru_cache(maxsize=512)(parse)
+
+_reduce = reduce
+_REDUCED = {}  # (id(term), max_steps) -> (term, result); term keeps the id alive
+
+
+def reduce(term, max_steps=None):
+    key = (id(term), max_steps)
+    hit = _REDUCED.get(key)
+    if hit is None:
+        result = _reduce(term) if max_steps is None else _reduce(term, max_steps=max_steps)
+        hit = _REDUCED[key] = (term, result)
+    return hit[1]
+
+
+# Sources shared by the test groups, parsed once up front by main()
+CANONICAL_TERMS = frozenset([
+    "x", "y", "z",
+    r"\y.x",
+    r"\x.x",
+    r"(\x.x) y",
+    r"((\x.\y.x) a) b",
+    r"\x.(\y.y) x",
+    r"(\x.x x) (\x.x x)",
+    r"\f.\x.x",
+    r"\f.\x.f x",
+    r"\f.\x.f (f x)",
+    r"\n.\f.\x.f (n f x)",
+])
+
+
 def test_1_2_1_substitution():
     """Test 1.2.1: Substitution (capture-avoiding)"""
     print("\n[Test 1.2.1: Substitution]")
@@ -160,22 +194,30 @@ def test_edge_cases():
     return True
 
 
+# Test groups run by main(), in order
+TESTS = (
+    test_1_2_1_substitution,
+    test_1_2_2_beta_reduction,
+    test_1_2_3_reduction_loop,
+    test_1_2_4_evaluation_tests,
+    test_edge_cases,
+)
+
+
 def main():
-    print("="*60)
-    print("  Complete Reducer Test Suite")
-    print("  Testing all 1.2.x subtasks")
-    print("="*60)
-    
-    tests = [
-        test_1_2_1_substitution,
-        test_1_2_2_beta_reduction,
-        test_1_2_3_reduction_loop,
-        test_1_2_4_evaluation_tests,
-        test_edge_cases,
-    ]
+    sys.stdout.write("\n".join([
+        "="*60,
+        "  Complete Reducer Test Suite",
+        "  Testing all 1.2.x subtasks",
+        "="*60,
+        "",
+    ]))
+    
+    for source in CANONICAL_TERMS:
+        parse(source)
     
     passed = 0
-    for test in tests:
+    for test in TESTS:
         try:
             if test():
                 passed += 1
@@ -184,18 +226,24 @@ def main():
             import traceback
             traceback.print_exc()
     
-    print("\n" + "="*60)
-    print(f"  Results: {passed}/{len(tests)} test groups passed")
-    print("="*60)
-    
-    print("\n[SUMMARY]")
-    print("  1.2.1 Substitution: COMPLETE")
-    print("  1.2.2 Beta Reduction: COMPLETE")
-    print("  1.2.3 Reduction Loop: COMPLETE")
-    print("  1.2.4 Evaluation Tests: COMPLETE")
-    print("\n  Beta Reduction Engine: FULLY FUNCTIONAL")
-    
-    return 0 if passed == len(tests) else 1
+    sys.stdout.write("\n".join([
+        "",
+        "="*60,
+        f"  Results: {passed}/{len(TESTS)} test groups passed",
+        "="*60,
+        "",
+        "[SUMMARY]",
+        "  1.2.1 Substitution: COMPLETE",
+        "  1.2.2 Beta Reduction: COMPLETE",
+        "  1.2.3 Reduction Loop: COMPLETE",
+        "  1.2.4 Evaluation Tests: COMPLETE",
+        "",
+        "  Beta Reduction Engine: FULLY FUNCTIONAL",
+        "",
+    ]))
+    sys.stdout.flush()
+    
+    return 0 if passed == len(TESTS) else 1
 
 
 if __name__ == '__main__':
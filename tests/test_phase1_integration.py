@@ -4,17 +4,19 @@ Tests for L0-L3 components as implemented in Phase 1
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 # Import TEROS components (Python reference implementations)
 from lib.teros.core.trit import Trit
 from lib.teros.core.tritarray import TritArray
 from lib.teros.isa.t3_isa import T3_ISA
 
+
+@pytest.fixture
+def root(pytestconfig):
+    """Repository root (the directory holding pytest.ini)"""
+    return pytestconfig.rootpath
+
+
 class TestPhase1Foundation:
     """Test Level 0: Foundation"""
     
@@ -120,35 +122,35 @@ class TestPhase1TVM:
 class TestPhase1Toolchain:
     """Test Level 3: Toolchain"""
     
-    def test_assembler_exists(self):
+    def test_assembler_exists(self, root):
         """Verify assembler is implemented"""
         # Check that assembler source files exist
-        assembler_c = Path(__file__).parent.parent / "src" / "kernel" / "ternary_assembler.c"
+        assembler_c = root / "src" / "kernel" / "ternary_assembler.c"
         assert assembler_c.exists()
         
-    def test_linker_exists(self):
+    def test_linker_exists(self, root):
         """Verify linker is implemented"""
-        linker_c = Path(__file__).parent.parent / "tools" / "t3_linker.c"
+        linker_c = root / "tools" / "t3_linker.c"
         assert linker_c.exists()
         
-        linker_h = Path(__file__).parent.parent / "tools" / "t3_linker.h"
+        linker_h = root / "tools" / "t3_linker.h"
         assert linker_h.exists()
         
-    def test_runtime_startup_exists(self):
+    def test_runtime_startup_exists(self, root):
         """Verify runtime startup code exists"""
-        crt0 = Path(__file__).parent.parent / "src" / "lib" / "crt0.S"
+        crt0 = root / "src" / "lib" / "crt0.S"
         assert crt0.exists()
         
-    def test_syscall_wrappers_exist(self):
+    def test_syscall_wrappers_exist(self, root):
         """Verify syscall wrappers exist"""
-        syscalls = Path(__file__).parent.parent / "src" / "lib" / "libc" / "syscalls.c"
+        syscalls = root / "src" / "lib" / "libc" / "syscalls.c"
         assert syscalls.exists()
 
 
 class TestPhase1Integration:
     """End-to-end integration tests"""
     
-    def test_complete_build_chain(self):
+    def test_complete_build_chain(self, root):
         """Test that all Phase 1 components can be built"""
         # Verify all source files exist
         components = [
@@ -164,7 +166,7 @@ class TestPhase1Integration:
         ]
         
         for component in components:
-            path = Path(__file__).parent.parent / component
+            path = root / component
             assert path.exists(), f"Missing component: {component}"
     
     def test_lambda_integration_points(self):
@@ -0,0 +1,275 @@
+"""
+Unit tests for the lambda calculus backend.
+
+Tests cover:
+- lambda_reduce against repeated lambda_reduce_step, including step limits
+- Cycle detection on self-reproducing terms
+- Packed encoding round trips through TermArena
+- Id delta and trit packing codecs
+- Compiled (Numba) and pure Python codec paths
+"""
+
+import random
+
+import pytest
+
+# Try importing Python implementation first
+try:
+    from src.lib.teros.core.trit_packing import pack_trits, unpack_trits
+    from src.lib.teros.lambda_calc import tvm_backend
+    from src.lib.teros.lambda_calc.tvm_backend import (
+        CHURCH_TRUE, COMBINATOR_I, COMBINATOR_K, COMBINATOR_S,
+        LambdaTerm, TermArena, church_numeral, lambda_parse,
+        lambda_reduce, lambda_reduce_step, pack_id_deltas, unpack_id_deltas,
+    )
+    PYTHON_AVAILABLE = True
+except ImportError:
+    PYTHON_AVAILABLE = False
+
+
+OMEGA = r"(\x.x x) (\x.x x)"
+
+TERMS = [
+    r"x",
+    r"\x.x",
+    r"(\x.x) y",
+    r"(\x.\y.x) a b",
+    r"(\x.\x.x) a b",
+    r"(\x.\y.\z.x z (y z)) (\x.\y.x) (\x.\y.x) c",
+    r"(\f.\x.f (f x)) (\f.\x.f (f x)) g z",
+    r"\a.(\x.x x) (\y.y) a",
+    r"(\x.\y.y x) ((\z.z) w)",
+    r"(\x.x x x) (\y.y)",
+    r"(\x.y) ((\x.x x) (\x.x x))",
+    OMEGA,
+    r"(\x.x x) (\x.x x) y",
+    r"(\x.x x x) (\x.x x x)",
+    r"\z.(\x.x x) (\x.x x) z",
+]
+
+STEP_LIMITS = [0, 1, 2, 3, 4, 5, 7, 10, 50]
+
+
+def reduce_by_steps(term, max_steps):
+    """Reference reducer: lambda_reduce_step until normal or out of steps."""
+    for _ in range(max_steps):
+        term, changed = lambda_reduce_step(term)
+        if not changed:
+            break
+    return term
+
+
+def random_term(rng, depth):
+    """Random term over a few variable ids, with plenty of redexes."""
+    if depth == 0 or rng.random() < 0.2:
+        return LambdaTerm.var(rng.randrange(3))
+    if rng.random() < 0.4:
+        return LambdaTerm.abs(rng.randrange(3), random_term(rng, depth - 1))
+    return LambdaTerm.app(random_term(rng, depth - 1), random_term(rng, depth - 1))
+
+
+@pytest.fixture(params=["numba", "python"])
+def backend(request, monkeypatch):
+    """The backend module, with its codecs on the compiled or Python path."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        assert tvm_backend._load_kernels()
+    else:
+        monkeypatch.setattr(tvm_backend, "_NUMBA", False)
+    return tvm_backend
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python tvm_backend implementation not available")
+class TestReduction:
+    """Test lambda_reduce against single-step reduction."""
+    
+    @pytest.mark.parametrize("source", TERMS)
+    @pytest.mark.parametrize("max_steps", STEP_LIMITS)
+    def test_matches_single_steps(self, source, max_steps):
+        """Test lambda_reduce stops where max_steps single steps stop."""
+        term = lambda_parse(source)
+        assert term is not None
+        assert lambda_reduce(term, max_steps) is reduce_by_steps(term, max_steps)
+    
+    def test_random_terms_match_single_steps(self):
+        """Test lambda_reduce against single steps on random terms."""
+        rng = random.Random(12)
+        for _ in range(300):
+            term = random_term(rng, 6)
+            max_steps = rng.randrange(30)
+            assert lambda_reduce(term, max_steps) is reduce_by_steps(term, max_steps)
+    
+    def test_combinators(self):
+        """Test S K K behaves as the identity."""
+        skk = LambdaTerm.app(LambdaTerm.app(COMBINATOR_S, COMBINATOR_K), COMBINATOR_K)
+        x = LambdaTerm.var(7)
+        assert lambda_reduce(LambdaTerm.app(skk, x)) is x
+        assert lambda_reduce(LambdaTerm.app(COMBINATOR_I, x)) is x
+    
+    def test_church_arithmetic(self):
+        """Test 2 + 3 reduces to the Church numeral 5."""
+        plus = lambda_parse(r"\m.\n.\x0.\x1.m x0 (n x0 x1)")
+        term = LambdaTerm.app(LambdaTerm.app(plus, church_numeral(2)), church_numeral(3))
+        assert lambda_reduce(term) is church_numeral(5)
+    
+    def test_normal_form_unchanged(self):
+        """Test a normal form is its own reduct."""
+        assert lambda_reduce(CHURCH_TRUE) is CHURCH_TRUE
+        assert lambda_reduce_step(CHURCH_TRUE) == (CHURCH_TRUE, False)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python tvm_backend implementation not available")
+class TestCycleDetection:
+    """Test reduction of terms that reduce to themselves."""
+    
+    def test_omega_is_a_fixed_point(self):
+        """Test Ω steps to itself."""
+        omega = lambda_parse(OMEGA)
+        assert lambda_reduce_step(omega) == (omega, True)
+        assert lambda_reduce(omega) is omega
+    
+    @pytest.mark.parametrize("source", [
+        OMEGA,
+        r"(\x.x x) (\x.x x) y",
+        r"\z.(\x.x x) (\x.x x) z",
+        r"(\x.y) ((\x.x x) (\x.x x))",
+    ])
+    @pytest.mark.parametrize("max_steps", [10 ** 6, 10 ** 9])
+    def test_large_step_limits(self, source, max_steps):
+        """Test cycling terms return at once under huge step limits."""
+        term = lambda_parse(source)
+        assert lambda_reduce(term, max_steps) is reduce_by_steps(term, 20)
+    
+    def test_growing_term_not_a_cycle(self):
+        """Test a term that grows on every step is reduced step by step."""
+        # Each step applies Ω3 once more, so no redex repeats
+        term = lambda_parse(r"(\x.x x x) (\x.x x x)")
+        for max_steps in (1, 2, 3, 40):
+            reduced = lambda_reduce(term, max_steps)
+            assert reduced is reduce_by_steps(term, max_steps)
+            assert reduced is not term
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python tvm_backend implementation not available")
+class TestPackedEncoding:
+    """Test TermArena packed encoding round trips."""
+    
+    @pytest.mark.parametrize("source", TERMS)
+    def test_round_trip(self, backend, source):
+        """Test encode_packed then add_packed rebuilds the term."""
+        term = lambda_parse(source)
+        arena = backend.TermArena()
+        tags, ids = arena.encode_packed(arena.add_term(term))
+        assert arena.to_term(arena.add_packed(tags, ids)) is term
+    
+    def test_random_round_trips(self, backend):
+        """Test round trips of random terms through one shared arena."""
+        rng = random.Random(3)
+        arena = backend.TermArena()
+        for _ in range(200):
+            term = random_term(rng, 8)
+            tags, ids = arena.encode_packed(arena.add_term(term))
+            assert arena.to_term(arena.add_packed(tags, ids)) is term
+    
+    def test_negative_ids(self, backend):
+        """Test var_ids below zero survive a round trip."""
+        x, y = LambdaTerm.var(-1), LambdaTerm.var(-70000)
+        term = LambdaTerm.abs(-1, LambdaTerm.app(LambdaTerm.app(x, y), LambdaTerm.var(2 ** 31 - 1)))
+        arena = backend.TermArena()
+        tags, ids = arena.encode_packed(arena.add_term(term))
+        assert arena.to_term(arena.add_packed(tags, ids)) is term
+    
+    def test_shared_subterms(self, backend):
+        """Test a root reached twice through a shared node is encoded in full."""
+        arena = backend.TermArena()
+        x = arena.mk_var(0)
+        app = arena.mk_app(x, x)
+        root = arena.mk_app(app, app)
+        tags, ids = arena.encode_packed(root)
+        other = backend.TermArena()
+        assert other.to_term(other.add_packed(tags, ids)) is arena.to_term(root)
+    
+    def test_encoded_sizes(self, backend):
+        """Test stream lengths: 5 tags per byte, 1 byte per small id."""
+        term = church_numeral(10)
+        arena = backend.TermArena()
+        tags, ids = arena.encode_packed(arena.add_term(term))
+        assert len(tags) == (23 + 4) // 5
+        assert len(ids) == 13
+    
+    def test_truncated_ids(self, backend):
+        """Test add_packed rejects an id stream cut inside a varint."""
+        arena = backend.TermArena()
+        tags, _ = arena.encode_packed(arena.add_term(LambdaTerm.var(1000)))
+        with pytest.raises(ValueError):
+            arena.add_packed(tags, b"\x80")
+    
+    def test_paths_agree(self, monkeypatch):
+        """Test the compiled and Python paths write the same bytes."""
+        pytest.importorskip("numba")
+        rng = random.Random(5)
+        terms = [random_term(rng, 8) for _ in range(50)]
+        
+        def encode_all():
+            arena = TermArena()
+            return [arena.encode_packed(arena.add_term(term)) for term in terms]
+        
+        assert tvm_backend._load_kernels()
+        compiled = encode_all()
+        monkeypatch.setattr(tvm_backend, "_NUMBA", False)
+        assert encode_all() == compiled
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python tvm_backend implementation not available")
+class TestCodecs:
+    """Test the id delta and trit packing codecs."""
+    
+    @pytest.mark.parametrize("ids", [
+        [],
+        [0],
+        [5, 5, 5, 5],
+        [-1, 1, -1, 1],
+        [0, 63, 64, -64, -65],
+        [2 ** 31 - 1, -2 ** 31, 0],
+        list(range(-300, 300, 7)),
+    ])
+    def test_id_delta_round_trip(self, ids):
+        """Test unpack_id_deltas inverts pack_id_deltas."""
+        assert list(unpack_id_deltas(pack_id_deltas(ids))) == ids
+    
+    def test_id_delta_sizes(self):
+        """Test small deltas take one byte each."""
+        assert len(pack_id_deltas([3, 3, 2, 4, -60])) == 5
+        assert pack_id_deltas([-1]) == b"\x01"
+        assert pack_id_deltas([64]) == b"\x80\x01"
+    
+    def test_truncated_id_stream(self):
+        """Test unpack_id_deltas rejects a trailing continuation byte."""
+        with pytest.raises(ValueError):
+            unpack_id_deltas(pack_id_deltas([1, 2]) + b"\xff")
+    
+    @pytest.mark.parametrize("count", [0, 1, 4, 5, 6, 10, 23])
+    def test_trit_round_trip(self, count):
+        """Test unpack_trits inverts pack_trits up to the padding."""
+        rng = random.Random(count)
+        trits = [rng.choice((-1, 0, 1)) for _ in range(count)]
+        packed = pack_trits(trits)
+        assert len(packed) == (count + 4) // 5
+        unpacked = unpack_trits(packed)
+        assert unpacked[:count] == trits
+        assert unpacked[count:] == [0] * (len(unpacked) - count)
+    
+    @pytest.mark.parametrize("data", [b"\xf3", b"\x00\xff", b"\xf2\xf4"])
+    def test_invalid_trit_byte(self, data):
+        """Test unpack_trits rejects bytes above 3^5 - 1."""
+        with pytest.raises(ValueError):
+            unpack_trits(data)
+    
+    def test_largest_trit_byte(self):
+        """Test 242 is the group of five 1 trits."""
+        assert unpack_trits(bytes([242])) == [1, 1, 1, 1, 1]
+        assert pack_trits([1] * 5) == bytes([242])
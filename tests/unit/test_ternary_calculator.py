@@ -0,0 +1,129 @@
+"""
+Unit tests for the ternary calculator.
+
+Tests cover:
+- Operator precedence and associativity
+- Unary minus and parentheses
+- Literals and named constants
+- Error reporting
+- Result independence across cached calculations
+"""
+
+import pytest
+
+# Try importing Python implementation first
+try:
+    from src.lib.teros.apps.ternary_calculator import TernaryCalculator
+    from src.lib.teros.core.tritarray import TritArray
+    PYTHON_AVAILABLE = True
+except ImportError:
+    PYTHON_AVAILABLE = False
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python calculator implementation not available")
+class TestCalculatorEvaluation:
+    """Test expression evaluation."""
+    
+    @pytest.mark.parametrize("expression", [
+        "1+2",
+        "10-3",
+        "10-3-2",
+        "2*3+4",
+        "2+3*4",
+        "(2+3)*4",
+        "2*(3-7)*5",
+        "((1+2)*(3+4))-5",
+        " 12 - 4 * 3 ",
+    ])
+    def test_matches_python(self, expression):
+        """Test arithmetic agrees with Python's precedence and associativity."""
+        calc = TernaryCalculator()
+        assert calc.calculate(expression).to_decimal() == eval(expression)
+    
+    def test_power_is_right_associative(self):
+        """Test 2^3^2 is 2^(3^2)."""
+        calc = TernaryCalculator()
+        assert calc.calculate("2^3^2").to_decimal() == 512
+    
+    def test_unary_minus(self):
+        """Test unary minus binds looser than ^."""
+        calc = TernaryCalculator()
+        assert calc.calculate("-5+2").to_decimal() == -3
+        assert calc.calculate("-2^2").to_decimal() == -4
+        assert calc.calculate("3*-2").to_decimal() == -6
+        assert calc.calculate("+4").to_decimal() == 4
+    
+    def test_division_keeps_quotient(self):
+        """Test division returns the floored quotient."""
+        calc = TernaryCalculator()
+        assert calc.calculate("7/2").to_decimal() == 3
+        assert calc.calculate("-7/2").to_decimal() == -4
+    
+    def test_literals_and_constants(self):
+        """Test bare numbers and named constants."""
+        calc = TernaryCalculator()
+        assert calc.calculate("5").to_decimal() == 5
+        assert calc.calculate("pi").to_decimal() == 3141
+        assert calc.calculate("pi+1").to_decimal() == 3142
+    
+    def test_repeated_subexpressions(self):
+        """Test repeated subexpressions evaluate like any other."""
+        calc = TernaryCalculator()
+        assert calc.calculate("(1+2)*(1+2)").to_decimal() == 9
+        assert calc.calculate("(2*3)-(3*2)").to_decimal() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python calculator implementation not available")
+class TestCalculatorErrors:
+    """Test error reporting."""
+    
+    @pytest.mark.parametrize("expression, message", [
+        ("1+", "Incomplete expression"),
+        ("(1+2", "Mismatched parentheses"),
+        ("1+2)", "Mismatched parentheses"),
+        ("3 4", "Unexpected '4'"),
+        ("x+1", "Invalid operand: x"),
+        ("1/0", "Division by zero"),
+    ])
+    def test_error_message(self, expression, message):
+        """Test invalid expressions return an error message."""
+        calc = TernaryCalculator()
+        assert calc.calculate(expression) == f"Error: {message}"
+        assert calc.stats['errors'] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python calculator implementation not available")
+class TestCalculatorState:
+    """Test history and cached results."""
+    
+    def test_history(self):
+        """Test each calculation is recorded."""
+        calc = TernaryCalculator()
+        calc.calculate("1+1")
+        calc.calculate("1+1")
+        history = calc.get_history()
+        assert [entry['expression'] for entry in history] == ["1+1", "1+1"]
+        assert calc.last_result.to_decimal() == 2
+        assert calc.stats['calculations'] == 2
+    
+    def test_cached_results_are_independent(self):
+        """Test mutating a result does not change later results."""
+        calc = TernaryCalculator()
+        first = calc.calculate("1+4")
+        second = calc.calculate("1+4")
+        assert first is not second
+        
+        second[0] = 0
+        assert first.to_decimal() == 5
+        assert calc.calculate("1+4").to_decimal() == 5
+    
+    def test_literal_results_are_independent(self):
+        """Test mutating a literal result does not leak into other calculators."""
+        result = TernaryCalculator().calculate("5")
+        result[0] = 0
+        assert TernaryCalculator().calculate("5").to_decimal() == 5
+        assert TernaryCalculator().calculate("5+0").to_decimal() == 5
+        assert isinstance(result, TritArray)
@@ -0,0 +1,109 @@
+"""
+Unit tests for the ternary arithmetic kernels.
+
+Tests cover:
+- Addition and multiplication against integer arithmetic
+- Result widths
+- Small-operand products
+- Compiled (Numba) and fallback paths
+- ALU arithmetic routed through the kernels
+"""
+
+import random
+
+import pytest
+
+# Try importing Python implementation first
+try:
+    from src.lib.teros.core.tritarray import TritArray
+    from src.lib.teros.optimization import ternary_kernels
+    from src.lib.teros.vm.alu import TernaryALU
+    PYTHON_AVAILABLE = True
+except ImportError:
+    PYTHON_AVAILABLE = False
+
+
+SIZES = [1, 2, 4, 5, 31, 32, 33, 100]
+
+
+def random_tritarray(rng, size):
+    """Random TritArray of the given size."""
+    return TritArray([rng.choice((-1, 0, 1)) for _ in range(size)])
+
+
+@pytest.fixture(params=["numba", "fallback"])
+def kernels(request, monkeypatch):
+    """The kernels module, on its compiled or its fallback path."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(ternary_kernels, "_NUMBA", False)
+    return ternary_kernels
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python kernel implementation not available")
+class TestKernelArithmetic:
+    """Test kernel results against integer arithmetic."""
+    
+    @pytest.mark.parametrize("size_a", SIZES)
+    @pytest.mark.parametrize("size_b", SIZES)
+    def test_add(self, kernels, size_a, size_b):
+        """Test sums and their width."""
+        rng = random.Random(size_a * 1000 + size_b)
+        for _ in range(20):
+            a = random_tritarray(rng, size_a)
+            b = random_tritarray(rng, size_b)
+            result = kernels.add_trits(a, b)
+            assert result.to_decimal() == a.to_decimal() + b.to_decimal()
+            assert len(result) in (max(size_a, size_b), max(size_a, size_b) + 1)
+    
+    @pytest.mark.parametrize("size_a", SIZES)
+    @pytest.mark.parametrize("size_b", SIZES)
+    def test_mul(self, kernels, size_a, size_b):
+        """Test products match TritArray multiplication, width included."""
+        rng = random.Random(size_a * 1000 + size_b)
+        for _ in range(20):
+            a = random_tritarray(rng, size_a)
+            b = random_tritarray(rng, size_b)
+            result = kernels.mul_trits(a, b)
+            assert result.to_decimal() == a.to_decimal() * b.to_decimal()
+            assert result == a * b
+    
+    def test_carry_ripple(self, kernels):
+        """Test a carry through a long run of equal trits."""
+        ones = TritArray([1] * 50)
+        result = kernels.add_trits(ones, TritArray([1]))
+        assert result.to_decimal() == ones.to_decimal() + 1
+        assert len(result) == 51
+    
+    def test_zero_operand(self, kernels):
+        """Test multiplying by zero gives a single zero trit."""
+        a = TritArray([1, -1, 0, 1, 1, 0])
+        assert kernels.mul_trits(a, TritArray([0, 0, 0, 0, 0])) == TritArray([0])
+    
+    def test_small_products(self):
+        """Test every small-operand product against integer arithmetic."""
+        for x in range(-40, 41):
+            for y in range(-40, 41):
+                a = TritArray.from_decimal(x, 4)
+                b = TritArray.from_decimal(y, 4)
+                assert ternary_kernels.mul_trits(a, b).to_decimal() == x * y
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not PYTHON_AVAILABLE, reason="Python kernel implementation not available")
+class TestALUArithmetic:
+    """Test ALU arithmetic against integer arithmetic."""
+    
+    @pytest.mark.parametrize("size", SIZES)
+    def test_add_sub_mul(self, kernels, size):
+        """Test add, sub and mul on short and long operands."""
+        alu = TernaryALU()
+        rng = random.Random(size)
+        for _ in range(20):
+            a = random_tritarray(rng, size)
+            b = random_tritarray(rng, rng.choice(SIZES))
+            assert alu.add(a, b).to_decimal() == a.to_decimal() + b.to_decimal()
+            assert alu.sub(a, b).to_decimal() == a.to_decimal() - b.to_decimal()
+            assert alu.mul(a, b).to_decimal() == a.to_decimal() * b.to_decimal()